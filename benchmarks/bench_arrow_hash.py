@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Inhalts-Hash einer großen Tabelle, Parquet-``sha256`` vs. ``arrow_sha256``.
+
+``sha256`` kodiert die Tabelle zuerst als Parquet (``content_bytes``);
+``arrow_sha256`` hasht die Arrow-Spaltenpuffer direkt (ohne Kopie, Spalten parallel).
+Zum Vergleich: reines ``hashlib.sha256`` über die Rohbytes (Speicherbandbreite).
+
+    python benchmarks/bench_arrow_hash.py [N]
+"""
+import hashlib
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=5000000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"c{}".format(i): rng.normal(size=n) for i in range(8)})
+    rows = (("pandas", DataFrame(name="h", df=df)),
+            ("arrow", DataFrame(name="h", df=df, storage="arrow")))
+    raw = [df[c].to_numpy() for c in df.columns]
+    t_raw = best(lambda: [hashlib.sha256(a).digest() for a in raw])
+    print("table:               {:>8.1f} MiB".format(df.memory_usage().sum() / 2 ** 20))
+    print("hashlib raw bytes:   {:>8.1f} ms".format(t_raw * 1e3))
+    for label, sdf in rows:
+        t_pq = best(lambda: sdf.sha256)
+        t_arrow = best(lambda: sdf.arrow_sha256)
+        print("{:<7s} sha256:      {:>8.1f} ms".format(label, t_pq * 1e3))
+        print("{:<7s} arrow_sha256:{:>8.1f} ms  ({:.1f}x)".format(
+            label, t_arrow * 1e3, t_pq / t_arrow))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)
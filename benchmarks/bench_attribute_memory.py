@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Speicher-Benchmark: Bytes pro Attribut einer :class:`sdata.metadata.Metadata`.
+
+Vergleicht das kompakte, geslottete :class:`~sdata.metadata.Attribute` mit einer
+``__dict__``-basierten Variante derselben Klasse (gleiche Methoden, aber ohne
+``__slots__`` und ohne String-Internierung – das Speicherlayout vor der Umstellung).
+
+    python benchmarks/bench_attribute_memory.py [N]
+"""
+import sys
+import tracemalloc
+
+import sdata.metadata
+from sdata.metadata import Attribute, Metadata
+
+
+def dict_backed(cls):
+    """Gleiche Klasse ohne ``__slots__`` (Instanzen bekommen wieder ein ``__dict__``)."""
+    namespace = {key: value for key, value in vars(cls).items()
+                 if key not in cls.__slots__ and key != "__slots__"}
+    return type(cls.__name__ + "WithDict", (object,), namespace)
+
+
+def build(attribute_cls, n):
+    """Metadata mit ``n`` typischen Attributen (wiederkehrende Einheiten/Beschreibungen)."""
+    metadata = Metadata(name="bench")
+    units = ("mm", "kN", "s", "MPa", "-")
+    for i in range(n):
+        attr = attribute_cls("channel_{:06d}".format(i), float(i), dtype="float",
+                             unit=units[i % len(units)],
+                             description="measured channel " + units[i % len(units)],
+                             label="", required=False)
+        metadata.attributes[attr.name] = attr
+    return metadata
+
+
+def bytes_per_attribute(attribute_cls, n, intern=True):
+    saved = sdata.metadata._intern
+    if not intern:
+        sdata.metadata._intern = lambda value: value
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    metadata = build(attribute_cls, n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    sdata.metadata._intern = saved
+    assert metadata.size == n
+    return (after - before) / n
+
+
+def main(n=50000):
+    legacy = bytes_per_attribute(dict_backed(Attribute), n, intern=False)
+    compact = bytes_per_attribute(Attribute, n)
+    print("attributes:            {:>10d}".format(n))
+    print("bytes/attr (__dict__): {:>10.1f}".format(legacy))
+    print("bytes/attr (__slots__):{:>10.1f}".format(compact))
+    print("reduction:             {:>9.1f}%".format(100.0 * (1 - compact / legacy)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Durchsatz-Benchmark: viele leichte Kind-Objekte erzeugen.
+
+Vergleicht den früheren Aufbau der reservierten Attribute (je Objekt neun
+``Metadata.add``-Aufrufe) mit dem Klonen der Klassen-Vorlage (``Base(...)``) und mit
+``Base.create_many`` (ein Zeitstempel und eine Parent-Auflösung je Batch).
+
+    python benchmarks/bench_base_create.py [N]
+"""
+import sys
+import timeit
+
+from sdata import __version__
+from sdata.base import Base
+from sdata.metadata import Metadata
+from sdata.suuid import SUUID
+from sdata.timestamp import now_utc_str
+
+
+def legacy(names, parent):
+    """Reservierte Metadaten wie vor der Vorlage: je Attribut ``Metadata.add``."""
+    objects = []
+    for name in names:
+        suuid = SUUID.from_name("Base", name)
+        m = Metadata(name=name)
+        for key, value, description, required in [
+                (Base.SDATA_CTIME, now_utc_str(), "UTC creation date", True),
+                (Base.SDATA_PROJECT_SNAME, "", "sname of the project", False),
+                (Base.SDATA_VERSION, __version__, "sdata package version", True),
+                (Base.SDATA_TOPOLOGY_CLASS, "sdata.sclass:IndependentContinuant",
+                 "sdata topology class name", False),
+                (Base.SDATA_NAME, name, "name of the data object", True),
+                (Base.SDATA_SNAME, suuid.sname, "sname of the data object", True),
+                (Base.SDATA_SUUID, suuid.suuid_str, "Super Universally Unique Identifier", True),
+                (Base.SDATA_CLASS, Base.get_sdata_spec(), "sdata class", True),
+                (Base.SDATA_PARENT_SNAME, parent.sname, "sname of the parent", False)]:
+            m.add(key, value, dtype="str", description=description, required=required)
+        objects.append(m)
+    return objects
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=20000):
+    parent = Base(name="parent")
+    names = ["child_{}".format(i) for i in range(n)]
+    old = best(lambda: legacy(names, parent))
+    single = best(lambda: [Base(name=name, parent=parent) for name in names])
+    many = best(lambda: Base.create_many(names, parent=parent))
+    print("objects:                 {:>10d}".format(n))
+    print("Metadata.add [obj/s]:    {:>10.0f}".format(n / old))
+    print("Base(...) [obj/s]:       {:>10.0f}  ({:.1f}x)".format(n / single, old / single))
+    print("create_many [obj/s]:     {:>10.0f}  ({:.1f}x)".format(n / many, old / many))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Lade-Benchmark: Klassen-Registry der dynamischen Factories.
+
+``Base.from_dict`` erzeugt die Zielklasse über :func:`sdata.base.sdata_factory`.
+Verglichen wird der frühere Weg (je Objekt eine neue Klasse per ``type()``) mit
+der Registry (eine Klasse je Signatur): Ladezeit und gehaltener Speicher.
+
+    python benchmarks/bench_class_cache.py [N]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from sdata.base import Base
+from sdata.metadata import Metadata
+
+
+def legacy_factory(class_name, sdata_class=Base, **kwargs):
+    """``sdata_factory`` vor der Registry: je Aufruf eine neue Klasse."""
+    cls = type(class_name, (sdata_class,), {})
+
+    def __init__(self, **init_kwargs):
+        super(cls, self).__init__(**init_kwargs)
+
+    setattr(cls, '__init__', __init__)
+    return cls(**kwargs)
+
+
+def legacy_load(dicts, factory=legacy_factory):
+    """``Base.from_dict`` mit der früheren Factory."""
+    objects = []
+    for d in dicts:
+        b = factory(Base.classname_from_classspec(d["metadata"][Base.SDATA_CLASS]["value"]))
+        b.metadata = Metadata.from_dict(d["metadata"])
+        b.data = d["data"]
+        b.description = d["description"]
+        objects.append(b)
+    return objects
+
+
+def retained(func):
+    tracemalloc.start()
+    objects = func()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current, len({type(obj) for obj in objects})
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=10000):
+    dicts = [Base(name="obj_{}".format(i)).to_dict() for i in range(n)]
+    old = best(lambda: legacy_load(dicts))
+    new = best(lambda: [Base.from_dict(d) for d in dicts])
+    old_mem, old_classes = retained(lambda: legacy_load(dicts))
+    new_mem, new_classes = retained(lambda: [Base.from_dict(d) for d in dicts])
+    print("objects:                  {:>10d}".format(n))
+    print("type() per object [obj/s]:{:>10.0f}  classes: {}".format(n / old, old_classes))
+    print("from_dict [obj/s]:        {:>10.0f}  classes: {}  ({:.1f}x)".format(
+        n / new, new_classes, old / new))
+    print("retained type() [MiB]:    {:>10.1f}".format(old_mem / 2 ** 20))
+    print("retained from_dict [MiB]: {:>10.1f}  ({:.1f}x less)".format(
+        new_mem / 2 ** 20, old_mem / new_mem))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Kompression beim Archivieren von Objekten.
+
+Vergleicht den früheren ``to_bytes_gzip`` (``to_json`` mit Einrückung, dann
+``gzip.compress`` am Stück) mit ``Base.to_compressed`` je Codec und Preset sowie die
+Speicherspitze des Streamings (``write_compressed`` in eine Datei).
+
+    python benchmarks/bench_compression.py [N]
+"""
+import gzip
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from sdata.base import Base
+from sdata.compression import CODECS
+
+
+def legacy_gzip(obj):
+    return gzip.compress(obj.to_json().encode("utf-8"))
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result / 2 ** 20
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=200000):
+    obj = Base(name="archive")
+    obj.data = {"t": [i * 0.001 for i in range(n)], "label": ["p{}".format(i % 97) for i in range(n)]}
+    path = os.path.join(tempfile.mkdtemp(), "obj.bin")
+    old = best(lambda: legacy_gzip(obj))
+    print("values:                       {:>10d}".format(2 * n))
+    print("legacy gzip:                  {:>8.1f} ms  {:>9d} B  peak {:.1f} MiB".format(
+        old * 1e3, len(legacy_gzip(obj)), peak(lambda: legacy_gzip(obj))))
+    for name in sorted(set(CODECS) - {"none"}):
+        for preset in ("fast", "default", "archive"):
+            t = best(lambda: obj.to_compressed(name, preset))
+            print("{:<8s} {:<8s}             {:>8.1f} ms  {:>9d} B  ({:.1f}x)".format(
+                name, preset, t * 1e3, len(obj.to_compressed(name, preset)), old / t))
+    print("stream gzip fast to file:     peak {:.1f} MiB".format(
+        peak(lambda: obj.write_compressed(path, "gzip", "fast"))))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
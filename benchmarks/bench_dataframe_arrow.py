@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: DataFrame-Pipeline Parquet -> Feather im pandas- und im Arrow-Modus.
+
+Liest eine sdata-Parquet-Datei (``from_parquet``), fragt ``len``/``columns`` ab und
+schreibt Feather (``to_feather``). Im Modus ``storage="arrow"`` bleibt die
+``pyarrow.Table`` der Puffer; es entsteht keine pandas-Sicht. Gemessen werden Zeit
+und die numpy-Speicherspitze (tracemalloc, Arrow-Puffer zählen nicht mit).
+
+    python benchmarks/bench_dataframe_arrow.py [N]
+"""
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result / 2 ** 20
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=2000000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"t": np.arange(n) * 1e-3, "force": rng.normal(size=n),
+                       "disp": rng.normal(size=n), "cycle": np.arange(n) // 1000})
+    sdf = DataFrame(name="tensile", df=df)
+    sdf.set_column("force", unit="kN")
+    path = tempfile.mkdtemp()
+    src = sdf.to_parquet(path=path)
+    out = os.path.join(path, "out.feather")
+
+    def pipeline(storage):
+        tt = DataFrame.from_parquet(src, storage=storage)
+        assert len(tt) == n and "force" in tt.columns
+        tt.to_feather(filename=out)
+
+    print("rows:                {:>10d}".format(n))
+    times = {}
+    for storage in ("pandas", "arrow"):
+        times[storage] = best(lambda: pipeline(storage))
+        print("{:<8s} pipeline:   {:>8.1f} ms  peak {:>6.1f} MiB".format(
+            storage, times[storage] * 1e3, peak(lambda: pipeline(storage))))
+    print("speedup:             {:>8.1f}x".format(times["pandas"] / times["arrow"]))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000000)
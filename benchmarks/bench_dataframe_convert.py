@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Aufzeichnung mit vielen Kanälen von SI nach mm/t/s umrechnen.
+
+Vergleicht die frühere spaltenweise Umrechnung (tiefe Kopie, je Spalte
+``UnitSystem.convert_value`` mit neuer Dimensionslösung und ``df[col] = ...``) mit
+``DataFrame.convert`` (Koeffizienten einmal je Einheit, ein Durchlauf je Spalte,
+neuer Frame ohne Kopie der übrigen Spalten), als Kopie und mit ``inplace=True``
+(abwechselnd hin und zurück).
+
+    python benchmarks/bench_dataframe_convert.py [N]
+"""
+import logging
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+from sdata.units import UnitSystem
+
+CHANNELS = 500
+UNITS = ("m", "N", "Pa", "kg", "J")
+
+
+def recording(n):
+    rng = np.random.default_rng(0)
+    sdf = DataFrame(name="rec", df=pd.DataFrame(
+        {"ch{}".format(i): rng.normal(size=n) for i in range(CHANNELS)}))
+    for i in range(CHANNELS):
+        sdf.column_metadata.set_attr("ch{}".format(i), unit=UNITS[i % len(UNITS)])
+    return sdf
+
+
+def legacy(sdf, system):
+    df = sdf.df.copy(deep=True)
+    for col in df.columns:
+        result = system.convert_value(df[col], sdf.column_metadata.get(col).unit)
+        if result is not None:
+            df[col] = result[0]
+    return df
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=100000):
+    logging.disable(logging.INFO)
+    sdf = recording(n)
+    nbytes = sdf.df.memory_usage().sum()
+    systems = [["kg", "m", "s"], ["t", "mm", "s"]]
+
+    def inplace():
+        systems.reverse()
+        target.convert(systems[0], inplace=True)
+
+    target = sdf.convert({})
+    rows = (("column by column", lambda: legacy(sdf, UnitSystem(["t", "mm", "s"]))),
+            ("convert (copy)", lambda: sdf.convert(["t", "mm", "s"])),
+            ("convert (inplace)", inplace))
+    print("rows x channels:    {:>10d} x {}  ({:.1f} MiB)".format(n, CHANNELS, nbytes / 2 ** 20))
+    for label, func in rows:
+        print("{:<20s} {:>8.1f} ms".format(label, best(func) * 1e3))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Parquet-Export eines großen DataFrame ohne ``df.copy()``.
+
+Vergleicht den früheren Weg (``df.copy()``, ``attrs`` setzen, ``df.to_parquet``) mit
+``DataFrame.to_parquet`` (Metadaten im Arrow-Schema, Spaltenpuffer geteilt). Die
+Speicherspitze (tracemalloc, numpy/Python-Allokationen) ist relativ zur Größe des df
+angegeben.
+
+    python benchmarks/bench_dataframe_export.py [N]
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def legacy_to_parquet(sdf, filepath):
+    df = sdf.df.copy()
+    df.attrs["_sdata"] = sdf._sdata_attrs()
+    df.to_parquet(filepath, engine="pyarrow", compression="zstd")
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=4000000):
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    sdf = DataFrame(name="export", df=pd.DataFrame(
+        {"c{}".format(i): rng.normal(size=n) for i in range(8)}))
+    nbytes = sdf.df.memory_usage(deep=True).sum()
+    path = tempfile.mkdtemp()
+    filepath = os.path.join(path, "legacy.spq")
+    rows = (("legacy copy+attrs", lambda: legacy_to_parquet(sdf, filepath)),
+            ("to_parquet(path)", lambda: sdf.to_parquet(path=path)),
+            ("to_dataframe", sdf.to_dataframe))
+    print("df size:             {:>8.1f} MiB".format(nbytes / 2 ** 20))
+    for label, func in rows:
+        print("{:<20s} {:>8.1f} ms  peak {:>5.2f}x".format(
+            label, best(func) * 1e3, peak(func) / nbytes))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4000000)
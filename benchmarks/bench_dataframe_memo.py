@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Speicherzyklus mit und ohne Serialisierungs-Memo.
+
+Ein typischer Speicherzyklus kodiert dieselbe, unveränderte Tabelle mehrfach:
+``to_dict`` (eingebettete Parquet-Bytes), ``sha256``, ``as_blob`` und
+``to_parquet(path)``. Mit ``MEMO_SERIALIZATION`` werden die Daten je Version einmal
+für ``content_bytes`` kodiert und die Datei (Default zstd) einmal; mit
+``compression=DataFrame.PARQUET_COMPRESSION`` teilt die Datei die Spaltenblöcke von
+``content_bytes``. Verglichen wird mit abgeschaltetem Memo.
+
+    python benchmarks/bench_dataframe_memo.py [N]
+"""
+import logging
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def save_cycle(sdf, path, compression="zstd"):
+    sdf.to_dict()
+    sdf.sha256
+    sdf.as_blob()
+    sdf.to_parquet(path=path, compression=compression)
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=1000000):
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    path = tempfile.mkdtemp()
+
+    def cycle(memo, compression="zstd"):
+        DataFrame.MEMO_SERIALIZATION = memo
+        sdf = DataFrame(name="memo", df=pd.DataFrame(
+            {"c{}".format(i): rng.normal(size=n) for i in range(6)}))
+        return lambda: (sdf.touch(), save_cycle(sdf, path, compression))
+
+    print("rows:               {:>10d}".format(n))
+    results = {}
+    for label, memo, compression in (("without memo", False, "zstd"),
+                                     ("with memo", True, "zstd"),
+                                     ("with memo, snappy", True, DataFrame.PARQUET_COMPRESSION)):
+        results[label] = best(cycle(memo, compression))
+        print("{:<20s} {:>8.1f} ms  ({:.1f}x)".format(
+            label, results[label] * 1e3, results["without memo"] / results[label]))
+    DataFrame.MEMO_SERIALIZATION = True
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
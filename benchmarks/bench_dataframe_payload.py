@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: DataFrame als JSON mit eingebettetem base64-Parquet vs. Payload-Referenz.
+
+Schreibt ``to_dict`` als JSON einmal eingebettet und einmal mit einem
+:class:`~sdata.payload.PayloadStore`. Gemessen werden Größe, Kodieren (``to_dict`` +
+``json.dumps``) und ein reiner Metadaten-Scan (``json.loads`` + ``from_dict`` +
+Name/Einheiten lesen) über mehrere gespeicherte Tabellen.
+
+    python benchmarks/bench_dataframe_payload.py [N]
+"""
+import json
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.payload import PayloadStore
+from sdata.sclass.dataframe import DataFrame
+
+TABLES = 20
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=200000):
+    rng = np.random.default_rng(0)
+    store = PayloadStore(tempfile.mkdtemp())
+    tables = []
+    for i in range(TABLES):
+        sdf = DataFrame(name="rec{}".format(i), df=pd.DataFrame(
+            {"t": np.arange(n) * 1e-3, "f": rng.normal(size=n), "s": rng.normal(size=n)}))
+        sdf.set_column("f", unit="kN")
+        tables.append(sdf)
+    embedded = [json.dumps(t.to_dict()) for t in tables]
+    referenced = [json.dumps(t.to_dict(store=store)) for t in tables]
+
+    def scan(docs):
+        return [(s.name, s.column_units) for s in
+                (DataFrame.from_dict(json.loads(doc), store=store) for doc in docs)]
+
+    print("tables x rows:       {:>8d} x {}".format(TABLES, n))
+    print("json size embedded:  {:>8.1f} MiB".format(sum(map(len, embedded)) / 2 ** 20))
+    print("json size ref:       {:>8.1f} KiB".format(sum(map(len, referenced)) / 2 ** 10))
+    for label, kwargs in (("embedded", {}), ("ref", {"store": store})):
+        t = best(lambda: [json.dumps(s.to_dict(**kwargs)) for s in tables])
+        print("encode {:<12s} {:>8.1f} ms".format(label, t * 1e3))
+    t_emb, t_ref = best(lambda: scan(embedded)), best(lambda: scan(referenced))
+    print("scan embedded:       {:>8.1f} ms".format(t_emb * 1e3))
+    print("scan ref:            {:>8.1f} ms  ({:.0f}x)".format(t_ref * 1e3, t_emb / t_ref))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
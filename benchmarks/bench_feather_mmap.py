@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Öffnen eines großen Feather-Archivs, gelesen vs. memory-mapped.
+
+Schreibt ein Signal-Archiv (Default lz4 bzw. unkomprimiert für Memory-Mapping) und
+misst ``from_feather`` bis zum fertigen sdata-Objekt mit Metadaten sowie den dabei
+belegten Arrow-Speicher.
+
+    python benchmarks/bench_feather_mmap.py [N]
+"""
+import logging
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def allocated(func):
+    before = pa.total_allocated_bytes()
+    result = func()
+    delta = pa.total_allocated_bytes() - before
+    del result
+    return delta / 2 ** 20
+
+
+def main(n=20000000):
+    logging.disable(logging.INFO)
+    path = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+    sdf = DataFrame(name="archive", df=pd.DataFrame(
+        {"c{}".format(i): rng.normal(size=n) for i in range(4)}))
+    sdf.set_column("c0", unit="kN")
+    packed = sdf.to_feather(filename=path + "/packed.feather")
+    mapped = sdf.to_feather(filename=path + "/mapped.feather", memory_map=True)
+    rows = (("read lz4, pandas", lambda: DataFrame.from_feather(packed)),
+            ("read lz4, arrow", lambda: DataFrame.from_feather(packed, storage="arrow")),
+            ("mmap, arrow", lambda: DataFrame.from_feather(mapped, storage="arrow",
+                                                           memory_map=True)))
+    print("archive:             {:>8.1f} MiB".format(n * 4 * 8 / 2 ** 20))
+    for label, func in rows:
+        print("{:<20s} {:>8.1f} ms  arrow {:>7.1f} MiB".format(
+            label, best(func) * 1e3, allocated(func)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000000)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Vorfahren-Ketten eines Versuchsprogramms auflösen.
+
+Ein Programm aus Projekt → Serien → Proben → Messungen liegt als JSON-Strings in
+einem Dict-"Store". Für jede Messung wird die Parent-Kette aufgelöst: einmal durch
+erneutes Laden jedes Elternteils (``from_json`` je Schritt), einmal über
+:class:`sdata.identity.IdentityMap` (jeder Vorfahr wird einmal geladen).
+
+    python benchmarks/bench_identity.py [N]
+"""
+import sys
+import timeit
+
+from sdata.base import Base
+from sdata.identity import IdentityMap
+
+
+def build(n, series=10, samples=10):
+    store = {}
+    project = Base(name="program")
+    store[project.sname] = project.to_json(compact=True)
+    leaves = []
+    for i in range(series):
+        s = Base(name="series_{}".format(i), parent=project)
+        store[s.sname] = s.to_json(compact=True)
+        for j in range(samples):
+            p = Base(name="sample_{}_{}".format(i, j), parent=s)
+            store[p.sname] = p.to_json(compact=True)
+            leaves.extend(Base(name="test_{}_{}_{}".format(i, j, k), parent=p)
+                          for k in range(max(1, n // (series * samples))))
+    return store, leaves
+
+
+def walk_reload(leaves, store):
+    """Ohne Cache: jeden Elternteil je Schritt neu laden."""
+    total = 0
+    for leaf in leaves:
+        current = leaf
+        while True:
+            sname = current.metadata.get(Base.SDATA_PARENT_SNAME).value
+            if not sname:
+                break
+            current = Base.from_json(store[sname])
+            total += 1
+    return total
+
+
+def walk_identity(leaves, store):
+    imap = IdentityMap()
+    loader = lambda sname: Base.from_json(store[sname])
+    return sum(len(leaf.ancestors(loader, identity_map=imap)) for leaf in leaves), imap
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=5000):
+    store, leaves = build(n)
+    assert walk_reload(leaves, store) == walk_identity(leaves, store)[0]
+    old = best(lambda: walk_reload(leaves, store))
+    new = best(lambda: walk_identity(leaves, store))
+    loads = walk_identity(leaves, store)[1].misses
+    print("leaves:                    {:>10d}".format(len(leaves)))
+    print("reload per step [walk/s]:  {:>10.0f}  loads: {}".format(
+        len(leaves) / old, walk_reload(leaves, store)))
+    print("identity map [walk/s]:     {:>10.0f}  loads: {}  ({:.1f}x)".format(
+        len(leaves) / new, loads, old / new))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
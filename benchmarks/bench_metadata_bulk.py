@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit-Benchmark: Metadata aus vielen Attributen aufbauen.
+
+Vergleicht den Einzelwert-Pfad (je Attribut ``guess_dtype_from_value`` + ``set_attr``,
+das bisherige ``update_from_dict``) mit dem Bulk-Pfad
+(:meth:`~sdata.metadata.Metadata.from_records` / ``from_arrays``).
+
+    python benchmarks/bench_metadata_bulk.py [N]
+"""
+import sys
+import timeit
+
+from sdata.metadata import Metadata
+
+
+def records(n):
+    """Typischer Export: Zahlen als Strings, Texte, Attribut-dicts mit Einheit."""
+    d = {}
+    for i in range(n):
+        key = "attr_{:06d}".format(i)
+        if i % 3 == 0:
+            d[key] = "{:.3f}".format(i * 0.5)
+        elif i % 3 == 1:
+            d[key] = "text {}".format(i)
+        else:
+            d[key] = {"value": float(i), "dtype": "float", "unit": "mm",
+                      "description": "measured"}
+    return d
+
+
+def single(d):
+    metadata = Metadata()
+    for key, value in d.items():
+        metadata._update_item(key, value)
+    return metadata
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=20000):
+    d = records(n)
+    names = list(d)
+    values = [v["value"] if isinstance(v, dict) else v for v in d.values()]
+    legacy = best(lambda: single(d))
+    bulk = best(lambda: Metadata.from_records(d))
+    arrays = best(lambda: Metadata.from_arrays(names, values))
+    print("attributes:              {:>10d}".format(n))
+    print("single [ms]:             {:>10.1f}".format(1e3 * legacy))
+    print("from_records [ms]:       {:>10.1f}  ({:.1f}x)".format(1e3 * bulk, legacy / bulk))
+    print("from_arrays [ms]:        {:>10.1f}  ({:.1f}x)".format(1e3 * arrays, legacy / arrays))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit-/Größen-Benchmark: Metadata als JSON vs. ``to_bytes``.
+
+Vergleicht den bisherigen Weg (``to_json``/``from_json``, ein dict je Attribut) mit
+der spaltenweisen, wörterbuchkodierten Kodierung ``to_bytes`` als kompaktes JSON und
+als MessagePack (``msgpack``-Paket oder pure-Python-Fallback :mod:`sdata.binpack`).
+
+    python benchmarks/bench_metadata_bytes.py [N]
+"""
+import sys
+import timeit
+
+from sdata import binpack
+from sdata.metadata import Metadata
+
+
+def metadata(n):
+    """Typische Messdaten: wenige Einheiten/Beschreibungen, viele Attribute."""
+    units = ["mm", "N", "s", "kN", "MPa"]
+    return Metadata.from_records({"attr_{:06d}".format(i): {
+        "value": i * 0.5 if i % 4 else "text {}".format(i),
+        "dtype": "float" if i % 4 else "str", "unit": units[i % 5],
+        "description": "channel {}".format(i % 7)} for i in range(n)})
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=20000):
+    md = metadata(n)
+    ways = [
+        ("json (to_json)", md.to_json, Metadata.from_json),
+        ("to_bytes json", lambda: md.to_bytes("json"), Metadata.from_bytes),
+        ("to_bytes msgpack", md.to_bytes, Metadata.from_bytes),
+    ]
+    print("attributes: {}  (msgpack package: {})".format(n, binpack.HAVE_MSGPACK))
+    print("{:<18s} {:>10s} {:>12s} {:>12s}".format("", "size [kB]", "encode [ms]", "decode [ms]"))
+    for label, encode, decode in ways:
+        data = encode()
+        print("{:<18s} {:>10.0f} {:>12.1f} {:>12.1f}".format(
+            label, len(data) / 1e3, 1e3 * best(encode), 1e3 * best(lambda: decode(data))))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit-Benchmark: ``Metadata.sha3_256`` als Änderungsprüfung.
+
+Vergleicht den bisherigen Hash über den kompletten JSON-String (``update_hash``) mit
+dem inkrementellen Merkle-Hash ``sha3_256`` – unverändert und nach Änderung eines
+einzelnen Attributs.
+
+    python benchmarks/bench_metadata_digest.py [N]
+"""
+import hashlib
+import sys
+import timeit
+
+from sdata.metadata import Metadata
+
+
+def best(func, number=20, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=20000):
+    metadata = Metadata.from_records({"attr_{:06d}".format(i): {
+        "value": float(i), "dtype": "float", "unit": "mm", "description": "measured"}
+        for i in range(n)})
+    attr = metadata.get("attr_{:06d}".format(n // 2))
+    metadata.sha3_256
+
+    def one_change():
+        attr.value += 1.0
+        return metadata.sha3_256
+
+    full = best(lambda: metadata.update_hash(hashlib.sha3_256()).hexdigest(), number=3)
+    unchanged = best(lambda: metadata.sha3_256, number=1000)
+    changed = best(one_change)
+    print("attributes:              {:>10d}".format(n))
+    print("json hash [ms]:          {:>10.2f}".format(1e3 * full))
+    print("sha3_256 unchanged [ms]: {:>10.4f}  ({:.0f}x)".format(1e3 * unchanged, full / unchanged))
+    print("sha3_256 1 change [ms]:  {:>10.2f}  ({:.0f}x)".format(1e3 * changed, full / changed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit-Benchmark: ``Metadata.df``/``udf`` bei breiten Metadaten.
+
+Vergleicht das Standard-Backend (``SortedDict`` aus ``Attribute``-Objekten) mit dem
+spaltenorientierten Backend ``Metadata(backend="columnar")``.
+
+    python benchmarks/bench_metadata_frames.py [N]
+"""
+import sys
+import time
+
+from sdata.metadata import Metadata
+
+
+def build(backend, n):
+    metadata = Metadata(name="bench", backend=backend)
+    units = ("mm", "kN", "s", "MPa", "-")
+    for i in range(n):
+        metadata.add("channel_{:06d}".format(i), float(i), dtype="float",
+                     unit=units[i % len(units)], description="measured channel")
+    metadata.add("_sdata_name", "bench")
+    return metadata
+
+
+def seconds_per_view(metadata, repeat=5):
+    start = time.perf_counter()
+    for i in range(repeat):
+        metadata.get("_sdata_name").value = "bench{}".format(i)   # Cache verwerfen
+        metadata.df
+        metadata.udf
+    return (time.perf_counter() - start) / repeat
+
+
+def main(n=10000):
+    legacy = seconds_per_view(build("sorteddict", n))
+    columnar = seconds_per_view(build("columnar", n))
+    print("attributes:              {:>10d}".format(n))
+    print("df+udf [ms] (sorteddict):{:>10.1f}".format(1e3 * legacy))
+    print("df+udf [ms] (columnar):  {:>10.1f}".format(1e3 * columnar))
+    print("speedup:                 {:>9.1f}x".format(legacy / columnar))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit-Benchmark: viele gespeicherte Objekte laden und nur zwei Werte lesen.
+
+Vergleicht ``Metadata.from_dict`` (alle Werte sofort koerziert: Zeitstempel geparst,
+JSON, Decimal, ...) mit ``Metadata.from_dict(..., lazy=True)`` (Coercion erst beim
+Zugriff auf ``Attribute.value``).
+
+    python benchmarks/bench_metadata_lazy.py [N]
+"""
+import json
+import sys
+import timeit
+
+from sdata.metadata import Metadata
+
+
+def stored(n):
+    """``n`` gespeicherte Metadaten (``to_dict``-Form) mit typischen dtypes."""
+    md = Metadata()
+    md.add("material", "steel")
+    md.add("force", 1.5, unit="kN")
+    md.add("ctime", "2024-01-02T03:04:05", dtype="timestamp")
+    md.add("mtime", "2024-01-03T03:04:05", dtype="timestamp")
+    md.add("tolerance", "0.0125", dtype="decimal")
+    md.add("duration", "PT1H30M", dtype="duration")
+    md.add("setup", '{"machine": "Z100", "clamps": [1, 2]}', dtype="json")
+    md.add("points", "1.0,2.0,3.5", dtype="floatlist")
+    for i in range(12):
+        md.add("channel_{}".format(i), "2024-01-02T03:04:{:02d}".format(i), dtype="timestamp")
+    text = md.to_json()                     # wie aus einem Store: serialisierte Rohwerte
+    return [json.loads(text) for _ in range(n)]
+
+
+def load(records, lazy):
+    selected = 0
+    for d in records:
+        md = Metadata.from_dict(d, lazy=lazy)
+        if md.get("material").value == "steel" and md.get("force").value > 1:
+            selected += 1
+    return selected
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=10000):
+    records = stored(n)
+    eager = best(lambda: load(records, False))
+    lazy = best(lambda: load(records, True))
+    print("objects x attributes:    {:>6d} x {}".format(n, len(records[0])))
+    print("eager [ms]:              {:>10.1f}".format(1e3 * eager))
+    print("lazy [ms]:               {:>10.1f}  ({:.1f}x)".format(1e3 * lazy, eager / lazy))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
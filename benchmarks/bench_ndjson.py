@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Durchsatz- und Speicher-Benchmark: Projekt-Dump als NDJSON-Strom.
+
+Vergleicht einen Dump als ein JSON-Dokument (alle Objekte auf einmal im
+Speicher, je Objekt ``to_dict``/``from_dict``) mit :mod:`sdata.iolib.ndjson`
+(gzip, zeilenweise, optional mit Thread-Pool). Gemessen werden Zeit und die
+Speicherspitze beim Einlesen, wenn die Objekte nur durchlaufen werden.
+
+    python benchmarks/bench_ndjson.py [N]
+"""
+import gzip
+import json
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from sdata.base import Base
+from sdata.iolib.ndjson import read_ndjson, write_ndjson
+
+
+def dump_document(objects, path):
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        json.dump([obj.to_dict() for obj in objects], fh)
+
+
+def load_document(path):
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return [Base.from_dict(d) for d in json.load(fh)]
+
+
+def consume(objects):
+    n = 0
+    for _ in objects:
+        n += 1
+    return n
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result / 2 ** 20
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=5000):
+    objects = [Base(name="obj_{}".format(i)) for i in range(n)]
+    tmp = tempfile.mkdtemp()
+    doc, stream = os.path.join(tmp, "dump.json.gz"), os.path.join(tmp, "dump.ndjson.gz")
+    t_dump = best(lambda: dump_document(objects, doc))
+    t_write = best(lambda: write_ndjson(objects, stream))
+    t_load = best(lambda: consume(load_document(doc)))
+    t_read = best(lambda: consume(read_ndjson(stream)))
+    t_read4 = best(lambda: consume(read_ndjson(stream, workers=4)))
+    m_load = peak(lambda: consume(load_document(doc)))
+    m_read = peak(lambda: consume(read_ndjson(stream)))
+    print("objects:                      {:>10d}".format(n))
+    print("document write [obj/s]:       {:>10.0f}".format(n / t_dump))
+    print("ndjson write [obj/s]:         {:>10.0f}  ({:.1f}x)".format(n / t_write, t_dump / t_write))
+    print("document read [obj/s]:        {:>10.0f}  peak {:.1f} MiB".format(n / t_load, m_load))
+    print("ndjson read [obj/s]:          {:>10.0f}  peak {:.1f} MiB".format(n / t_read, m_read))
+    print("ndjson read workers=4 [obj/s]:{:>10.0f}".format(n / t_read4))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
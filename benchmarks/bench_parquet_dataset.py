@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Abfrage eines Prüfkörpers aus einer Versuchskampagne.
+
+Die Kampagne (``SPECIMENS`` Prüfkörper über ``DAYS`` Tage, Zeilen gemischt wie beim
+laufenden Anhängen) liegt einmal als eine Parquet-Datei und einmal als nach
+``specimen``/``day`` partitioniertes Dataset vor. Verglichen wird das Lesen eines
+Prüfkörpers: ganze Datei lesen und in pandas filtern, ``from_parquet`` mit
+``filters`` (Row-Group-Statistik) und ``from_dataset`` mit ``filters``
+(Partition-Pruning).
+
+    python benchmarks/bench_parquet_dataset.py [N]
+"""
+import logging
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+SPECIMENS = 50
+DAYS = 10
+
+
+def campaign(n):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"specimen": np.char.add("S", rng.integers(0, SPECIMENS, n).astype(str)),
+                       "day": rng.integers(0, DAYS, n),
+                       "time": np.arange(n) * 1e-3,
+                       "force": rng.normal(size=n), "disp": rng.normal(size=n)})
+    sdf = DataFrame(name="campaign", df=df)
+    sdf.set_column("force", unit="kN")
+    return sdf
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=4000000):
+    logging.disable(logging.INFO)
+    sdf = campaign(n)
+    root = tempfile.mkdtemp()
+    filepath = sdf.to_parquet(path=root)
+    dataset = sdf.to_dataset(root + "/dataset", partition_cols=["specimen", "day"])
+    query = [("specimen", "=", "S7")]
+    rows = (("read all + filter", lambda: DataFrame.from_parquet(filepath).df.query("specimen == 'S7'")),
+            ("from_parquet filters", lambda: DataFrame.from_parquet(filepath, filters=query)),
+            ("from_dataset filters", lambda: DataFrame.from_dataset(dataset, filters=query)))
+    print("rows:               {:>10d}  ({} specimens x {} days)".format(n, SPECIMENS, DAYS))
+    for label, func in rows:
+        print("{:<22s} {:>8.1f} ms".format(label, best(func) * 1e3))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4000000)
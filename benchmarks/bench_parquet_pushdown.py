@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: zwei Kanäle und ein Zeitfenster aus einer großen Aufzeichnung lesen.
+
+Die Aufzeichnung hat 200 Kanäle in Row-Groups zu 50000 Zeilen. Verglichen wird das
+vollständige ``from_parquet`` mit anschließender Auswahl in pandas mit
+``from_parquet(columns=..., filters=...)``, das nur die benötigten Spalten liest und
+nicht passende Row-Groups über ihre Statistiken überspringt.
+
+    python benchmarks/bench_parquet_pushdown.py [N]
+"""
+import logging
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+CHANNELS = 200
+CHUNK = 50000
+
+
+def write_recording(n, path):
+    names = ["time"] + ["ch{:03d}".format(i) for i in range(CHANNELS)]
+    sdf = DataFrame(name="recording", df=pd.DataFrame(
+        {c: pd.Series(dtype="float64") for c in names}))
+    rng = np.random.default_rng(0)
+    with sdf.open_parquet_writer(path=path) as writer:
+        for start in range(0, n, CHUNK):
+            size = min(CHUNK, n - start)
+            data = {"time": np.arange(start, start + size) * 1e-3}
+            block = rng.normal(size=(CHANNELS, size))
+            data.update({name: block[i] for i, name in enumerate(names[1:])})
+            writer.write_batch(pd.DataFrame(data))
+    return writer.filepath
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=500000):
+    logging.disable(logging.INFO)
+    filepath = write_recording(n, tempfile.mkdtemp())
+    columns = ["time", "ch007", "ch123"]
+    lo, hi = n * 0.4e-3, n * 0.5e-3
+
+    def full():
+        df = DataFrame.from_parquet(filepath).df
+        return df.loc[(df["time"] >= lo) & (df["time"] < hi), columns]
+
+    def pushdown():
+        return DataFrame.from_parquet(filepath, columns=columns,
+                                      filters=[("time", ">=", lo), ("time", "<", hi)]).df
+
+    assert len(full()) == len(pushdown())
+    t_full, t_push = best(full), best(pushdown)
+    print("rows x channels:     {:>8d} x {}".format(n, CHANNELS))
+    print("full read + select:  {:>8.1f} ms".format(t_full * 1e3))
+    print("columns + filters:   {:>8.1f} ms  ({:.0f}x)".format(t_push * 1e3, t_full / t_push))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: stückweise erzeugte Messdaten als Parquet schreiben.
+
+Vergleicht das Sammeln aller Blöcke mit ``pd.concat`` und anschließendem
+``DataFrame.to_parquet`` mit dem Streaming über ``open_parquet_writer`` /
+``write_batch`` (ein Row-Group je Block). Die Blöcke entstehen während der Messung
+(wie an einem Prüfstand); gemessen werden Zeit und die numpy-Speicherspitze
+(tracemalloc).
+
+    python benchmarks/bench_parquet_writer.py [N]
+"""
+import logging
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from sdata.sclass.dataframe import DataFrame
+
+CHUNK = 100000
+
+
+def chunks(n):
+    rng = np.random.default_rng(0)
+    for start in range(0, n, CHUNK):
+        size = min(CHUNK, n - start)
+        yield pd.DataFrame({"time": np.arange(start, start + size) * 1e-3,
+                            "force": rng.normal(size=size), "disp": rng.normal(size=size)})
+
+
+def declared():
+    sdf = DataFrame(name="rig", df=pd.DataFrame(
+        {c: pd.Series(dtype="float64") for c in ("time", "force", "disp")}))
+    sdf.set_column("force", unit="kN")
+    return sdf
+
+
+def concat_then_write(n, path):
+    sdf = declared()
+    sdf.df = pd.concat(list(chunks(n)), ignore_index=True)
+    sdf.to_parquet(path=path)
+
+
+def streaming(n, path):
+    with declared().open_parquet_writer(path=path) as writer:
+        for chunk in chunks(n):
+            writer.write_batch(chunk)
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result / 2 ** 20
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=5000000):
+    logging.disable(logging.INFO)
+    path = tempfile.mkdtemp()
+    print("rows:               {:>10d}  ({} per batch)".format(n, CHUNK))
+    for label, func in (("concat + to_parquet", concat_then_write), ("write_batch", streaming)):
+        print("{:<20s} {:>8.1f} ms  peak {:>7.1f} MiB".format(
+            label, best(lambda: func(n, path)) * 1e3, peak(lambda: func(n, path))))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000000)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Durchsatz-Benchmark: SUUID-Ableitung und sname-Parsing.
+
+Vergleicht die ungecachte Ableitung je Name (``suuid.SUUID.from_name``) mit der
+memoisierten (wiederholte Namen, wie bei Bulk-Importen) und mit dem Batch
+``SUUID.from_names``; dazu das Parsen eines ``sname`` ohne und mit Cache.
+
+    python benchmarks/bench_suuid.py [N]
+"""
+import sys
+import timeit
+
+from suuid import SUUID as CoreSUUID
+
+from sdata.suuid import SUUID
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=20000):
+    names = ["sample_{}".format(i) for i in range(n)]
+    snames = [SUUID.from_name("Data", name, ns_name="project").sname for name in names]
+    old = best(lambda: [CoreSUUID.from_name("Data", name, ns="project") for name in names])
+    memo = best(lambda: [SUUID.from_name("Data", name, ns_name="project") for name in names])
+    batch = best(lambda: SUUID.from_names("Data", names, ns_name="project"))
+    parse_old = best(lambda: [CoreSUUID.from_sname(s) for s in snames])
+    parse = best(lambda: [SUUID.from_suuid_sname(s) for s in snames])
+    print("names:                     {:>10d}".format(n))
+    print("from_name [ids/s]:         {:>10.0f}".format(n / old))
+    print("from_name memo [ids/s]:    {:>10.0f}  ({:.1f}x)".format(n / memo, old / memo))
+    print("from_names [ids/s]:        {:>10.0f}  ({:.1f}x)".format(n / batch, old / batch))
+    print("from_sname [ids/s]:        {:>10.0f}".format(n / parse_old))
+    print("from_suuid_sname [ids/s]:  {:>10.0f}  ({:.1f}x)".format(n / parse, parse_old / parse))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: Skalar-Umrechnungen in Metadaten-Schleifen.
+
+Vergleicht je Aufruf (µs) ``units.convert`` ohne und mit Cache je Einheitenpaar sowie
+``UnitSystem.convert_value``/``target_for`` ohne (``CACHE_SIZE = 0``, Dimensionslösung
+mit ``Fraction`` bei jedem Aufruf) und mit LRU-Cache. Als Referenz dient die reine
+Arithmetik.
+
+    python benchmarks/bench_units_scalar.py [N]
+"""
+import sys
+import timeit
+
+from sdata import units
+from sdata.units import UnitSystem
+
+SYMBOLS = ("N", "MPa", "mm", "J", "s", "degC", "kg")
+
+
+def uncached_entry(symbol, role):
+    entry = units._UNITS.get(units._norm_convert(symbol))
+    if entry is None:
+        raise units.UnitConversionError(f"unknown {role} unit {symbol!r}")
+    return entry
+
+
+def uncached_convert(value, from_unit, to_unit):
+    """Früherer Weg: Tabellen-Lookup und Dimensionsprüfung bei jedem Aufruf."""
+    df, ff, fo = uncached_entry(from_unit, "source")
+    dt, tf, to = uncached_entry(to_unit, "target")
+    if df != dt:
+        raise units.UnitConversionError("incompatible units")
+    if isinstance(value, (list, tuple)):
+        return [(v * ff + fo - to) / tf for v in value]
+    return (value * ff + fo - to) / tf
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(n=100000):
+    def loop(convert):
+        return lambda: [convert(float(i), "N", "kN") for i in range(n)]
+
+    def system_loop(size, calls):
+        system = UnitSystem(["t", "mm", "s"])
+        system.CACHE_SIZE = size
+        return lambda: [system.convert_value(1.0, SYMBOLS[i % len(SYMBOLS)])
+                        for i in range(calls)]
+
+    rows = (("arithmetic", lambda: [float(i) * 0.001 for i in range(n)], n),
+            ("convert uncached", loop(uncached_convert), n),
+            ("convert cached", loop(units.convert), n),
+            ("system uncached", system_loop(0, n // 100), n // 100),   # ~100x langsamer
+            ("system LRU", system_loop(256, n), n))
+    print("calls:              {:>10d}".format(n))
+    for label, func, calls in rows:
+        print("{:<20s} {:>8.3f} µs/call".format(label, best(func) / calls * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
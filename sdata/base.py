@@ -4,16 +4,19 @@ import uuid
 import logging
 import unicodedata
 import json
-from typing import List, Dict, Any, Optional, Type, Literal, Union, Tuple, BinaryIO
+import weakref
+from typing import List, Dict, Any, Optional, Type, Literal, Union, Tuple, BinaryIO, Callable
 
 import pandas
 from sdata import __version__
 from sdata.sclass import register
 from sdata.suuid import SUUID
-from sdata.metadata import Metadata, Attribute, extract_name_unit
+from sdata.identity import IdentityMap, IDENTITY_MAP
+from sdata.compression import get_codec, detect_codec
+from sdata.dtypes import json_default
+from sdata.metadata import Metadata, Attribute, extract_name_unit, _dump_document, _load_document
 from sdata.timestamp import now_utc_str, now_local_str, today_str
 import sdata.sclass
-import gzip
 import zipfile
 from pathlib import Path
 
@@ -25,6 +28,10 @@ class SdataUuidException(Exception):
     pass
 
 
+#: je Klasse vorgefertigte reservierte Attribute (siehe ``Base._reserved_template``)
+_RESERVED_TEMPLATES = weakref.WeakKeyDictionary()
+
+
 class Base:
     """
     Base class for sdata objects with metadata management.
@@ -66,6 +73,7 @@ class Base:
         :param project: Optional project object (Base) or suuid_str (str).
         :param ns_name: Optional namespace for reproducible SUUID (str).
         :param default_attributes: List of dicts for additional metadata attributes.
+        :param ctime: Optional UTC creation time (str); default ``now_utc_str()``.
         :raises ValueError: If name is empty or None.
         """
 
@@ -73,14 +81,9 @@ class Base:
         if not name:
             raise ValueError("Name cannot be empty")
         self.metadata = Metadata(name=name)
-        self.metadata.add(self.SDATA_CTIME, now_utc_str(), dtype="str", description="UTC creation date", required=True)
 
         project_sname = self._resolve_relation_sname(
             kwargs.get("project", None), kwargs.get("project_sname", None), "project")
-        self.metadata.add(
-            self.SDATA_PROJECT_SNAME, project_sname, dtype="str",
-            description="sname of the project"
-        )
         # Namespace: expliziter ns_name-Kwarg hat Vorrang, sonst die Projekt-sname
         # (hierarchisches Scoping), sonst der Default-Namespace.
         ns_name = kwargs.get("ns_name") or project_sname or None
@@ -95,37 +98,18 @@ class Base:
 
         self.default_attributes: List[Dict[str, Any]] = []
 
-        self.metadata.add(
-            self.SDATA_VERSION, __version__, dtype="str",
-            description="sdata package version", required=True
-        )
-        self.metadata.add(
-            self.SDATA_TOPOLOGY_CLASS, "sdata.sclass:IndependentContinuant", dtype="str",
-            description="sdata topology class name", required=False
-        )
-        self.metadata.add(
-            self.SDATA_NAME, name, dtype="str",
-            description="name of the data object", required=True
-        )
-        self.metadata.add(
-            self.SDATA_SNAME, suuid.sname, dtype="str",
-            description="sname of the data object", required=True
-        )
-        self.metadata.add(
-            self.SDATA_SUUID, suuid.suuid_str, dtype="str",
-            description="Super Universally Unique Identifier", required=True
-        )
-        self.metadata.add(
-            self.SDATA_CLASS, self.get_sdata_spec(), dtype="str",
-            description="sdata class", required=True
-        )
-
         parent_sname = self._resolve_relation_sname(
             kwargs.get("parent", None), kwargs.get("parent_sname", None), "parent")
-        self.metadata.add(
-            self.SDATA_PARENT_SNAME, parent_sname, dtype="str",
-            description="sname of the parent"
-        )
+
+        # reservierte Attribute: Klone der vorgefertigten Klassen-Vorlage
+        self.metadata._add_reserved(self._reserved_template(), {
+            self.SDATA_CTIME: kwargs.get("ctime") or now_utc_str(),
+            self.SDATA_PROJECT_SNAME: project_sname,
+            self.SDATA_NAME: name,
+            self.SDATA_SNAME: suuid.sname,
+            self.SDATA_SUUID: suuid.suuid_str,
+            self.SDATA_PARENT_SNAME: parent_sname,
+        })
 
         if "default_attributes" in kwargs:
             self.default_attributes.extend(kwargs.get("default_attributes"))
@@ -140,6 +124,71 @@ class Base:
 
         # logger.debug(f"Created {self.__class__.__name__} '{suuid.sname}'")
 
+    @classmethod
+    def _reserved_template(cls) -> List[Attribute]:
+        """Vorgefertigte reservierte Attribute dieser Klasse (einmal je Klasse gebaut).
+
+        Klassenkonstante Werte (Version, Topologie-, sdata-Klasse) sind gesetzt, die
+        je Objekt verschiedenen (ctime, name, sname, suuid, project/parent) leer;
+        :meth:`Metadata._add_reserved` klont die Vorlage je Instanz.
+        """
+        template = _RESERVED_TEMPLATES.get(cls)
+        if template is None:
+            spec = [
+                (cls.SDATA_CTIME, None, "UTC creation date", True),
+                (cls.SDATA_PROJECT_SNAME, None, "sname of the project", False),
+                (cls.SDATA_VERSION, __version__, "sdata package version", True),
+                (cls.SDATA_TOPOLOGY_CLASS, "sdata.sclass:IndependentContinuant",
+                 "sdata topology class name", False),
+                (cls.SDATA_NAME, None, "name of the data object", True),
+                (cls.SDATA_SNAME, None, "sname of the data object", True),
+                (cls.SDATA_SUUID, None, "Super Universally Unique Identifier", True),
+                (cls.SDATA_CLASS, cls.get_sdata_spec(), "sdata class", True),
+                (cls.SDATA_PARENT_SNAME, None, "sname of the parent", False),
+            ]
+            template = _RESERVED_TEMPLATES[cls] = [
+                Attribute(key, value, dtype="str", description=description, required=required)
+                for key, value, description, required in spec]
+        return template
+
+    @classmethod
+    def create_many(cls, items, **kwargs: Any) -> List['Base']:
+        """
+        Create many objects at once, sharing one creation timestamp.
+
+        .. code-block:: python
+
+            children = Base.create_many(["c1", "c2", "c3"], parent=parent)
+            Base.create_many([{"name": "a", "description": "x"}, "b"])
+
+        :param items: names (str) or dicts of constructor kwargs per object.
+        :param kwargs: common constructor kwargs (``parent``/``project`` are
+            resolved to their sname once for the whole batch).
+        :return: list of instances
+        """
+        kwargs.setdefault("ctime", now_utc_str())
+        for relation in ("project", "parent"):
+            obj = kwargs.pop(relation, None)
+            if obj is not None and kwargs.get(relation + "_sname") is None:
+                kwargs[relation + "_sname"] = cls._resolve_relation_sname(obj, None, relation)
+        items = list(items)
+        suuids = {}
+        if kwargs.get("suuid") is None:
+            # SUUIDs der reinen Namen in einem Durchgang ableiten
+            names = [item for item in items if isinstance(item, str) and item]
+            ns_name = kwargs.get("ns_name") or kwargs.get("project_sname") or None
+            suuids = dict(zip(names, SUUID.from_names(cls.__name__, names, ns_name=ns_name)))
+            kwargs.pop("suuid", None)
+        objects = []
+        for item in items:
+            if isinstance(item, dict):
+                objects.append(cls(**dict(kwargs, **item)))
+            elif item in suuids:
+                objects.append(cls(name=item, suuid=suuids[item], **kwargs))
+            else:
+                objects.append(cls(name=item, **kwargs))
+        return objects
+
     def validate(self):
         """Validiere die Metadaten gegen das deklarierte ``SDATA_SCHEMA``.
 
@@ -150,7 +199,8 @@ class Base:
             return ValidationReport(ok=True)
         return self.SDATA_SCHEMA.validate(self.metadata)
 
-    def _resolve_relation_sname(self, obj: Any, sname: Optional[str], label: str) -> str:
+    @staticmethod
+    def _resolve_relation_sname(obj: Any, sname: Optional[str], label: str) -> str:
         """Ermittle den sname-Wert für eine Relation (``project``/``parent``).
 
         Ein direkt übergebener sname-String (``project_sname``/``parent_sname``) hat
@@ -357,6 +407,26 @@ class Base:
         else:
             return None
 
+    def ancestors(self, loader: Callable[[str], Optional['Base']], relation: str = "parent",
+                  identity_map: Optional[IdentityMap] = None,
+                  checksum: Optional[Callable[[str], Any]] = None) -> List['Base']:
+        """
+        Resolve the chain of parent (or project) objects, nearest first.
+
+        Every ancestor is loaded at most once per identity map; objects that are
+        still alive or recently loaded are reused (see :class:`sdata.identity.IdentityMap`).
+
+        :param loader: ``loader(sname) -> Base | None`` loading an object from storage.
+        :param relation: ``"parent"`` (default) or ``"project"``.
+        :param identity_map: map to use (default: the process-wide ``IDENTITY_MAP``).
+        :param checksum: optional ``checksum(sname)`` of the stored state; cached
+            objects with a different checksum are reloaded.
+        :return: list of ancestor objects
+        """
+        if identity_map is None:
+            identity_map = IDENTITY_MAP
+        return identity_map.ancestors(self, loader, relation=relation, checksum=checksum)
+
     def __str__(self) -> str:
         return f"<{self.sname}>"
 
@@ -399,98 +469,246 @@ class Base:
             return spec
 
     @classmethod
-    def from_dict(cls, d: Dict[str, Any]) -> 'Base':
+    def from_dict(cls, d: Dict[str, Any], lazy: bool = False) -> 'Base':
         """
         Create an instance from a dictionary.
 
         :param d: Dictionary with metadata, data, and description.
+        :param lazy: Attributwerte erst beim ersten Zugriff koerzieren
+            (siehe :meth:`Metadata.from_dict`).
         :return: Instance of Base or subclass.
         """
-        metadata = Metadata.from_dict(d.get("metadata", {}))
+        metadata = Metadata.from_dict(d.get("metadata", {}), lazy=lazy)
+        return cls._from_parts(metadata, d.get("data", {}), d.get("description", ""))
+
+    @classmethod
+    def _from_parts(cls, metadata: Metadata, data: Dict[str, Any], description: str) -> 'Base':
         class_spec = metadata.get(cls.SDATA_CLASS).value or "sdata.base:Base"
         class_name = cls.classname_from_classspec(class_spec)
         b = sdata_factory(class_name)
         b.metadata = metadata
-        b.data = d.get("data", {})
-        b.description = d.get("description", "")
+        b.data = data
+        b.description = description
         return b
 
-    def to_json(self, filepath: Optional[str] = None, sidecar: bool = False) -> Optional[str]:
+    def to_json(self, filepath: Optional[str] = None, sidecar: bool = False,
+                compact: bool = False) -> Optional[str]:
         """
         Export the object to JSON format, either as a string or to a file.
 
         :param filepath: Optional file path to write JSON (default: None).
         :param sidecar: bei True zusätzlich ``<dir>/<sname>.meta.jsonld`` schreiben
             (nur wirksam mit ``filepath``; Default False = unverändertes Verhalten).
+        :param compact: bei True ohne Einrückung und Leerzeichen (Default: ``indent=4``).
         :return: JSON string if filepath is None, else None.
         """
         data_dict = self.to_dict()
+        options = {"separators": (",", ":")} if compact else {"indent": 4}
         if filepath:
             with open(filepath, "w") as fh:
-                json.dump(data_dict, fh, indent=4)
+                json.dump(data_dict, fh, **options)
             if sidecar:
                 self.write_sidecar(os.path.dirname(filepath) or ".")
             return None
         else:
-            return json.dumps(data_dict, indent=4)
+            return json.dumps(data_dict, **options)
+
+    def to_bytes(self, fmt: str = "msgpack") -> bytes:
+        """
+        Compact binary encoding (metadata column-wise, see :meth:`Metadata.to_bytes`).
+
+        :param fmt: ``"msgpack"`` (default) or ``"json"`` (compact JSON).
+        :return: bytes
+        """
+        doc = {"sdata": "base", "version": 1,
+               "metadata": self.metadata._to_document(binary=fmt == "msgpack"),
+               "data": self._data, "description": self._description}
+        return _dump_document(doc, fmt)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, lazy: bool = False) -> 'Base':
+        """
+        Create an instance from :meth:`to_bytes` output (msgpack or json).
+
+        :param data: bytes
+        :param lazy: Attributwerte erst beim ersten Zugriff koerzieren.
+        :return: Instance of Base or subclass.
+        :raises ValueError: If the bytes are no sdata object.
+        """
+        doc = _load_document(data, "base")
+        return cls._from_parts(Metadata._from_document(doc["metadata"], lazy=lazy),
+                               doc.get("data", {}), doc.get("description", ""))
 
     @classmethod
-    def from_json(cls, s: str) -> 'Base':
+    def from_json(cls, s: str, lazy: bool = False) -> 'Base':
         """
         Create an instance from a JSON string or file path.
 
         :param s: JSON string or path to JSON file.
+        :param lazy: Attributwerte erst beim ersten Zugriff koerzieren.
         :return: Instance of Base or subclass.
         :raises json.JSONDecodeError: If invalid JSON.
         :raises FileNotFoundError: If file not found.
         """
-        if os.path.isfile(s):
+        if isinstance(s, str) and s.lstrip()[:1] == "{":   # JSON-Text: kein Dateisystem-Lookup
+            d = json.loads(s)
+        elif os.path.isfile(s):
             with open(s, "r") as fh:
                 d = json.load(fh)
         else:
             d = json.loads(s)
+        if lazy:                    # Subklassen-from_dict ohne lazy-Parameter bleiben gültig
+            return cls.from_dict(d, lazy=True)
         return cls.from_dict(d)
 
-    def to_bytes_gzip(self):
-        json_str = self.to_json()
-        compressed = gzip.compress(json_str.encode("utf-8"))
-        return compressed
+    def to_bytes_gzip(self, level: Union[int, str] = "default") -> bytes:
+        """gzip-compressed JSON in the layout of :meth:`to_json` (``indent=4``).
+
+        Streamed like :meth:`write_compressed`; ``level`` as in :meth:`to_compressed`.
+        """
+        buf = io.BytesIO()
+        self._write_compressed(buf, get_codec("gzip"), level, indent=4)
+        return buf.getvalue()
 
     @classmethod
     def from_bytes_gzip(cls, compressed: bytes):
-        decompressed = gzip.decompress(compressed).decode("utf-8")
-        instance = cls.from_json(decompressed)
-        return instance
+        return cls.from_compressed(compressed, codec="gzip")
+
+    def _iter_json(self, chunksize: int = 1 << 16, indent: Optional[int] = None):
+        """JSON of :meth:`to_dict` as UTF-8 chunks of about ``chunksize`` bytes.
+
+        Kompakt; mit ``indent`` im Layout von :meth:`to_json` (``json.dumps(..., indent=4)``).
+        """
+        if indent is None:
+            encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False,
+                                       default=json_default)
+        else:
+            encoder = json.JSONEncoder(indent=indent, default=json_default)
+        parts, size = [], 0
+        for part in encoder.iterencode(self.to_dict()):
+            parts.append(part)
+            size += len(part)
+            if size >= chunksize:
+                yield "".join(parts).encode("utf-8")
+                parts, size = [], 0
+        if parts:
+            yield "".join(parts).encode("utf-8")
+
+    def to_compressed(self, codec: str = "gzip", level: Union[int, str] = "default") -> bytes:
+        """
+        Compressed compact JSON.
+
+        :param codec: codec name from :data:`sdata.compression.CODECS`
+            (``"gzip"``, ``"bz2"``, ``"lzma"``, ``"zstd"``, ``"lz4"``, ``"none"``).
+        :param level: level or preset (``"fast"``, ``"default"``, ``"archive"``).
+        :return: bytes
+        """
+        buf = io.BytesIO()
+        self.write_compressed(buf, codec=codec, level=level)
+        return buf.getvalue()
+
+    @classmethod
+    def from_compressed(cls, data: bytes, codec: Optional[str] = None, lazy: bool = False) -> 'Base':
+        """
+        Create an instance from :meth:`to_compressed` bytes.
+
+        :param data: compressed bytes.
+        :param codec: codec name; None detects it from the magic bytes.
+        :param lazy: coerce attribute values on first access.
+        :return: Instance of Base or subclass.
+        """
+        codec = detect_codec(data) if codec is None else get_codec(codec)
+        d = json.loads(codec.decompress(data))
+        if lazy:
+            return cls.from_dict(d, lazy=True)
+        return cls.from_dict(d)
+
+    def write_compressed(self, target: Union[str, Path, BinaryIO], codec: str = "gzip",
+                         level: Union[int, str] = "default") -> None:
+        """
+        Stream compressed compact JSON into a file or binary file object.
+
+        The JSON is encoded and compressed chunk by chunk; neither the JSON text
+        nor the compressed payload is held in memory as a whole.
+
+        :param target: path or binary file object (a file object stays open).
+        :param codec: codec name (see :meth:`to_compressed`).
+        :param level: level or preset (``"fast"``, ``"default"``, ``"archive"``).
+        """
+        self._write_compressed(target, get_codec(codec), level)
+
+    def _write_compressed(self, target, codec, level, indent=None):
+        """:meth:`write_compressed` mit ``codec``-Objekt und JSON-Layout (``indent``)."""
+        if isinstance(target, (str, Path)):
+            with open(target, "wb") as fh:
+                self._write_compressed(fh, codec, level, indent)
+            return
+        stream = codec.writer(target, level)
+        try:
+            for chunk in self._iter_json(indent=indent):
+                stream.write(chunk)
+        finally:
+            stream.close()
+
+    @classmethod
+    def read_compressed(cls, source: Union[str, Path, BinaryIO], codec: Optional[str] = None,
+                        lazy: bool = False) -> 'Base':
+        """
+        Read an object written by :meth:`write_compressed` (decompressing as a stream).
+
+        :param source: path or binary file object (a file object stays open).
+        :param codec: codec name; None detects it from the magic bytes.
+        :param lazy: coerce attribute values on first access.
+        :return: Instance of Base or subclass.
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as fh:
+                return cls.read_compressed(fh, codec=codec, lazy=lazy)
+        with get_codec(None).reader(source) as buffered:
+            if codec is None:
+                codec = detect_codec(buffered.peek(8))
+            with get_codec(codec).reader(buffered) as stream:
+                d = json.load(io.TextIOWrapper(stream, encoding="utf-8"))
+        if lazy:
+            return cls.from_dict(d, lazy=True)
+        return cls.from_dict(d)
 
     def to_zip(
         self,
         filepath: Optional[Union[str, Path]] = None,
         *,
-        compresslevel: int = 6,
+        compresslevel: Union[int, str] = 6,
         deterministic: bool = True,
+        compression: str = "deflate",
     ) -> io.BytesIO:
         """
-        Serialisiert das Objekt via to_json() und packt es als data.json in ein ZIP.
+        Serialisiert das Objekt via to_json() und packt es als ``<sname>.sjson`` in ein ZIP.
         - Wenn 'filepath' gesetzt ist, wird die ZIP-Datei geschrieben.
         - Rückgabe ist immer ein BytesIO, beginnend bei Position 0.
+        - 'compression': ``"deflate"`` (Default), ``"bzip2"``, ``"lzma"`` oder ``"stored"``;
+          'compresslevel' als Zahl oder Preset (``"fast"``, ``"default"``, ``"archive"``).
+        - Das JSON (Layout von :meth:`to_json`) wird stückweise in den ZIP-Eintrag
+          geschrieben, ohne JSON-String am Stück. Ohne 'deterministic' mit ZIP64-Kopf;
+          mit festem Zeitstempel bleibt der Eintrag bytegleich zu bisher (ZIP64 nur,
+          falls er 2 GiB übersteigt). Ein vom Default abweichendes Level lässt sich je
+          ``ZipInfo`` erst ab Python 3.13 öffentlich setzen; davor geht ein solcher
+          deterministischer Eintrag am Stück über ``writestr``.
         """
-        json_str = self.to_json()
-
-        buf = io.BytesIO()
-        compression = zipfile.ZIP_DEFLATED
-
-        # Optional: deterministische ZIPs (feste Timestamp -> reproduzierbar)
-        arcname = f"{self.sname}.sjson"
-
-        if deterministic:
-            info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
-            info.compress_type = compression
-            with zipfile.ZipFile(buf, mode="w", compression=compression, compresslevel=compresslevel) as zf:
-                zf.writestr(info, json_str)
+        try:
+            compress_type, codec = _ZIP_COMPRESSION[compression]
+        except KeyError:
+            raise ValueError(f"unknown zip compression {compression!r} ({sorted(_ZIP_COMPRESSION)})")
+        level = get_codec(codec).level(compresslevel) if codec else None
+
+        if not deterministic:
+            buf = self._zip_buffer(compress_type, level, None, force_zip64=True)
         else:
-            with zipfile.ZipFile(buf, mode="w", compression=compression, compresslevel=compresslevel) as zf:
-                zf.writestr(arcname, json_str)
-
+            # deterministische ZIPs (feste Timestamp -> reproduzierbar)
+            try:
+                buf = self._zip_buffer(compress_type, level, (1980, 1, 1, 0, 0, 0))
+            except RuntimeError:                    # Eintrag > 2 GiB: nur mit ZIP64-Kopf
+                buf = self._zip_buffer(compress_type, level, (1980, 1, 1, 0, 0, 0),
+                                       force_zip64=True)
         buf.seek(0)
 
         if filepath is not None:
@@ -501,6 +719,30 @@ class Base:
 
         return buf
 
+    def _zip_buffer(self, compress_type, level, date_time, force_zip64=False):
+        """ZIP mit dem Eintrag ``<sname>.sjson`` (JSON wie :meth:`to_json`) als BytesIO.
+
+        :param date_time: fester Zeitstempel des Eintrags oder None (jetzt)
+        """
+        buf = io.BytesIO()
+        arcname = f"{self.sname}.sjson"
+        with zipfile.ZipFile(buf, mode="w", compression=compress_type, compresslevel=level) as zf:
+            if date_time is None:
+                member = arcname                # Level über ZipFile(compresslevel=...)
+            else:
+                member = zipfile.ZipInfo(arcname, date_time=date_time)
+                member.compress_type = compress_type
+                if level != _ZIP_DEFAULT_LEVEL.get(compress_type, level):
+                    if not _ZIPINFO_LEVEL:      # Python < 3.13: Level nur über writestr
+                        zf.writestr(member, b"".join(self._iter_json(indent=4)),
+                                    compresslevel=level)
+                        return buf
+                    member.compress_level = level
+            with zf.open(member, mode="w", force_zip64=force_zip64) as fh:
+                for chunk in self._iter_json(indent=4):
+                    fh.write(chunk)
+        return buf
+
     @classmethod
     def from_zip(
         cls,
@@ -546,8 +788,73 @@ class Base:
                     raise ValueError(
                         f"ZIP enthält {len(names)} Einträge ({names}). Bitte 'member' angeben."
                     )
-            data = zf.read(chosen).decode(encoding)
-            return cls.from_json(data)
+            with zf.open(chosen) as fh:   # stückweise dekomprimieren
+                d = json.load(io.TextIOWrapper(fh, encoding=encoding))
+        return cls.from_dict(d)
+
+
+#: ``to_zip(compression=...)`` -> (ZIP-Kompressionstyp, Codec für die Level-Presets)
+_ZIP_COMPRESSION = {
+    "deflate": (zipfile.ZIP_DEFLATED, "gzip"),
+    "bzip2": (zipfile.ZIP_BZIP2, "bz2"),
+    "lzma": (zipfile.ZIP_LZMA, None),
+    "stored": (zipfile.ZIP_STORED, None),
+}
+
+#: Level, das ein ``ZipInfo`` ohne eigenes Level nutzt (zlib ``Z_DEFAULT_COMPRESSION``
+#: entspricht 6, bz2 9); LZMA und STORED kennen kein Level
+_ZIP_DEFAULT_LEVEL = {zipfile.ZIP_DEFLATED: 6, zipfile.ZIP_BZIP2: 9}
+
+#: ``ZipInfo.compress_level`` ist erst ab Python 3.13 öffentlich
+_ZIPINFO_LEVEL = hasattr(zipfile.ZipInfo, "compress_level")
+
+#: Registry der dynamisch erzeugten Klassen: Signatur -> Klasse (siehe :func:`generated_class`)
+_GENERATED_CLASSES: Dict[tuple, type] = {}
+
+
+def _class_signature(class_name: str, sdata_class: type, sdata_attrs: Dict[str, Any]) -> Optional[tuple]:
+    """Hashbare Signatur ``(class_name, sdata_class, attrs)`` oder None (nicht hashbar)."""
+    attrs = tuple(sorted(((key, type(value), value) for key, value in sdata_attrs.items()),
+                         key=lambda item: item[0]))
+    key = (class_name, sdata_class, attrs)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def generated_class(class_name: str, sdata_class: Type = Base,
+                    sdata_attrs: Optional[Dict[str, Any]] = None) -> type:
+    """
+    Dynamically generated subclass ``class_name(sdata_class)``, cached by its signature.
+
+    Identical ``(class_name, sdata_class, sdata_attrs)`` yield the *same* class, so
+    loading many objects does not create one class per object and ``type(a) is type(b)``
+    holds for objects of the same spec. Attribute dicts with unhashable values are
+    not cached (a new class per call, as before).
+
+    :param class_name: The name of the class to generate (e.g., "Material").
+    :param sdata_class: The base class to inherit from (default: Base).
+    :param sdata_attrs: Optional dict of custom attributes/methods to add to the class.
+    :return: generated class.
+    """
+    sdata_attrs = sdata_attrs or {}
+    key = _class_signature(class_name, sdata_class, sdata_attrs)
+    cls = _GENERATED_CLASSES.get(key) if key is not None else None
+    if cls is not None:
+        return cls
+
+    cls = type(class_name, (sdata_class,), dict(sdata_attrs))
+
+    def __init__(self, **init_kwargs: Any) -> None:
+        super(cls, self).__init__(**init_kwargs)  # type: ignore
+
+    setattr(cls, '__init__', __init__)
+    if key is not None:
+        _GENERATED_CLASSES[key] = cls
+    return cls
+
 
 def cls_from_spec(
         #        class_name: str,
@@ -564,8 +871,6 @@ def cls_from_spec(
     :param kwargs: Keyword arguments to pass to the instance initialization.
     :return: generated class.
     """
-    sdata_attrs = sdata_attrs or {}
-
     if ":" in sdata_spec:
         mod_name, class_name = sdata_spec.split(":", 1)
     else:
@@ -578,12 +883,7 @@ def cls_from_spec(
         else:
             raise ModuleNotFoundError(f"sdata.base.class_factory Error {e}")
 
-    cls = type(class_name, (sdata_class,), sdata_attrs)
-
-    def __init__(self, **init_kwargs: Any) -> None:
-        super(cls, self).__init__(**init_kwargs)  # type: ignore
-
-    setattr(cls, '__init__', __init__)
+    cls = generated_class(class_name, sdata_class, sdata_attrs)
     return cls
 
 
@@ -602,8 +902,6 @@ def sclass_factory(
     :param kwargs: Keyword arguments to pass to the instance initialization.
     :return: An instance of the generated class.
     """
-    sdata_attrs = sdata_attrs or {}
-
     if ":" in sdata_spec:
         mod_name, class_name = sdata_spec.split(":", 1)
     else:
@@ -616,12 +914,7 @@ def sclass_factory(
         else:
             raise ModuleNotFoundError(f"sdata.base.class_factory Error {e}")
 
-    cls = type(class_name, (sdata_class,), sdata_attrs)
-
-    def __init__(self, **init_kwargs: Any) -> None:
-        super(cls, self).__init__(**init_kwargs)  # type: ignore
-
-    setattr(cls, '__init__', __init__)
+    cls = generated_class(class_name, sdata_class, sdata_attrs)
 
     # print(sdata_spec, sdata_class, type(sdata_class), cls)
     instance = cls(**kwargs)
@@ -646,14 +939,7 @@ def sdata_factory(
     :param kwargs: Keyword arguments to pass to the instance initialization.
     :return: An instance of the generated class.
     """
-    sdata_attrs = sdata_attrs or {}
-
-    cls = type(class_name, (sdata_class,), sdata_attrs)
-
-    def __init__(self, **init_kwargs: Any) -> None:
-        super(cls, self).__init__(**init_kwargs)  # type: ignore
-
-    setattr(cls, '__init__', __init__)
+    cls = generated_class(class_name, sdata_class, sdata_attrs)
     return cls(**kwargs)
 
 
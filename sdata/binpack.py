@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""MessagePack-Kodierung (``packb``/``unpackb``) mit pure-Python-Fallback.
+
+Ist das Paket ``msgpack`` installiert (``pip install "sdata[msgpack]"``), wird es
+verwendet; sonst kodiert ein kleiner pure-Python-Packer dasselbe Wire-Format
+(nil/bool/int/float64/str/bin/array/map, jeweils die kürzeste Form). Beide Wege
+lesen gegenseitig ihre Bytes. Nicht native Werte gehen über ``default`` (z. B.
+:func:`sdata.dtypes.json_default`); Extension-Typen werden nicht verwendet.
+"""
+import struct
+
+try:  # optionales C-Backend
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - abhängig von der Umgebung
+    _msgpack = None
+
+__all__ = ["packb", "unpackb", "HAVE_MSGPACK"]
+
+#: True, wenn das ``msgpack``-Paket als Backend verwendet wird
+HAVE_MSGPACK = _msgpack is not None
+
+_B = struct.Struct(">B").pack
+_b = struct.Struct(">b").pack
+_Bb = struct.Struct(">Bb").pack
+_BB = struct.Struct(">BB").pack
+_BH = struct.Struct(">BH").pack
+_BI = struct.Struct(">BI").pack
+_BQ = struct.Struct(">BQ").pack
+_Bh = struct.Struct(">Bh").pack
+_Bi = struct.Struct(">Bi").pack
+_Bq = struct.Struct(">Bq").pack
+_Bd = struct.Struct(">Bd").pack
+
+_NIL, _FALSE, _TRUE = b"\xc0", b"\xc2", b"\xc3"
+
+
+def _header(length, fix, fixmax, codes):
+    """Kopf für str/bin/array/map der Länge ``length`` (``codes``: 8/16/32 Bit)."""
+    if fix is not None and length <= fixmax:
+        return _B(fix | length)
+    if codes[0] is not None and length < 0x100:
+        return _BB(codes[0], length)
+    if length < 0x10000:
+        return _BH(codes[1], length)
+    if length < 0x100000000:
+        return _BI(codes[2], length)
+    raise ValueError("binpack: object too large ({} items)".format(length))
+
+
+def _pack_int(obj):
+    if 0 <= obj < 0x80:
+        return _B(obj)
+    if -32 <= obj < 0:
+        return _b(obj)
+    if obj >= 0:
+        if obj < 0x100:
+            return _BB(0xcc, obj)
+        if obj < 0x10000:
+            return _BH(0xcd, obj)
+        if obj < 0x100000000:
+            return _BI(0xce, obj)
+        if obj < 0x10000000000000000:
+            return _BQ(0xcf, obj)
+    else:
+        if obj >= -0x80:
+            return _Bb(0xd0, obj)
+        if obj >= -0x8000:
+            return _Bh(0xd1, obj)
+        if obj >= -0x80000000:
+            return _Bi(0xd2, obj)
+        if obj >= -0x8000000000000000:
+            return _Bq(0xd3, obj)
+    raise OverflowError("binpack: int out of range: {}".format(obj))
+
+
+def _pack(obj, append, default):
+    cls = type(obj)
+    if cls is str:
+        data = obj.encode("utf-8", "surrogatepass")
+        append(_header(len(data), 0xa0, 31, (0xd9, 0xda, 0xdb)))
+        append(data)
+    elif obj is None:
+        append(_NIL)
+    elif cls is bool:
+        append(_TRUE if obj else _FALSE)
+    elif cls is float:
+        append(_Bd(0xcb, obj))
+    elif cls is int:
+        append(_pack_int(obj))
+    elif cls is list or cls is tuple:
+        append(_header(len(obj), 0x90, 15, (None, 0xdc, 0xdd)))
+        for item in obj:
+            _pack(item, append, default)
+    elif cls is dict:
+        append(_header(len(obj), 0x80, 15, (None, 0xde, 0xdf)))
+        for key, value in obj.items():
+            _pack(key, append, default)
+            _pack(value, append, default)
+    elif cls is bytes or cls is bytearray or cls is memoryview:
+        data = bytes(obj)
+        append(_header(len(data), None, -1, (0xc4, 0xc5, 0xc6)))
+        append(data)
+    elif isinstance(obj, bool):
+        append(_TRUE if obj else _FALSE)
+    elif isinstance(obj, int):
+        append(_pack_int(int(obj)))
+    elif isinstance(obj, float):
+        append(_Bd(0xcb, float(obj)))
+    elif isinstance(obj, str):
+        _pack(str(obj), append, default)
+    elif isinstance(obj, (list, tuple)):
+        _pack(list(obj), append, default)
+    elif isinstance(obj, dict):
+        _pack(dict(obj), append, default)
+    elif default is not None:
+        _pack(default(obj), append, None)
+    else:
+        raise TypeError("binpack: cannot serialize {!r}".format(type(obj).__name__))
+
+
+def packb(obj, default=None):
+    """``obj`` als MessagePack-Bytes.
+
+    :param obj: None/bool/int/float/str/bytes/list/tuple/dict (verschachtelt)
+    :param default: Funktion für alle übrigen Werte (liefert einen packbaren Wert)
+    :return: bytes
+    """
+    if _msgpack is not None:
+        return _msgpack.packb(obj, default=default, use_bin_type=True)
+    chunks = []
+    _pack(obj, chunks.append, default)
+    return b"".join(chunks)
+
+
+_UNPACK = {code: struct.Struct(fmt) for code, fmt in (
+    (0xcc, ">B"), (0xcd, ">H"), (0xce, ">I"), (0xcf, ">Q"),
+    (0xd0, ">b"), (0xd1, ">h"), (0xd2, ">i"), (0xd3, ">q"),
+    (0xca, ">f"), (0xcb, ">d"))}
+_LEN = {0xd9: ">B", 0xda: ">H", 0xdb: ">I", 0xc4: ">B", 0xc5: ">H", 0xc6: ">I",
+        0xdc: ">H", 0xdd: ">I", 0xde: ">H", 0xdf: ">I"}
+_LEN = {code: struct.Struct(fmt) for code, fmt in _LEN.items()}
+
+
+def _end(data, pos, length):
+    end = pos + length
+    if end > len(data):
+        raise IndexError(end)
+    return end
+
+
+def _unpack(data, pos):
+    code = data[pos]
+    pos += 1
+    if code < 0x80:
+        return code, pos
+    if code >= 0xe0:
+        return code - 0x100, pos
+    if 0xa0 <= code <= 0xbf:
+        end = _end(data, pos, code & 0x1f)
+        return data[pos:end].decode("utf-8", "surrogatepass"), end
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(data, pos, code & 0x0f)
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(data, pos, code & 0x0f)
+    if code == 0xc0:
+        return None, pos
+    if code == 0xc2:
+        return False, pos
+    if code == 0xc3:
+        return True, pos
+    fmt = _UNPACK.get(code)
+    if fmt is not None:
+        return fmt.unpack_from(data, pos)[0], pos + fmt.size
+    fmt = _LEN.get(code)
+    if fmt is None:
+        raise ValueError("binpack: unsupported type byte 0x{:02x}".format(code))
+    length = fmt.unpack_from(data, pos)[0]
+    pos += fmt.size
+    if code in (0xd9, 0xda, 0xdb):
+        end = _end(data, pos, length)
+        return data[pos:end].decode("utf-8", "surrogatepass"), end
+    if code in (0xc4, 0xc5, 0xc6):
+        end = _end(data, pos, length)
+        return data[pos:end], end
+    if code in (0xdc, 0xdd):
+        return _unpack_array(data, pos, length)
+    return _unpack_map(data, pos, length)
+
+
+def _unpack_array(data, pos, length):
+    items = []
+    append = items.append
+    for _ in range(length):
+        item, pos = _unpack(data, pos)
+        append(item)
+    return items, pos
+
+
+def _unpack_map(data, pos, length):
+    items = {}
+    for _ in range(length):
+        key, pos = _unpack(data, pos)
+        value, pos = _unpack(data, pos)
+        items[key] = value
+    return items, pos
+
+
+def unpackb(data):
+    """MessagePack-Bytes zurück in Python-Objekte (arrays als ``list``).
+
+    :param data: bytes
+    :return: Python-Objekt
+    :raises ValueError: bei unbekannten Typen oder überzähligen Bytes
+    """
+    if _msgpack is not None:
+        return _msgpack.unpackb(data, raw=False, strict_map_key=False)
+    data = bytes(data)
+    try:
+        obj, pos = _unpack(data, 0)
+    except (IndexError, struct.error):
+        raise ValueError("binpack: truncated data") from None
+    if pos != len(data):
+        raise ValueError("binpack: {} trailing bytes".format(len(data) - pos))
+    return obj
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""Spaltenorientiertes Backend (struct-of-arrays) für :class:`sdata.metadata.Metadata`.
+
+Statt eines ``SortedDict`` aus einzelnen :class:`~sdata.metadata.Attribute`-Objekten
+hält :class:`AttributeTable` je Feld (name/value/unit/dtype/description/label/
+required/ontology) **eine** Liste. Die DataFrame-Sichten (``df``/``udf``/``sdf``/
+``dft``) entstehen so spaltenweise in einem Schritt statt über eine Python-Schleife
+pro Attribut – bei breiten Objekten mit tausenden Attributen der dominante Anteil.
+
+Aktiviert über ``Metadata(backend="columnar")``. Die bekannte API bleibt: ``get``/
+``add``/``set_attr`` liefern bzw. nehmen :class:`~sdata.metadata.Attribute`-Objekte.
+``get`` gibt dabei eine *Zeilen-Sicht* zurück (eine ``Attribute``-Subklasse), deren
+Felder direkt in die Spalten lesen und schreiben; Coercion/Validierung laufen
+unverändert über die Setter von :class:`~sdata.metadata.Attribute`.
+
+Hinweis: ein *fremdes* ``Attribute``, das per ``add_attribute``/``set_attr``
+übergeben wird, wird **nach Wert** in die Tabelle übernommen; spätere Änderungen
+am übergebenen Objekt erreichen die Tabelle nicht (``get`` liefert die live Sicht).
+"""
+import operator
+import weakref
+
+import pandas as pd
+
+from sdata.contrib.sortedcontainers.sorteddict import SortedDict
+from sdata.metadata import Attribute, _REV
+
+__all__ = ["AttributeTable", "AttributeRow"]
+
+#: DataFrame-Spalten (identisch zu ``Metadata.ATTRIBUTEKEYS``).
+FRAME_FIELDS = ("name", "value", "unit", "dtype", "description", "label", "required",
+                "ontology")
+
+#: Spalten der Tabelle: ``FRAME_FIELDS`` + ``strict`` + Revision (``rev``).
+FIELDS = FRAME_FIELDS + ("strict", "rev")
+
+#: Quell-Attribute je Spalte beim Übernehmen eines Attributs; ``value`` über die
+#: Property, damit verzögerte Werte (``lazy=True``) koerziert in die Spalte gehen.
+SOURCE_FIELDS = tuple("value" if field == "value" else "_" + field for field in FIELDS)
+
+#: Prefix der reservierten sdata-Attribute (Partition ``user``/``sdata``).
+SDATA_PREFIX = "_sdata"
+
+
+def _column(field):
+    """Property, die den Slot ``_<field>`` auf die Tabellenspalte ``field`` abbildet."""
+
+    def fget(self):
+        return self._tbl._cols[field][self._row]
+
+    def fset(self, value):
+        self._tbl._cols[field][self._row] = value
+
+    return property(fget, fset)
+
+
+class AttributeRow(Attribute):
+    """Live-Sicht auf eine Zeile einer :class:`AttributeTable`.
+
+    Verhält sich wie ein :class:`~sdata.metadata.Attribute` (gleiche Properties,
+    gleiche Coercion), speichert aber nichts selbst: die internen Felder ``_name``,
+    ``_value``, … lesen und schreiben die Spalten der Tabelle. ``copy``/``pickle``
+    liefern ein eigenständiges :class:`~sdata.metadata.Attribute`.
+    """
+
+    __slots__ = ("_tbl", "_row", "__weakref__")
+
+    _strict = _column("strict")
+    _name = _column("name")
+    _value = _column("value")
+    _unit = _column("unit")
+    _description = _column("description")
+    _label = _column("label")
+    _ontology = _column("ontology")
+    _dtype = _column("dtype")
+    _required = _column("required")
+    _rev = _column("rev")
+
+    @property
+    def _owner(self):
+        """Besitzer ist die :class:`~sdata.metadata.Metadata` der Tabelle."""
+        return self._tbl._owner
+
+    def __reduce__(self):
+        return Attribute._from_state, (self.__getstate__(),)
+
+
+class AttributeTable(object):
+    """Struct-of-arrays-Speicher für Metadata-Attribute (Mapping ``key -> Attribute``).
+
+    Implementiert die von :class:`~sdata.metadata.Metadata` genutzte Mapping-API
+    (``get``/``[]``/``pop``/``keys``/``values``/``items``/``in``/``len``) in
+    sortierter Schlüsselreihenfolge – wie das bisherige ``SortedDict``.
+    """
+
+    #: ab diesem Anteil entfernter Zeilen wird die Tabelle kompaktiert
+    COMPACT_RATIO = 0.5
+
+    def __init__(self, attributes=None):
+        self._index = SortedDict()          # key -> Zeile (sortiert wie bisher)
+        self._cols = {field: [] for field in FIELDS}
+        self._views = weakref.WeakValueDictionary()   # Zeile -> AttributeRow
+        self._dead = 0
+        self._detached = False              # True: private Tabelle einer gelösten Sicht
+        self._owner = None                  # weakref der besitzenden Metadata
+        self.irange = self._index.irange
+        if attributes:
+            for key, attr in dict(attributes).items():
+                self[key] = attr
+
+    # --- Zeilen ------------------------------------------------------------
+    def _append_row(self, attr):
+        """Übernimm die Felder von ``attr`` als neue Zeile; gibt die Zeilennummer zurück."""
+        row = len(self._cols["name"])
+        for field, source in zip(FIELDS, SOURCE_FIELDS):
+            self._cols[field].append(getattr(attr, source))
+        self._cols["rev"][row] = self._tick()
+        return row
+
+    def _write_row(self, row, attr):
+        for field, source in zip(FIELDS, SOURCE_FIELDS):
+            self._cols[field][row] = getattr(attr, source)
+        self._cols["rev"][row] = self._tick()
+
+    @staticmethod
+    def _tick():
+        """Neuer Tick der globalen Revisionsuhr (Zeileninhalt wurde ersetzt)."""
+        _REV[0] += 1
+        return _REV[0]
+
+    def _view(self, row):
+        view = self._views.get(row)
+        if view is None:
+            view = object.__new__(AttributeRow)
+            view._tbl = self
+            view._row = row
+            self._views[row] = view
+        return view
+
+    def _detach(self, row):
+        """Löse eine ausgegebene Sicht von ``row`` in eine private Ein-Zeilen-Tabelle."""
+        view = self._views.pop(row, None)
+        if view is None:
+            return
+        private = AttributeTable()
+        private._detached = True
+        view._row = private._append_row(view)
+        view._tbl = private
+        private._views[view._row] = view
+
+    def _compact(self):
+        """Entferne gelöschte Zeilen; lebende Sichten werden umnummeriert."""
+        rows = list(self._index.values())
+        self._cols = {field: [col[row] for row in rows] for field, col in self._cols.items()}
+        views = {}
+        for new_row, (key, old_row) in enumerate(list(self._index.items())):
+            self._index[key] = new_row
+            view = self._views.get(old_row)
+            if view is not None:
+                view._row = new_row
+                views[new_row] = view
+        self._views = weakref.WeakValueDictionary(views)
+        self._dead = 0
+
+    # --- Mapping-API ---------------------------------------------------------
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        return self._view(self._index[key])
+
+    def __setitem__(self, key, attr):
+        if not isinstance(attr, Attribute):
+            raise TypeError(f"attr must be an instance of Attribute, got {type(attr).__name__}")
+        if isinstance(attr, AttributeRow) and attr._tbl is self:
+            if self._index.get(key) == attr._row:
+                return
+            # eigene Sicht unter neuem Schlüssel: nur den Schlüssel umhängen
+            for old_key in [k for k, row in self._index.items() if row == attr._row and k != key]:
+                del self._index[old_key]
+            self._index[key] = attr._row
+            return
+        row = self._index.get(key)
+        if row is not None:
+            self._write_row(row, attr)
+            return
+        if isinstance(attr, AttributeRow) and attr._tbl._detached:
+            # zuvor per pop() gelöste Sicht wieder einhängen (Identität bleibt erhalten)
+            row = self._append_row(attr)
+            attr._tbl, attr._row = self, row
+            self._views[row] = attr
+        else:
+            row = self._append_row(attr)
+        self._index[key] = row
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def update(self, pairs):
+        """Viele ``(key, attr)``-Paare einfügen (wie ``dict.update``)."""
+        for key, attr in pairs:
+            self[key] = attr
+
+    def get(self, key, default=None):
+        row = self._index.get(key)
+        if row is None:
+            return default
+        return self._view(row)
+
+    def pop(self, key, *default):
+        if key not in self._index:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        row = self._index.pop(key)
+        view = self._view(row)
+        self._detach(row)
+        self._dead += 1
+        if self._dead > 64 and self._dead > self.COMPACT_RATIO * len(self._cols["name"]):
+            self._compact()
+        return view
+
+    def keys(self):
+        return self._index.keys()
+
+    def values(self):
+        return [self._view(row) for row in self._index.values()]
+
+    def items(self):
+        return [(key, self._view(row)) for key, row in self._index.items()]
+
+    def columns(self, fields):
+        """``{field: Liste}`` der Spalten ``fields`` in Schlüsselreihenfolge."""
+        rows = list(self._index.values())
+        return {field: self._take(field, rows) if rows else [] for field in fields}
+
+    def revisions(self):
+        """(Schlüssel, ``None``-Referenzen, Revisionen) – die Revision bestimmt den Zeileninhalt."""
+        rows = list(self._index.values())
+        return list(self._index.keys()), [None] * len(rows), self._take("rev", rows) if rows else []
+
+    def copy(self):
+        """Unabhängige Kopie (kompakt, ohne ausgegebene Sichten)."""
+        new = AttributeTable()
+        rows = list(self._index.values())
+        new._cols = {field: [col[row] for row in rows] for field, col in self._cols.items()}
+        new._index.update(zip(self._index.keys(), range(len(rows))))
+        return new
+
+    def __deepcopy__(self, memo):
+        import copy
+        new = self.copy()
+        for field in ("value",):     # veränderliche Werte (list/json) entkoppeln
+            new._cols[field] = copy.deepcopy(new._cols[field], memo)
+        return new
+
+    def __getstate__(self):
+        new = self.copy()
+        return {"index": list(new._index.items()), "cols": new._cols}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self._index.update(state["index"])
+        self._cols = state["cols"]
+
+    def __repr__(self):
+        return "AttributeTable({})".format(list(self._index.keys()))
+
+    # --- Spaltensichten ------------------------------------------------------
+    def to_frame(self, part=None):
+        """Attribute als ``pandas.DataFrame`` (Spalten = ``Metadata.ATTRIBUTEKEYS``).
+
+        Spaltenweise gebaut (ein ``itemgetter`` je Spalte) statt Zeile für Zeile.
+
+        :param part: ``None`` (alle), ``"user"`` oder ``"sdata"`` (Partition nach dem
+          ``_sdata``-Namensprefix, wie ``Metadata.user_attributes``/``sdata_attributes``).
+        :return: DataFrame mit Index ``key`` (Attributname), sortiert nach Schlüssel.
+        """
+        names = self._cols["name"]
+        rows = list(self._index.values())
+        if part is not None:
+            want_sdata = part == "sdata"
+            rows = [row for row in rows if names[row].startswith(SDATA_PREFIX) is want_sdata]
+        if not rows:                        # wie Metadata._to_dataframe: leere object-Spalten
+            frame = pd.DataFrame(columns=list(FRAME_FIELDS))
+            frame.index.name = "key"
+            return frame
+        columns = {field: self._take(field, rows) for field in FRAME_FIELDS}
+        frame = pd.DataFrame(columns, columns=list(FRAME_FIELDS),
+                             index=pd.Index(columns["name"], name="key"))
+        return frame
+
+    def _take(self, field, rows):
+        """Spalte ``field`` an den Zeilen ``rows`` (``itemgetter`` statt Python-Schleife)."""
+        if len(rows) == 1:
+            return [self._cols[field][rows[0]]]
+        return list(operator.itemgetter(*rows)(self._cols[field]))
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Registry austauschbarer Kompressions-Codecs mit Stufen-Presets.
+
+Jeder :class:`Codec` kann Bytes am Stück (``compress``/``decompress``) und als
+Strom (``writer``/``reader`` um ein binäres File-Objekt) verarbeiten. Eingebaut:
+
+========  =======================  ==========================================
+Name      Backend                  Presets ``fast`` / ``default`` / ``archive``
+========  =======================  ==========================================
+none      –                        –
+gzip      ``gzip`` (stdlib)        1 / 6 / 9
+bz2       ``bz2`` (stdlib)         1 / 9 / 9
+lzma      ``lzma`` (stdlib, xz)    0 / 6 / 9 (``| PRESET_EXTREME``)
+zstd      ``zstandard`` (optional) 1 / 3 / 19
+lz4       ``lz4.frame`` (optional) 0 / 0 / 16
+========  =======================  ==========================================
+
+zstd und lz4 werden nur registriert, wenn das jeweilige Paket installiert ist
+(``pip install "sdata[zstd]"`` bzw. ``"sdata[lz4]"``); :func:`get_codec` nennt
+sonst das fehlende Paket. Eigene Codecs kommen über :func:`register_codec` dazu.
+:func:`detect_codec` erkennt den Codec komprimierter Daten an ihren Magic Bytes.
+"""
+import bz2
+import gzip
+import io
+import lzma
+
+try:  # optionales zstd-Backend
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - abhängig von der Umgebung
+    _zstd = None
+
+try:  # optionales lz4-Backend
+    import lz4.frame as _lz4
+except ImportError:  # pragma: no cover - abhängig von der Umgebung
+    _lz4 = None
+
+__all__ = ["Codec", "CODECS", "register_codec", "get_codec", "detect_codec", "PRESETS"]
+
+#: Namen der Stufen-Presets
+PRESETS = ("fast", "default", "archive")
+
+#: optionale Codecs -> Installationshinweis
+_OPTIONAL = {"zstd": 'pip install "sdata[zstd]" (zstandard)',
+             "lz4": 'pip install "sdata[lz4]" (lz4)'}
+
+
+class _Unclosable(io.RawIOBase):
+    """Reicht an ein fremdes File-Objekt durch, ohne es beim ``close`` zu schließen."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def writable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def write(self, data):
+        return self._fileobj.write(data)
+
+    def readinto(self, buffer):
+        data = self._fileobj.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def flush(self):
+        self._fileobj.flush()
+
+
+class Codec(object):
+    """Ein Kompressionsverfahren mit Einmal- und Strom-API.
+
+    :param name: Registry-Name
+    :param compress: ``compress(data: bytes, level: int) -> bytes``
+    :param decompress: ``decompress(data: bytes) -> bytes``
+    :param writer: ``writer(fileobj, level) -> binärer Schreib-Strom``
+    :param reader: ``reader(fileobj) -> binärer Lese-Strom``
+    :param levels: Stufe je Preset (``fast``/``default``/``archive``)
+    :param magic: Präfix komprimierter Daten (für :func:`detect_codec`)
+    :param suffix: übliche Dateiendung
+    """
+
+    def __init__(self, name, compress, decompress, writer, reader, levels, magic=b"", suffix=""):
+        self.name = name
+        self._compress = compress
+        self._decompress = decompress
+        self._writer = writer
+        self._reader = reader
+        self.levels = dict(levels)
+        self.magic = magic
+        self.suffix = suffix
+
+    def __repr__(self):
+        return "<Codec:{}>".format(self.name)
+
+    def level(self, level="default"):
+        """Preset-Name oder Zahl → Stufe des Codecs."""
+        if isinstance(level, str):
+            try:
+                return self.levels[level]
+            except KeyError:
+                raise ValueError("unknown level preset {!r} (use one of {})".format(level, PRESETS))
+        return int(level)
+
+    def compress(self, data, level="default"):
+        """``data`` am Stück komprimieren."""
+        return self._compress(bytes(data), self.level(level))
+
+    def decompress(self, data):
+        """``data`` am Stück dekomprimieren."""
+        return self._decompress(bytes(data))
+
+    def writer(self, fileobj, level="default"):
+        """Schreib-Strom, der komprimiert in ``fileobj`` schreibt.
+
+        ``close()`` des Stroms schreibt den Abschluss, lässt ``fileobj`` aber offen.
+        """
+        return self._writer(fileobj, self.level(level))
+
+    def reader(self, fileobj):
+        """Lese-Strom, der aus ``fileobj`` dekomprimiert (``fileobj`` bleibt offen)."""
+        return self._reader(fileobj)
+
+
+#: Registry: Name -> :class:`Codec`
+CODECS = {}
+
+
+def register_codec(codec):
+    """Codec unter ``codec.name`` registrieren (ersetzt einen vorhandenen)."""
+    CODECS[codec.name] = codec
+    return codec
+
+
+def get_codec(name):
+    """Codec zu ``name`` (oder ein :class:`Codec` unverändert).
+
+    :raises ImportError: für einen bekannten, aber nicht installierten Codec
+    :raises ValueError: für einen unbekannten Namen
+    """
+    if isinstance(name, Codec):
+        return name
+    key = "none" if name is None else str(name).lower()
+    codec = CODECS.get(key)
+    if codec is not None:
+        return codec
+    if key in _OPTIONAL:
+        raise ImportError("codec {!r} is not available: {}".format(key, _OPTIONAL[key]))
+    raise ValueError("unknown codec {!r} (available: {})".format(name, sorted(CODECS)))
+
+
+def detect_codec(data):
+    """Codec zu komprimierten Daten (Magic Bytes) oder ``CODECS["none"]``."""
+    head = bytes(data[:8])
+    for codec in CODECS.values():
+        if codec.magic and head.startswith(codec.magic):
+            return codec
+    return CODECS["none"]
+
+
+register_codec(Codec(
+    "none", lambda data, level: data, lambda data: data,
+    lambda fileobj, level: io.BufferedWriter(_Unclosable(fileobj)),
+    lambda fileobj: io.BufferedReader(_Unclosable(fileobj)),
+    {"fast": 0, "default": 0, "archive": 0}))
+
+register_codec(Codec(
+    "gzip", lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), gzip.decompress,
+    lambda fileobj, level: gzip.GzipFile(filename="", fileobj=fileobj, mode="wb",
+                                         compresslevel=level, mtime=0),
+    lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode="rb"),
+    {"fast": 1, "default": 6, "archive": 9}, magic=b"\x1f\x8b", suffix=".gz"))
+
+register_codec(Codec(
+    "bz2", lambda data, level: bz2.compress(data, max(1, level)), bz2.decompress,
+    lambda fileobj, level: bz2.BZ2File(_Unclosable(fileobj), mode="wb", compresslevel=max(1, level)),
+    lambda fileobj: bz2.BZ2File(_Unclosable(fileobj), mode="rb"),
+    {"fast": 1, "default": 9, "archive": 9}, magic=b"BZh", suffix=".bz2"))
+
+register_codec(Codec(
+    "lzma", lambda data, level: lzma.compress(data, preset=level), lzma.decompress,
+    lambda fileobj, level: lzma.LZMAFile(_Unclosable(fileobj), mode="wb", preset=level),
+    lambda fileobj: lzma.LZMAFile(_Unclosable(fileobj), mode="rb"),
+    {"fast": 0, "default": 6, "archive": 9 | lzma.PRESET_EXTREME},
+    magic=b"\xfd7zXZ\x00", suffix=".xz"))
+
+if _zstd is not None:  # pragma: no cover - abhängig von der Umgebung
+    register_codec(Codec(
+        "zstd", lambda data, level: _zstd.ZstdCompressor(level=level).compress(data),
+        lambda data: _zstd.ZstdDecompressor().decompressobj().decompress(data),
+        lambda fileobj, level: _zstd.ZstdCompressor(level=level).stream_writer(fileobj, closefd=False),
+        lambda fileobj: io.BufferedReader(_zstd.ZstdDecompressor().stream_reader(fileobj, closefd=False)),
+        {"fast": 1, "default": 3, "archive": 19}, magic=b"\x28\xb5\x2f\xfd", suffix=".zst"))
+
+if _lz4 is not None:  # pragma: no cover - abhängig von der Umgebung
+    register_codec(Codec(
+        "lz4", lambda data, level: _lz4.compress(data, compression_level=level), _lz4.decompress,
+        lambda fileobj, level: _lz4.LZ4FrameFile(_Unclosable(fileobj), mode="wb", compression_level=level),
+        lambda fileobj: _lz4.LZ4FrameFile(_Unclosable(fileobj), mode="rb"),
+        {"fast": 0, "default": 0, "archive": 16}, magic=b"\x04\x22\x4d\x18", suffix=".lz4"))
@@ -25,6 +25,7 @@ Designziele:
 import base64
 import binascii
 import datetime
+import functools
 import json as _json
 import re
 from decimal import Decimal, InvalidOperation
@@ -38,6 +39,7 @@ from sdata.timestamp import TimeStamp
 __all__ = [
     "DtypeError", "DtypeSpec", "LangString", "register", "get", "names", "resolve",
     "coerce", "xsd_map", "json_default", "XSD", "DTYPES", "DTYPES_INV",
+    "lookup", "parse_numbers",
 ]
 
 
@@ -390,8 +392,15 @@ class DtypeSpec:
 _REGISTRY = {}
 
 
+@functools.lru_cache(maxsize=None)
+def _lookup(dtype):
+    """Gecachte Auflösung ``dtype-Input -> DtypeSpec`` (siehe :func:`lookup`)."""
+    return _REGISTRY[resolve(dtype) or "str"]
+
+
 def register(spec):
     _REGISTRY[spec.name] = spec
+    _lookup.cache_clear()
 
 
 for _spec in [
@@ -474,6 +483,67 @@ def resolve(dtype):
     return "str"
 
 
+def lookup(dtype):
+    """Aufgelöste :class:`DtypeSpec` zu einem dtype-Input (String oder Klasse), gecacht.
+
+    Für Bulk-Pfade: ``lookup(dtype).coerce`` ist der vorkompilierte Coercer, ohne
+    ``resolve`` je Wert. ``None`` liefert wie :func:`coerce` die ``str``-Spec.
+    """
+    try:
+        return _lookup(dtype)
+    except TypeError:                            # unhashbarer dtype-Input
+        return _REGISTRY[resolve(dtype) or "str"]
+
+
+# --- Batch-Zahlenerkennung ------------------------------------------------------
+#: Whitespace, den ``int()``/``float()`` an den Rändern ignorieren (ASCII-Teil).
+_NUM_WS = r"\s*"
+_NUM_DIGITS = r"\d(?:_?\d)*"
+#: exakt die ASCII-Literale, die ``int(text)`` akzeptiert
+_INT_LITERAL = re.compile(r"{0}[+-]?{1}{0}".format(_NUM_WS, _NUM_DIGITS), re.ASCII)
+#: exakt die ASCII-Literale, die ``float(text)`` akzeptiert
+_FLOAT_LITERAL = re.compile(
+    r"{0}[+-]?(?:(?:{1}\.(?:{1})?|\.{1}|{1})(?:[eE][+-]?{1})?|inf(?:inity)?|nan){0}"
+    .format(_NUM_WS, _NUM_DIGITS), re.ASCII | re.IGNORECASE)
+
+
+def parse_numbers(texts):
+    """Erkenne Zahlen in vielen Strings auf einmal – ohne Exception je Wert.
+
+    Liefert je Text dasselbe wie ``try: int(text)`` / ``try: float(text)`` (in
+    dieser Reihenfolge): vorkompilierte Literal-Muster entscheiden, nur Treffer
+    werden konvertiert. Nicht-ASCII-Texte (Unicode-Ziffern/-Whitespace) prüft der
+    skalare Rückfall.
+
+    :param texts: Sequenz von ``str``
+    :return: Liste aus ``int``, ``float`` oder ``None`` (keine Zahl)
+    """
+    int_match = _INT_LITERAL.fullmatch
+    float_match = _FLOAT_LITERAL.fullmatch
+    numbers = []
+    for text in texts:
+        if not text.isascii():
+            numbers.append(_parse_number(text))
+        elif int_match(text):
+            numbers.append(int(text))
+        elif float_match(text):
+            numbers.append(float(text))
+        else:
+            numbers.append(None)
+    return numbers
+
+
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 def coerce(value, dtype, strict=False):
     """Überführe ``value`` in ``dtype`` (String oder Klasse)."""
     spec = _REGISTRY[resolve(dtype) or "str"]
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Identity-Map für sdata-Objekte (Schlüssel: ``sname``).
+
+Objekte verweisen über ``_sdata_parent_sname``/``_sdata_project_sname`` aufeinander.
+Wer solche Ketten auflöst, lädt ohne Cache dieselben Eltern immer wieder aus dem
+Speicher und instanziiert sie neu. :class:`IdentityMap` hält dafür
+
+* **schwache Referenzen** auf alle registrierten, noch lebenden Objekte – solange
+  ein Objekt irgendwo benutzt wird, liefert die Map genau diese Instanz, und
+* einen **größenbeschränkten LRU** (starke Referenzen) der zuletzt geladenen
+  Objekte, damit kurz nicht referenzierte Eltern nicht sofort neu geladen werden.
+
+Zu jedem Eintrag kann eine Prüfsumme (z. B. der im Store abgelegte
+``sha3_256``/ETag) gespeichert werden; weicht die beim Nachschlagen übergebene
+Prüfsumme ab, wird der Eintrag verworfen und neu geladen.
+
+.. code-block:: python
+
+    def loader(sname):
+        return Base.from_dict(store_lookup(sname))
+
+    ancestors = obj.ancestors(loader)            # über die prozessweite IDENTITY_MAP
+    parent = IDENTITY_MAP.resolve(obj.metadata.get(obj.SDATA_PARENT_SNAME).value, loader)
+
+:data:`IDENTITY_MAP` ist die prozessweite Instanz; Zugriffe sind thread-sicher.
+"""
+import threading
+import weakref
+from collections import OrderedDict
+
+__all__ = ["IdentityMap", "IDENTITY_MAP"]
+
+#: Marker für "kein Prüfsummen-Abgleich"
+_ANY = object()
+
+
+class IdentityMap(object):
+    """sname → Objekt; schwache Referenzen für lebende Objekte plus LRU.
+
+    :param maxsize: maximale Anzahl stark gehaltener, zuletzt benutzter Objekte
+        (0 = nur schwache Referenzen)
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = int(maxsize)
+        self._live = {}               # sname -> (weakref, checksum)
+        self._lru = OrderedDict()     # sname -> Objekt (starke Referenz)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return sum(1 for ref, _ in self._live.values() if ref() is not None)
+
+    def __contains__(self, sname):
+        return self.get(sname) is not None
+
+    def _forget(self, sname, ref):
+        """weakref-Callback: Eintrag entfernen, falls er noch auf ``ref`` zeigt."""
+        with self._lock:
+            entry = self._live.get(sname)
+            if entry is not None and entry[0] is ref:
+                del self._live[sname]
+
+    def _touch(self, sname, obj):
+        if self.maxsize <= 0:
+            return
+        lru = self._lru
+        lru[sname] = obj
+        lru.move_to_end(sname)
+        while len(lru) > self.maxsize:
+            lru.popitem(last=False)
+
+    def register(self, obj, checksum=None, sname=None):
+        """Objekt unter seinem ``sname`` eintragen (ersetzt einen älteren Eintrag).
+
+        :param obj: Objekt mit ``sname`` (z. B. :class:`~sdata.base.Base`)
+        :param checksum: optionale Prüfsumme des geladenen Stands
+        :param sname: abweichender Schlüssel (Default ``obj.sname``)
+        :return: obj
+        """
+        sname = obj.sname if sname is None else sname
+        with self._lock:
+            ref = weakref.ref(obj, lambda r, s=sname: self._forget(s, r))
+            self._live[sname] = (ref, checksum)
+            self._touch(sname, obj)
+        return obj
+
+    def get(self, sname, checksum=_ANY):
+        """Lebendes oder gecachtes Objekt zu ``sname`` oder None.
+
+        :param sname: Schlüssel
+        :param checksum: falls angegeben: aktuelle Prüfsumme; bei Abweichung wird
+            der Eintrag verworfen (None)
+        :return: Objekt oder None
+        """
+        with self._lock:
+            entry = self._live.get(sname)
+            obj = entry[0]() if entry is not None else None
+            if obj is None:
+                return None
+            if checksum is not _ANY and checksum != entry[1]:
+                self.discard(sname)
+                return None
+            self._touch(sname, obj)
+            return obj
+
+    def resolve(self, sname, loader, checksum=_ANY):
+        """Objekt zu ``sname`` aus der Map oder über ``loader`` (dann registriert).
+
+        :param sname: Schlüssel
+        :param loader: ``loader(sname) -> Objekt | None`` (lädt aus dem Speicher)
+        :param checksum: aktuelle Prüfsumme (siehe :meth:`get`); wird mit dem frisch
+            geladenen Objekt gespeichert
+        :return: Objekt oder None (nicht ladbar)
+        """
+        with self._lock:
+            obj = self.get(sname, checksum)
+            if obj is not None:
+                self.hits += 1
+                return obj
+            self.misses += 1
+        obj = loader(sname)
+        if obj is None:
+            return None
+        return self.register(obj, None if checksum is _ANY else checksum, sname=sname)
+
+    def ancestors(self, obj, loader, relation="parent", checksum=None):
+        """Kette der über ``relation`` referenzierten Objekte (nächstes zuerst).
+
+        Jeder Vorfahr wird höchstens einmal geladen; Zyklen und nicht ladbare
+        snames beenden die Kette.
+
+        :param obj: Startobjekt (``Base``)
+        :param loader: ``loader(sname) -> Objekt | None``
+        :param relation: ``"parent"`` oder ``"project"``
+        :param checksum: optional ``checksum(sname) -> Prüfsumme`` für die Invalidierung
+        :return: Liste von Objekten
+        """
+        key = obj.SDATA_PARENT_SNAME if relation == "parent" else obj.SDATA_PROJECT_SNAME
+        chain = []
+        seen = {obj.sname}
+        current = obj
+        while True:
+            attr = current.metadata.get(key)
+            sname = attr.value if attr is not None else None
+            if not sname or sname in seen:
+                return chain
+            seen.add(sname)
+            if checksum is None:
+                current = self.resolve(sname, loader)
+            else:
+                current = self.resolve(sname, loader, checksum(sname))
+            if current is None:
+                return chain
+            chain.append(current)
+
+    def discard(self, sname):
+        """Eintrag zu ``sname`` entfernen (schwach und LRU)."""
+        with self._lock:
+            self._live.pop(sname, None)
+            self._lru.pop(sname, None)
+
+    def clear(self):
+        """Alle Einträge und Zähler zurücksetzen."""
+        with self._lock:
+            self._live.clear()
+            self._lru.clear()
+            self.hits = self.misses = 0
+
+
+#: prozessweite Identity-Map
+IDENTITY_MAP = IdentityMap()
@@ -0,0 +1,202 @@
+"""Streaming-Persistenz für Sammlungen von sdata-Objekten als NDJSON.
+
+Eine Zeile je Objekt (``Base.to_dict()`` als kompaktes JSON), optional gzip- oder
+zstd-komprimiert. Schreiben und Lesen arbeiten zeilenweise: ein Projekt-Dump von
+mehreren GB muss weder beim Export noch beim Import komplett im Speicher liegen.
+
+* :class:`NDJSONWriter` / :func:`write_ndjson` — Objekte anhängen (Datei oder Stream).
+* :func:`read_ndjson` — Generator, der :class:`~sdata.base.Base`-Instanzen lazy
+  liefert; mit ``workers > 0`` werden Blöcke von Zeilen in einem Thread-Pool
+  dekodiert (Reihenfolge bleibt erhalten, höchstens ``2 * workers`` Blöcke im Flug).
+
+Die Kompression wird aus der Dateiendung abgeleitet (``.gz``, ``.zst``, ``.lz4``,
+``.bz2``, ``.xz``), kann aber explizit gesetzt werden; verwendet werden die Codecs
+aus :mod:`sdata.compression` (zstd/lz4 über die optionalen Pakete).
+"""
+from __future__ import annotations
+
+import collections
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Type, Union
+
+from sdata.compression import CODECS, get_codec
+from sdata.dtypes import json_default
+
+__all__ = ["NDJSONWriter", "write_ndjson", "read_ndjson", "HAVE_ZSTD"]
+
+#: True, wenn das ``zstandard``-Paket für ``compression="zstd"`` verfügbar ist
+HAVE_ZSTD = "zstd" in CODECS
+
+#: Endungen neben ``Codec.suffix`` (auch für nicht installierte Codecs -> ImportError)
+_SUFFIXES = {".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd", ".lz4": "lz4", ".lzma": "lzma"}
+
+Target = Union[str, os.PathLike, BinaryIO]
+
+
+def _compression(target: Target, compression: Optional[str]) -> Optional[str]:
+    """``"infer"`` über die Dateiendung auflösen; ``None`` = unkomprimiert."""
+    if compression != "infer":
+        return None if compression is None else get_codec(compression).name
+    if not isinstance(target, (str, os.PathLike)):
+        return None
+    suffix = os.path.splitext(os.fspath(target))[1].lower()
+    for codec in CODECS.values():
+        if codec.suffix and codec.suffix == suffix:
+            return codec.name
+    return _SUFFIXES.get(suffix)
+
+
+def _open(target: Target, mode: str, compression: Optional[str], compresslevel):
+    """Binären Stream öffnen; gibt ``(stream, close)`` zurück.
+
+    ``close`` schließt den Kompressionsstrom und eine selbst geöffnete Datei; ein
+    übergebener Stream bleibt offen.
+    """
+    name = _compression(target, compression)
+    codec = get_codec(name) if name is not None else None
+    is_path = isinstance(target, (str, os.PathLike))
+    raw = open(target, mode + "b") if is_path else target
+    if codec is None:
+        return raw, raw.close if is_path else raw.flush
+    stream = codec.writer(raw, compresslevel) if mode == "w" else codec.reader(raw)
+
+    def close():
+        try:
+            stream.close()
+        finally:
+            if is_path:
+                raw.close()
+    return stream, close
+
+
+class NDJSONWriter(object):
+    """Schreibt sdata-Objekte zeilenweise als NDJSON.
+
+    .. code-block:: python
+
+        with NDJSONWriter("project.ndjson.gz") as writer:
+            for obj in objects:
+                writer.write(obj)
+
+    :param target: Pfad oder binärer Stream (ein übergebener Stream bleibt offen)
+    :param compression: ``"infer"`` (Default, aus der Endung), ``None`` oder ein Codec-Name
+        aus :data:`sdata.compression.CODECS` (``"gzip"``, ``"zstd"``, ``"lz4"``, …)
+    :param compresslevel: Stufe oder Preset (``"fast"``, ``"default"``, ``"archive"``)
+    """
+
+    def __init__(self, target: Target, compression: Optional[str] = "infer",
+                 compresslevel: Union[int, str] = "default"):
+        self._stream, self._close = _open(target, "w", compression, compresslevel)
+        self.count = 0
+
+    @staticmethod
+    def encode(obj: Any) -> bytes:
+        """Eine NDJSON-Zeile (inkl. ``\\n``) für ``obj`` (``Base`` oder dict)."""
+        d = obj if isinstance(obj, dict) else obj.to_dict()
+        return json.dumps(d, separators=(",", ":"), ensure_ascii=False,
+                          default=json_default).encode("utf-8") + b"\n"
+
+    def write(self, obj: Any) -> None:
+        """Ein Objekt anhängen."""
+        self._stream.write(self.encode(obj))
+        self.count += 1
+
+    def write_many(self, objects: Iterable[Any]) -> int:
+        """Alle Objekte eines Iterables anhängen; gibt die Anzahl zurück."""
+        write = self._stream.write
+        encode = self.encode
+        n = 0
+        for obj in objects:
+            write(encode(obj))
+            n += 1
+        self.count += n
+        return n
+
+    def close(self) -> None:
+        """Kompressionsstrom abschließen; selbst geöffnete Dateien schließen."""
+        if self._stream is None:
+            return
+        self._stream = None
+        self._close()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def write_ndjson(objects: Iterable[Any], target: Target, compression: Optional[str] = "infer",
+                 compresslevel: Union[int, str] = "default") -> int:
+    """Objekte als NDJSON schreiben (siehe :class:`NDJSONWriter`).
+
+    :param objects: Iterable von ``Base``-Objekten (oder ``to_dict()``-Dicts)
+    :param target: Pfad oder binärer Stream
+    :param compression: ``"infer"``, ``None`` oder ein Codec-Name (``"gzip"``, ``"zstd"``, …)
+    :param compresslevel: Stufe oder Preset (``"fast"``, ``"default"``, ``"archive"``)
+    :return: Anzahl geschriebener Objekte
+    """
+    with NDJSONWriter(target, compression=compression, compresslevel=compresslevel) as writer:
+        return writer.write_many(objects)
+
+
+def _chunks(lines: Iterable[bytes], size: int) -> Iterator[List[bytes]]:
+    chunk = []
+    for line in lines:
+        if line.strip():
+            chunk.append(line)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_ndjson(source: Target, cls: Optional[Type] = None, lazy: bool = False,
+                workers: int = 0, chunksize: int = 256,
+                compression: Optional[str] = "infer") -> Iterator[Any]:
+    """sdata-Objekte aus einem NDJSON-Strom lazy lesen.
+
+    .. code-block:: python
+
+        for obj in read_ndjson("project.ndjson.gz", workers=4):
+            ...
+
+    :param source: Pfad oder binärer Stream
+    :param cls: Klasse, deren ``from_dict`` die Objekte baut (Default :class:`~sdata.base.Base`)
+    :param lazy: Attributwerte erst beim ersten Zugriff koerzieren (siehe ``Metadata.from_dict``)
+    :param workers: > 0: Blöcke in einem Thread-Pool dekodieren (Reihenfolge bleibt erhalten;
+        lohnt vor allem ohne GIL bzw. wenn ``from_dict`` I/O macht)
+    :param chunksize: Zeilen je Block
+    :param compression: ``"infer"``, ``None`` oder ein Codec-Name (``"gzip"``, ``"zstd"``, …)
+    :return: Generator von Objekten in Dateireihenfolge
+    """
+    if cls is None:
+        from sdata.base import Base as cls
+    loads = json.loads
+    if lazy:  # Subklassen-from_dict ohne lazy-Parameter bleiben gültig
+        def decode(chunk):
+            return [cls.from_dict(loads(line), lazy=True) for line in chunk]
+    else:
+        def decode(chunk):
+            return [cls.from_dict(loads(line)) for line in chunk]
+
+    stream, close = _open(source, "r", compression, None)
+    try:
+        chunks = _chunks(stream, max(1, int(chunksize)))
+        if workers <= 0:
+            for chunk in chunks:
+                yield from decode(chunk)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.submit(decode, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+    finally:
+        close()
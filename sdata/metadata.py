@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from sdata.timestamp import TimeStamp
 import sdata.dtypes as dtypes
+from sdata import binpack
 import datetime
 from dateutil.parser import parse as parse_date
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
@@ -13,7 +14,16 @@ import json
 import os
 import hashlib
 import re
+import sys
+import array
 import copy
+import itertools
+import operator
+import threading
+import types
+import weakref
+import zlib
+from decimal import Decimal
 from sdata.contrib.sortedcontainers.sorteddict import SortedDict
 
 def extract_name_unit(value):
@@ -62,8 +72,124 @@ def _to_utc(dt: datetime.datetime) -> datetime.datetime:
         return dt.replace(tzinfo=datetime.timezone.utc)
     return dt.astimezone(datetime.timezone.utc)
 
+def _intern(value):
+    """Interniere kurze, häufig wiederkehrende Strings (Name/Einheit/dtype/...).
+
+    Millionen Attribute teilen sich wenige verschiedene Namen, Einheiten und
+    Beschreibungen; ``sys.intern`` lässt sie auf *ein* String-Objekt zeigen.
+    Nicht-Strings werden unverändert zurückgegeben.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+#: globale Revisionsuhr: jede Änderung an einem (fertig konstruierten) Attribut
+#: zieht sie vor und setzt damit dessen ``_rev``. Die Caches eines
+#: :class:`Metadata`-Objekts hängen dagegen an seiner eigenen Revision, die das
+#: Attribut über seinen Besitzer (``_owner``) nachführt (siehe ``Attribute._touch``).
+_REV = [0]
+
+#: schützt die Listen der Copy-on-write-Teilhaber (:meth:`Metadata.copy`)
+_COW_LOCK = threading.Lock()
+
+#: Werttypen, die beim Kopieren geteilt werden dürfen (unveränderlich)
+_SHARED_VALUE_TYPES = frozenset([
+    type(None), str, int, float, bool, bytes, complex, Decimal, datetime.date,
+    datetime.time, datetime.datetime, datetime.timedelta, dtypes.LangString,
+    np.float64, np.int64, np.bool_,
+])
+
+_VALUE = operator.attrgetter("_value")
+_REV_OF = operator.attrgetter("_rev")
+
+def _copy_on_write() -> bool:
+    """``True``, wenn pandas Copy-on-Write verwendet (Default ab pandas 3).
+
+    Dann sind flache Kopien von DataFrames unabhängig (Schreiben kopiert erst);
+    sonst muss tief kopiert werden.
+    """
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return bool(getattr(pd.options.mode, "copy_on_write", False) is True)
+
+
+#: Attributfelder, die :meth:`Metadata.to_bytes` per Wörterbuch (Tabelle + Index) kodiert
+_DICT_FIELDS = ("unit", "dtype", "description", "label", "required", "ontology")
+
+#: Index-Breite (Bytes) -> ``array``-Typecode für wörterbuchkodierte Spalten
+_INDEX_TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+
+def _dict_encode(column, binary):
+    """Spalte als ``[tabelle, index]``; ``index`` als little-endian Bytes (``binary``) oder Liste."""
+    table = list(dict.fromkeys(column))
+    position = {value: i for i, value in enumerate(table)}
+    index = list(map(position.__getitem__, column))
+    if not binary:
+        return [table, index]
+    width = 1 if len(table) <= 0x100 else 2 if len(table) <= 0x10000 else 4
+    packed = array.array(_INDEX_TYPECODES[width], index)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return [table, packed.tobytes()]
+
+
+def _dict_decode(entry, count):
+    """Umkehrung von :func:`_dict_encode` für ``count`` Zeilen."""
+    table, index = entry
+    if isinstance(index, (bytes, bytearray)):
+        packed = array.array(_INDEX_TYPECODES[len(index) // count if count else 1])
+        packed.frombytes(index)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        index = packed
+    return list(map(table.__getitem__, index))
+
+
+def _dump_document(doc, fmt):
+    """Dokument (dict) als ``msgpack``- oder kompakte ``json``-Bytes."""
+    if fmt == "msgpack":
+        return binpack.packb(doc, default=dtypes.json_default)
+    if fmt == "json":
+        return json.dumps(doc, default=dtypes.json_default, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+    raise ValueError(f"unknown format {fmt!r} (msgpack|json)")
+
+
+def _load_document(data, kind):
+    """Bytes von :func:`_dump_document` lesen (Format am ersten Byte erkannt)."""
+    if bytes(data[:1]).lstrip() in (b"{", b""):
+        doc = json.loads(bytes(data).decode("utf-8"))
+    else:
+        doc = binpack.unpackb(data)
+    if not isinstance(doc, dict) or doc.get("sdata") != kind:
+        raise ValueError(f"not an sdata {kind} document")
+    return doc
+
+
+class _Lazy(object):
+    """Noch nicht koerzierter Rohwert eines Attributs (``from_dict(..., lazy=True)``).
+
+    Steht im Slot ``_value``; der erste Zugriff auf ``Attribute.value`` koerziert ihn
+    über den dtype des Attributs und ersetzt ihn durch das Ergebnis.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+
 class Attribute(object):
-    """Attribute class"""
+    """Attribute class
+
+    Kompakte Speicherung: feste ``__slots__`` statt ``__dict__``; Name, Einheit,
+    dtype, Beschreibung, Label und Ontologie werden interniert, sodass gleiche
+    Strings über alle Attribute geteilt werden.
+    """
+
+    __slots__ = ("_strict", "_name", "_value", "_unit", "_description", "_label",
+                 "_ontology", "_dtype", "_required", "_rev", "_owner")
 
     # Kompat-Aliasse: identische Inhalte für die 6 Alt-dtypes; die Registry in
     # :mod:`sdata.dtypes` ist die Single Source of Truth (+ bytes/json/uri).
@@ -84,14 +210,17 @@ class Attribute(object):
         :param strict: bei True wirft fehlgeschlagene Coercion ``dtypes.DtypeError``
             statt still zu degradieren (Default False = bisheriges Verhalten)
         """
+        self._rev = None                    # None: im Konstruktor, kein Revisions-Tick
+        self._owner = None                  # weakref (oder Tupel) der besitzenden Metadata
         self._strict: bool = bool(strict)
         self._name: str = None
         self._value: Any = None
-        self._unit:str = "-"
-        self._description:str = ""
-        self._label:str = ""
-        self._ontology:str = ""
-        self._dtype:str = "str"
+        self._unit: str = "-"
+        self._description: str = ""
+        self._label: str = ""
+        self._ontology: str = ""
+        self._dtype: str = "str"
+        self._required: bool = False
         dtype = kwargs.get("dtype", None) or self.guess_dtype(value)
         self._set_dtype(dtype)
         self.name = name
@@ -102,29 +231,60 @@ class Attribute(object):
         self._set_ontology(kwargs.get("ontology", ""))
         # set dtype first!
         self._set_value(value)
+        self._rev = _REV[0]
+
+    def _touch(self):
+        """Revision dieses Attributs auf einen neuen Tick der globalen Uhr setzen.
+
+        Läuft vor jeder Änderung und meldet sie dem Besitzer (bzw. den Besitzern):
+        dessen Caches und ``sha3_256`` folgen, und mit Kopien geteilte Attribute
+        werden zuvor aus diesen Kopien gelöst (Copy-on-write, :meth:`Metadata.copy`).
+        """
+        rev = self._rev
+        if rev is not None:
+            owner = self._owner
+            if owner is not None:
+                for ref in owner if type(owner) is tuple else (owner,):
+                    metadata = ref()
+                    if metadata is not None:
+                        metadata._attribute_changed(self, rev)
+            _REV[0] += 1
+            self._rev = _REV[0]
 
     def _get_name(self):
         return self._name
 
     def _set_name(self, value):
+        self._touch()
         if isinstance(value, str):
             try:
                 value = value.strip()[:256]
                 if len(value) > 0:
-                    self._name = value
+                    self._name = _intern(value)
                 else:
                     raise ValueError("empty Attribute.name")
             except ValueError as exp:
                 logger.warning("error Attribute.name: %s" % exp)
         else:
-            self._name = str(value).strip()[:256]
+            self._name = _intern(str(value).strip()[:256])
 
     name = property(fget=_get_name, fset=_set_name, doc="Attribute name")
 
     def _get_value(self):
-        return self._value
+        value = self._value
+        if type(value) is _Lazy:            # verzögerte Coercion (lazy=True), Ergebnis bleibt
+            value = self._value = self._coerce_lazy(value.raw)
+        return value
+
+    def _coerce_lazy(self, raw):
+        try:
+            return dtypes.lookup(self._dtype).coerce(raw)
+        except dtypes.DtypeError as exp:
+            logger.error("error Attribute.value: {}".format(exp))
+            return None
 
     def _set_value(self, value):
+        self._touch()
         spec = dtypes.get(self._dtype) or dtypes.get("str")
         try:
             self._value = spec.coerce(value, strict=self._strict)
@@ -166,13 +326,16 @@ class Attribute(object):
         :param value: dtype-String oder -Klasse
         :return:
         """
+        self._touch()
         name = dtypes.resolve(value)
         if name is None:
             return None
-        self._dtype = name
-        # Re-Cast eines bereits gesetzten Werts (während __init__ ist _value noch None)
-        if getattr(self, "_value", None) is not None:
-            self._set_value(self._value)
+        # Re-Cast eines bereits gesetzten Werts (während __init__ ist _value noch None);
+        # ein verzögerter Rohwert wird zuvor noch mit dem bisherigen dtype koerziert
+        current = self._get_value() if getattr(self, "_value", None) is not None else None
+        self._dtype = _intern(name)
+        if current is not None:
+            self._set_value(current)
 
     dtype = property(fget=_get_dtype, fset=_set_dtype, doc="Attribute type str")
 
@@ -180,9 +343,10 @@ class Attribute(object):
         return self._description
 
     def _set_description(self, value):
+        self._touch()
         if value is None:
             value = ""
-        self._description = str(value)
+        self._description = _intern(str(value))
 
     description = property(fget=_get_description, fset=_set_description, doc="Attribute description")
 
@@ -190,9 +354,10 @@ class Attribute(object):
         return self._label
 
     def _set_label(self, value):
+        self._touch()
         if value is None:
             value = ""
-        self._label = str(value)
+        self._label = _intern(str(value))
 
     label = property(fget=_get_label, fset=_set_label, doc="Attribute label")
 
@@ -200,7 +365,8 @@ class Attribute(object):
         return self._unit
 
     def _set_unit(self, value):
-        self._unit = value
+        self._touch()
+        self._unit = _intern(value)
 
     unit = property(fget=_get_unit, fset=_set_unit, doc="Attribute unit")
 
@@ -208,6 +374,7 @@ class Attribute(object):
         return self._required
 
     def _set_required(self, value):
+        self._touch()
         if value in [True, 1, "true", "True"]:
             self._required = True
         else:
@@ -219,12 +386,96 @@ class Attribute(object):
         return self._ontology
 
     def _set_ontology(self, value):
+        self._touch()
         if value is None:
             value = ""
-        self._ontology = str(value)
+        self._ontology = _intern(str(value))
 
     ontology = property(fget=_get_ontology, fset=_set_ontology, doc="Attribute ontology")
 
+    def __getstate__(self):
+        """Slot-Zustand für ``pickle``/``copy`` (ohne ``__dict__`` und Besitzer)."""
+        state = {key: getattr(self, key) for key in Attribute.__slots__
+                 if key != "_owner" and hasattr(self, key)}
+        state.update(getattr(self, "__dict__", {}))      # Subklassen mit __dict__
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "_owner", None)
+        object.__setattr__(self, "_rev", _REV[0])        # neues Objekt: Revision "jetzt"
+
+    def _clone(self):
+        """Eigenständige Kopie (Slots; veränderliche Werte wie Listen tief kopiert)."""
+        if type(self) is Attribute:
+            new = Attribute.__new__(Attribute)
+            new._strict = self._strict
+            new._name = self._name
+            new._value = self._value
+            new._unit = self._unit
+            new._description = self._description
+            new._label = self._label
+            new._ontology = self._ontology
+            new._dtype = self._dtype
+            new._required = self._required
+        else:
+            new = copy.copy(self)
+        if type(new._value) not in _SHARED_VALUE_TYPES:
+            new._value = copy.deepcopy(new._value)
+        new._owner = None
+        new._rev = _REV[0]
+        return new
+
+    @classmethod
+    def _bulk(cls, names, values, dtypes_, units, descriptions, labels, requireds, ontologies,
+              lazy=False):
+        """Viele (nicht-strikte) Attribute ohne Property-Umweg erzeugen.
+
+        Ergebnis wie ``Attribute(name, value, dtype=..., unit=..., ...)`` je Zeile, aber
+        mit je dtype einmal aufgelöstem Coercer (:func:`sdata.dtypes.lookup`). Die Namen
+        müssen nicht-leere Strings sein; ``dtypes_`` enthält dtype-Inputs (String/Klasse).
+        Mit ``lazy=True`` bleiben die Werte roh und werden erst beim ersten Zugriff auf
+        ``value`` koerziert.
+
+        :return: Liste von :class:`Attribute`
+        """
+        attrs = []
+        new = cls.__new__
+        rev = _REV[0]
+        for name, value, dtype, unit, description, label, required, ontology in zip(
+                names, values, dtypes_, units, descriptions, labels, requireds, ontologies):
+            spec = dtypes.lookup(dtype)
+            attr = new(cls)
+            attr._rev = rev
+            attr._owner = None
+            attr._strict = False
+            attr._name = _intern(name.strip()[:256])
+            attr._dtype = _intern(spec.name)
+            attr._unit = _intern(unit)
+            attr._description = "" if description is None else _intern(str(description))
+            attr._label = "" if label is None else _intern(str(label))
+            attr._ontology = "" if ontology is None else _intern(str(ontology))
+            attr._required = required in [True, 1, "true", "True"]
+            if lazy:
+                attr._value = _Lazy(value)
+                attrs.append(attr)
+                continue
+            try:
+                attr._value = spec.coerce(value)
+            except dtypes.DtypeError as exp:
+                logger.error("error Attribute.value: {}".format(exp))
+                attr._value = None
+            attrs.append(attr)
+        return attrs
+
+    @classmethod
+    def _from_state(cls, state):
+        """Eigenständiges Attribut aus einem :meth:`__getstate__`-Zustand."""
+        attr = cls.__new__(cls)
+        attr.__setstate__(state)
+        return attr
+
     def to_dict(self):
         """Return a dict of the attribute's items (name/value/unit/dtype/...)."""
         return {'name': self.name,
@@ -266,6 +517,129 @@ class Attribute(object):
         return interactive.attribute_html(self)
 
 
+class _DigestTree(object):
+    """Inkrementeller Merkle-Hash über die Attribute eines :class:`Metadata`-Objekts.
+
+    Blätter: ``sha3_256`` je Attribut über ``[key, name, value, unit, dtype,
+    description, label, required, ontology]`` als JSON. Die Blätter liegen in
+    ``BUCKETS`` festen Eimern (``crc32(key) % BUCKETS``); ein Eimer hasht seine
+    Blatt-Digests in Schlüsselreihenfolge, die Wurzel die Eimer-Digests. Das Ergebnis
+    hängt nur vom Inhalt ab und ist über Prozesse hinweg deterministisch.
+
+    Ein Blatt gilt, solange das Attribut dasselbe Objekt (``ref``) mit derselben
+    Revision (``_rev``) ist. Nach Änderungen am Container werden geänderte Blätter
+    über einen spaltenweisen Vergleich mit dem letzten Stand gefunden; Änderungen an
+    Attributen meldet der Besitzer direkt (:meth:`refresh_dirty`). Neu gehasht werden
+    nur diese Blätter, ihre Eimer und die Wurzel. Blätter mit veränderlichen Werten
+    (Listen, dicts) werden immer neu gehasht, da In-place-Änderungen keine Revision
+    ziehen.
+    """
+
+    BUCKETS = 256
+
+    __slots__ = ("keys", "refs", "revs", "positions", "digests", "buckets",
+                 "bucket_digests", "volatile", "root", "stamp")
+
+    def __init__(self):
+        self.keys = []                  # letzter Stand: Schlüssel, Attribute, Revisionen
+        self.refs = []
+        self.revs = []
+        self.positions = None           # key -> Index in keys (bei Bedarf)
+        self.digests = {}               # key -> Blatt-Digest
+        self.buckets = [{} for _ in range(self.BUCKETS)]      # key -> Blatt-Digest
+        self.bucket_digests = [b""] * self.BUCKETS
+        self.volatile = set()           # Schlüssel mit veränderlichem Wert
+        self.root = None
+        self.stamp = None
+
+    @staticmethod
+    def leaf(key, attr):
+        """Digest (bytes) des Attributs ``attr`` unter dem Schlüssel ``key``."""
+        leafstr = json.dumps([key] + attr.to_list(), default=dtypes.json_default)
+        return hashlib.sha3_256(leafstr.encode(errors="replace")).digest()
+
+    def _store(self, key, digest, dirty):
+        bucket = zlib.crc32(key.encode(errors="replace")) % self.BUCKETS
+        if digest is None:
+            self.buckets[bucket].pop(key, None)
+        else:
+            self.buckets[bucket][key] = digest
+        dirty.add(bucket)
+
+    def refresh(self, keys, refs, revs, attributes):
+        """Mit dem aktuellen Stand abgleichen und die Wurzel nachführen.
+
+        :param keys: Schlüssel (Liste)
+        :param refs: Attribute in ``keys``-Reihenfolge; ``None``, wenn die Revision
+          allein den Zeileninhalt bestimmt (columnar backend)
+        :param revs: Revisionen (``_rev``) in ``keys``-Reihenfolge
+        :param attributes: Container (``get`` liefert das Attribut zum Schlüssel)
+        """
+        if keys == self.keys:
+            changed = [keys[i] for i in itertools.compress(range(len(keys)), map(
+                operator.or_, map(operator.is_not, refs, self.refs),
+                map(operator.ne, revs, self.revs)))]
+            removed = ()
+        else:
+            old = dict(zip(self.keys, zip(self.refs, self.revs)))
+            changed = [key for key, ref, rev in zip(keys, refs, revs)
+                       if key not in old or old[key][0] is not ref or old[key][1] != rev]
+            removed = old.keys() - set(keys)
+        self.keys, self.refs, self.revs = keys, refs, revs
+        self.positions = None
+        dirty = set()
+        for key in removed:
+            del self.digests[key]
+            self.volatile.discard(key)
+            self._store(key, None, dirty)
+        self._update(self.volatile.union(changed), attributes, dirty)
+
+    def _update(self, keys, attributes, dirty):
+        for key in keys:
+            attr = attributes.get(key)
+            digest = self.leaf(key, attr)
+            if type(attr._value) in _SHARED_VALUE_TYPES:
+                self.volatile.discard(key)
+            else:
+                self.volatile.add(key)
+            if self.digests.get(key) != digest:
+                self.digests[key] = digest
+                self._store(key, digest, dirty)
+        for bucket in dirty:
+            digests = self.buckets[bucket]
+            self.bucket_digests[bucket] = hashlib.sha3_256(
+                b"".join(digests[key] for key in sorted(digests))).digest() if digests else b""
+        if dirty or self.root is None:
+            self.root = hashlib.sha3_256(b"".join(self.bucket_digests)).hexdigest()
+
+    def refresh_dirty(self, attrs, attributes):
+        """Nur die Blätter der geänderten Attribute ``attrs`` neu hashen.
+
+        Die Schlüssel folgen aus ``_name``; gibt ``False`` zurück, wenn ein Attribut
+        nicht (mehr) unter seinem Namen im Container liegt – dann ist ein
+        :meth:`refresh` nötig.
+        """
+        positions = self.positions
+        if positions is None:
+            positions = self.positions = {key: i for i, key in enumerate(self.keys)}
+        changed = []
+        for attr in attrs:
+            key = attr._name
+            i = positions.get(key)
+            ref = None if i is None else self.refs[i]
+            if i is None or attributes.get(key) is not attr or ref is not None and ref is not attr:
+                return False
+            changed.append((i, key, attr._rev))
+        for i, key, rev in changed:
+            self.revs[i] = rev
+        self._update(self.volatile.union(key for _, key, _ in changed), attributes, set())
+        return True
+
+    def refresh_volatile(self, attributes):
+        """Nur die Blätter mit veränderlichen Werten neu hashen."""
+        self._update(list(self.volatile), attributes, set())
+
+
 class Metadata(object):
     """Metadata container class
     
@@ -284,10 +658,33 @@ class Metadata(object):
     def __init__(self, **kwargs):
         """Metadata class
 
-        :param kwargs:
+        :param name: name of the metadata (default ``"N.N."``)
+        :param backend: attribute storage, ``"sorteddict"`` (default, one
+            :class:`Attribute` object per entry) or ``"columnar"`` (struct-of-arrays,
+            see :mod:`sdata.columnar`; fast ``df``/``udf``/``sdf`` views for wide
+            metadata)
         """
-        self._attributes = SortedDict()
+        backend = kwargs.get("backend") or "sorteddict"
+        self._ref = weakref.ref(self)   # Besitzer-Referenz der Attribute (``_owner``)
+        if backend == "columnar":
+            from sdata.columnar import AttributeTable
+            self._attributes = AttributeTable()
+            self._attributes._owner = self._ref
+        elif backend == "sorteddict":
+            self._attributes = SortedDict()
+        else:
+            raise ValueError(f"unknown Metadata backend {backend!r} (sorteddict|columnar)")
         self._name = kwargs.get("name") or "N.N."
+        self._version = 0          # Container-Version (add/set/pop/relabel)
+        self._revision = 0         # Änderungen an eigenen Attributen (über ``_owner``)
+        self._cache = {}           # abgeleitete Sichten (Partitionen, DataFrames)
+        self._cache_stamp = None
+        self._cow_epoch = None     # gesetzt: Kopie, die noch Attribute teilt
+        self._cow_index = None     # id(Attribut) -> [Schlüssel] der geteilten Attribute
+        self._cow_sources = None   # Quellen, deren Attribute diese Kopie noch teilt
+        self._cow_sharers = None   # WeakSet der Kopien, die Attribute von hier teilen
+        self._digest = None        # _DigestTree für sha3_256 (inkrementell)
+        self._dirty = None         # id -> seit dem letzten sha3_256 geänderte Attribute
 
     def _get_name(self):
         # Single Source of Truth: das reservierte _sdata_name-Attribut ist
@@ -299,41 +696,280 @@ class Metadata(object):
 
     def _set_name(self, value):
         self._name = str(value)
-        attr = self._attributes.get(self.RESERVED_NAME_KEY)
+        attr = self._owned(self.RESERVED_NAME_KEY)
         if attr is not None:
             attr.value = str(value)
 
     name = property(fget=_get_name, fset=_set_name, doc="Name of the Metadata")
 
     def _get_attributes(self):
+        self._cow_materialize()
         return self._attributes
 
     def _set_attributes(self, value):
+        self._cow_materialize()
         self._attributes = value
+        self._adopt_all()
+        self._changed()
 
     attributes = property(fget=_get_attributes, fset=_set_attributes, doc="returns Attributes")
 
+    # --- Besitz der Attribute -------------------------------------------------
+    def _adopt(self, attr):
+        """``attr`` meldet künftige Änderungen an dieses Objekt (``Attribute._owner``).
+
+        Das columnar backend übernimmt fremde Attribute nach Wert; seine Zeilen-Sichten
+        melden über die Tabelle. Umgekehrt wird eine Zeilen-Sicht hier nach Wert als
+        eigenständiges :class:`Attribute` übernommen. Ein übernommenes Attribut gehört
+        danach dieser Kopie (Identität bleibt erhalten); teilt sie es noch unter
+        anderen Schlüsseln mit ihrer Quelle, werden diese Einträge zuvor geklont.
+
+        :return: das eingefügte Attribut (``attr`` oder dessen Kopie)
+        """
+        if type(self._attributes) is not SortedDict:
+            return attr
+        if type(attr) is not Attribute:
+            from sdata.columnar import AttributeRow
+            if isinstance(attr, AttributeRow):
+                return self._adopt(attr._clone())
+        if self._cow_shares(attr):
+            self._cow_detach(attr)
+        owner = attr._owner
+        ref = self._ref
+        if owner is None:
+            attr._owner = ref
+        elif owner is not ref:
+            owners = owner if type(owner) is tuple else (owner,)
+            if ref not in owners:
+                attr._owner = owners + (ref,)
+        return attr
+
+    def _disown(self, attr):
+        """Gegenstück zu :meth:`_adopt` (Attribut wurde entfernt).
+
+        Kopien, die das Attribut noch teilen, erhalten zuvor ihren Klon: spätere
+        Änderungen am herausgegebenen Attribut erreichen sie nicht mehr.
+        """
+        owner = attr._owner if type(self._attributes) is SortedDict else None
+        if owner is not None:
+            self._cow_notify(attr, attr._rev)
+        if owner is self._ref:
+            attr._owner = None
+        elif type(owner) is tuple and self._ref in owner:
+            owners = tuple(ref for ref in owner if ref is not self._ref)
+            attr._owner = owners if len(owners) > 1 else owners[0]
+        return attr
+
+    def _adopt_all(self):
+        """Alle eigenen Attribute übernehmen (nach Zuweisung/Unpickling des Containers)."""
+        attributes = self._attributes
+        if type(attributes) is SortedDict:
+            for key, attr in list(dict.items(attributes)):
+                adopted = self._adopt(attr)
+                if adopted is not attr:                 # Zeilen-Sicht nach Wert
+                    dict.__setitem__(attributes, key, adopted)
+        elif not isinstance(attributes, dict):          # columnar backend
+            attributes._owner = self._ref
+
+    def _attribute_changed(self, attr, rev):
+        """Ein eigenes Attribut wird gleich geändert (aus ``Attribute._touch``).
+
+        Zieht die eigene Revision vor (Caches), merkt das Attribut für
+        :attr:`sha3_256` vor und löst es aus Kopien, die es noch teilen.
+
+        :param attr: das Attribut (noch im alten Zustand)
+        :param rev: seine bisherige Revision
+        """
+        self._revision += 1
+        dirty = self._dirty
+        if dirty is not None:
+            dirty[id(attr)] = attr
+        self._cow_notify(attr, rev)
+
+    def _cow_notify(self, attr, rev):
+        """``attr`` (Revision ``rev``) aus den Kopien lösen, die es noch teilen."""
+        if self._cow_sharers:
+            with _COW_LOCK:
+                sharers = list(self._cow_sharers)
+            for metadata in sharers:
+                epoch = metadata._cow_epoch
+                if epoch is not None and rev < epoch:
+                    metadata._cow_detach(attr)
+
+    # --- abgeleitete Sichten (Cache) -----------------------------------------
+    def _changed(self):
+        """Container geändert (add/set/pop/relabel): abgeleitete Sichten verwerfen."""
+        self._version += 1
+        if self._dirty:                 # sha3_256 gleicht ohnehin vollständig ab
+            self._dirty.clear()
+
+    def _cached(self, key, build):
+        """Abgeleitete Sicht ``key`` aus dem Cache, sonst per ``build()`` erzeugen.
+
+        Der Cache gilt, solange weder der Container (``_version``, Anzahl) noch eines
+        der eigenen Attribute (``_revision``) verändert wurde.
+        """
+        stamp = (self._version, self._revision, len(self._attributes))
+        if stamp != self._cache_stamp:
+            self._cache = {}
+            self._cache_stamp = stamp
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    def _build_partitions(self):
+        """user-/sdata-/required-Partition in einem Durchlauf (schreibgeschützte Sichten)."""
+        user, sdata, required = [], [], []
+        for attr in self._attributes.values():
+            if attr.name.startswith("_sdata"):
+                sdata.append((attr.name, attr))
+            else:
+                user.append((attr.name, attr))
+            if attr.required is True:
+                required.append((attr.name, attr))
+        return tuple(types.MappingProxyType(SortedDict(part)) for part in (user, sdata, required))
+
+    def _partitions(self):
+        """(user, sdata, required) – intern, ohne die Attribute zu übernehmen."""
+        return self._cached("partitions", self._build_partitions)
+
+    def _frame(self, key, build):
+        """Gecachter DataFrame als unabhängige (flache) Kopie."""
+        return self._cached(key, build).copy(deep=not _copy_on_write())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_ref", None)
+        state["_cache"] = {}
+        state["_cache_stamp"] = None
+        state["_cow_epoch"] = None           # Zielobjekt bekommt eigene Attribute
+        state["_cow_index"] = None
+        state["_cow_sources"] = None
+        state["_cow_sharers"] = None
+        state["_digest"] = None
+        state["_dirty"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._ref = weakref.ref(self)
+        self.__dict__.setdefault("_version", 0)
+        self.__dict__.setdefault("_revision", 0)
+        self.__dict__.setdefault("_cache", {})
+        self.__dict__.setdefault("_cache_stamp", None)
+        self.__dict__.setdefault("_cow_epoch", None)
+        self.__dict__.setdefault("_cow_index", None)
+        self.__dict__.setdefault("_cow_sources", None)
+        self.__dict__.setdefault("_cow_sharers", None)
+        self.__dict__.setdefault("_digest", None)
+        self.__dict__.setdefault("_dirty", None)
+        if "_attributes" in state:
+            self._adopt_all()
+
+    # --- Copy-on-write -------------------------------------------------------
+    def _cow_shares(self, attr):
+        """``True``, wenn diese Kopie ``attr`` noch mit ihrer Quelle teilt.
+
+        Geteilt sind nur Attribute von vor der Kopie (Revision vor ``_cow_epoch``),
+        die diese Kopie nicht selbst übernommen hat (:meth:`_adopt`).
+        """
+        epoch = self._cow_epoch
+        if epoch is None or attr._rev >= epoch:
+            return False
+        owner, ref = attr._owner, self._ref
+        return owner is not ref and (type(owner) is not tuple or ref not in owner)
+
+    def _owned(self, key):
+        """Attribut ``key`` zur Herausgabe/Änderung; eine geteilte Kopie klont es zuvor."""
+        attr = self._attributes.get(key)
+        if attr is not None and self._cow_shares(attr):
+            attr = self._adopt(attr._clone())
+            self._attributes[key] = attr
+            self._changed()
+        return attr
+
+    def _cow_materialize(self):
+        """Alle noch geteilten Attribute klonen (vor Herausgabe vieler Attribute)."""
+        if self._cow_epoch is None:
+            return
+        attributes = self._attributes
+        shared = [(key, attr) for key, attr in dict.items(attributes) if self._cow_shares(attr)]
+        self._cow_epoch = None
+        self._cow_index = None
+        self._cow_release()
+        for key, attr in shared:
+            dict.__setitem__(attributes, key, self._adopt(attr._clone()))
+        self._changed()
+
+    def _cow_release(self):
+        """Bei den Quellen abmelden (diese Kopie teilt keine Attribute mehr)."""
+        sources, self._cow_sources = self._cow_sources, None
+        with _COW_LOCK:
+            for source in sources or ():
+                if source._cow_sharers is not None:
+                    source._cow_sharers.discard(self)
+
+    def _cow_detach(self, attr):
+        """``attr`` wird gleich geändert: hier durch einen Klon (alter Zustand) ersetzen."""
+        owner, ref = attr._owner, self._ref
+        if owner is ref or (type(owner) is tuple and ref in owner):
+            return                                  # eigenes Attribut, nicht geteilt
+        index = self._cow_index
+        if index is None:
+            index = self._cow_index = {}
+            for key, value in dict.items(self._attributes):
+                index.setdefault(id(value), []).append(key)
+        replaced = False
+        for key in index.pop(id(attr), ()):
+            if dict.get(self._attributes, key) is attr:
+                dict.__setitem__(self._attributes, key, self._adopt(attr._clone()))
+                replaced = True
+        if replaced:
+            self._changed()
+
     @property
     def user_attributes(self):
-        attrs = [(a.name, a) for a in self.attributes.values() if not a.name.startswith("_sdata")]
-        return SortedDict(attrs)
+        """user attributes (name without ``_sdata`` prefix), cached, read-only mapping"""
+        self._cow_materialize()
+        return self._partitions()[0]
 
     @property
     def sdata_attributes(self):
-        attrs = [(a.name, a) for a in self.attributes.values() if a.name.startswith("_sdata")]
-        return SortedDict(attrs)
+        """sdata attributes (name with ``_sdata`` prefix), cached, read-only mapping"""
+        self._cow_materialize()
+        return self._partitions()[1]
 
     @property
     def required_attributes(self):
-        required_attributes = [(attr.name, attr) for attr in self.attributes.values() if attr.required is True]
-        return SortedDict(required_attributes)
+        """required attributes, cached, read-only mapping"""
+        self._cow_materialize()
+        return self._partitions()[2]
 
     def add_attribute(self, attr: Attribute, **kwargs: Any) -> None:
         """set Attribute"""
         prefix: str = kwargs.get("prefix", "")
         if not isinstance(attr, Attribute):
             raise TypeError(f"attr must be an instance of Attribute, got {type(attr).__name__}")
-        self._attributes[prefix + attr.name] = attr
+        self._attributes[prefix + attr.name] = self._adopt(attr)
+        self._changed()
+
+    def _add_reserved(self, template, values):
+        """Klone der Vorlage-Attribute ``template`` einfügen (Base-Konstruktor).
+
+        :param template: Liste fertiger :class:`Attribute` (werden nicht verändert)
+        :param values: ``{key: value}`` für die je Objekt verschiedenen Werte
+        """
+        pairs = []
+        for attr in template:
+            attr = self._adopt(attr._clone())
+            key = attr._name
+            if key in values:
+                attr._value = dtypes.lookup(attr._dtype).coerce(values[key])
+            pairs.append((key, attr))
+        self._attributes.update(pairs)
+        self._changed()
 
     def set_attr(self, name="N.N.", value=None, **kwargs):
         """set Attribute"""
@@ -347,16 +983,17 @@ class Metadata(object):
                 setattr(attr, key, kwargs.get(key))
         if value is not None:
             attr.value = value
-        self._attributes[prefix + attr.name] = attr
+        self._attributes[prefix + attr.name] = self._adopt(attr)
+        self._changed()
 
     def get_attr(self, name):
         """get Attribute by name"""
-        return self._attributes.get(name, None)
+        return self._owned(name)
 
     def to_dict(self):
         """serialize attributes to dict"""
         d = {}
-        for attr in self.attributes.values():
+        for attr in self._attributes.values():
             d[attr.name] = attr.to_dict()
         return d
 
@@ -388,41 +1025,239 @@ class Metadata(object):
             pass
         return str(value), "str"
 
-    def update_from_dict(self, d, guess_dtype=True):
+    #: Strings, die :meth:`guess_dtype_from_value` als bool erkennt (``bool(value)``)
+    _BOOL_TOKENS = frozenset(["False", "True", "true", "false"])
+
+    @staticmethod
+    def guess_dtypes_from_values(values):
+        """Batch-Variante von :meth:`guess_dtype_from_value` (gleiche Ergebnisse).
+
+        Zahl-Strings werden gesammelt über :func:`sdata.dtypes.parse_numbers` erkannt
+        (ohne Exception je Wert); andere Typen als ``int``/``float``/``bool``/``str``
+        laufen über die Einzelwert-Variante.
+
+        :param values: Sequenz von Werten
+        :return: (values, dtypes) als Listen
+        """
+        out_values = list(values)
+        out_dtypes = [None] * len(out_values)
+        positions, texts = [], []
+        for i, value in enumerate(out_values):
+            cls = type(value)
+            if cls is int or cls is float or cls is bool:
+                out_dtypes[i] = cls.__name__
+            elif cls is str:
+                if value in Metadata._BOOL_TOKENS:
+                    out_values[i], out_dtypes[i] = True, "bool"     # bool(value)
+                else:
+                    positions.append(i)
+                    texts.append(value)
+            else:
+                out_values[i], out_dtypes[i] = Metadata.guess_dtype_from_value(value)
+        for i, text, number in zip(positions, texts, dtypes.parse_numbers(texts)):
+            if number is None:
+                out_dtypes[i] = "str"
+            else:
+                out_values[i], out_dtypes[i] = number, type(number).__name__
+        return out_values, out_dtypes
+
+    def update_from_dict(self, d, guess_dtype=True, lazy=False):
         """set attributes from dict
 
+        Neue Attribute entstehen gesammelt über :meth:`update_from_records`;
+        vorhandene werden wie bisher per :meth:`set_attr` aktualisiert.
+
         :param d: dict
+        :param lazy: Werte neuer Attribute erst beim ersten Zugriff koerzieren
+        :return:
+        """
+        self.update_from_records(d, guess_dtype=guess_dtype, lazy=lazy)
+
+    def _update_item(self, k, v, guess_dtype=True):
+        """set one attribute from a dict item (Einzelwert-Pfad von update_from_dict)"""
+        if guess_dtype is False:
+            value = v
+            dtype = None
+        else:
+            value, dtype = self.guess_dtype_from_value(v)
+        if dtype in ["float", "int", "bool"]:
+            v = {"name":k, "value":value}
+            # v = {"name":k, "value":value, "dtype":dtype, "unit":"", "description":"", "label":"", "required":False}
+        elif isinstance(v, (str,)):
+            v = {"name":k, "value":v, "dtype":"str", "unit":"", "description":"", "label":"", "required":False, "ontology":""}
+        elif hasattr(v, "keys"):
+            dtype = v.get("dtype", self.guess_dtype_from_value(v.get("value"))[1])
+            value = v.get("value")
+            v = {"name":k, "value":value, "dtype":dtype,
+                 "unit":v.get("unit", ""), "description":v.get("description", ""),
+                 "label":v.get("label", ""), "required":v.get("required", False),
+                 "ontology":v.get("ontology", ""),}
+        else:
+            v, dtype = self.guess_dtype_from_value(v)
+            # v = {"name":k, "value":v, "dtype":dtype, "unit":"", "description":"", "label":"", "required":False}
+            v = {"name":k, "value":v, "dtype":dtype}
+        self.set_attr(**v)
+
+    def update_from_records(self, records, guess_dtype=True, lazy=False):
+        """set many attributes at once (bulk path)
+
+        Gleiches Ergebnis wie :meth:`update_from_dict`, aber die dtypes aller neuen
+        Attribute werden in einem Durchlauf bestimmt (:meth:`guess_dtypes_from_values`),
+        die Coercer je dtype einmal aufgelöst und die Attribute gesammelt eingefügt.
+        Schon vorhandene Schlüssel (auch doppelte innerhalb von ``records``) laufen
+        in Reihenfolge über den Einzelwert-Pfad (:meth:`set_attr`).
+
+        :param records: dict ``{name: value | attribute-dict}`` oder Iterable von
+            Attribut-dicts mit Schlüssel ``"name"`` (z.B. ``to_dict().values()``)
+        :param guess_dtype: dtype aus String-Werten raten (wie ``update_from_dict``)
+        :param lazy: Werte neuer Attribute roh übernehmen und erst beim ersten Zugriff
+            auf ``Attribute.value`` koerzieren (Ergebnis wird gespeichert); vorhandene
+            Schlüssel laufen weiter sofort über :meth:`set_attr`
         :return:
         """
-        for k, v in d.items():
-            if guess_dtype is False:
-                value = v
-                dtype = None
+        if hasattr(records, "keys"):
+            items = records.items()
+        else:
+            items = ((record["name"], record) for record in records)
+        batch, pending = [], set()
+        for key, value in items:
+            if type(key) is str and type(value) is dict:
+                dtype = value.get("dtype")
+                regular = dtype is None or bool(dtype)
+            else:
+                regular = type(key) is str and not hasattr(value, "keys")
+            name = key.strip()[:256] if regular else ""
+            if (not name or key in self._attributes or key in pending or name in pending):
+                self._add_records(batch, guess_dtype, lazy)
+                batch, pending = [], set()
+                self._update_item(key, value, guess_dtype)
             else:
-                value, dtype = self.guess_dtype_from_value(v)
-            if dtype in ["float", "int", "bool"]:
-                v = {"name":k, "value":value}
-                # v = {"name":k, "value":value, "dtype":dtype, "unit":"", "description":"", "label":"", "required":False}
-            elif isinstance(v, (str,)):
-                v = {"name":k, "value":v, "dtype":"str", "unit":"", "description":"", "label":"", "required":False, "ontology":""}
-            elif hasattr(v, "keys"):
-                dtype = v.get("dtype", self.guess_dtype_from_value(v.get("value"))[1])
-                value = v.get("value")
-                v = {"name":k, "value":value, "dtype":dtype,
-                     "unit":v.get("unit", ""), "description":v.get("description", ""),
-                     "label":v.get("label", ""), "required":v.get("required", False),
-                     "ontology":v.get("ontology", ""),}
+                batch.append((key, value))
+                pending.add(name)
+        self._add_records(batch, guess_dtype, lazy)
+
+    def _add_records(self, batch, guess_dtype, lazy=False):
+        """Attribute aus ``[(key, value | attribute-dict)]`` gesammelt anlegen."""
+        if not batch:
+            return
+        # 1) alle zu ratenden Werte in einem Durchlauf klassifizieren
+        positions, guess_values = [], []
+        for i, (key, value) in enumerate(batch):
+            if type(value) is dict:
+                if "dtype" not in value:
+                    positions.append(i)
+                    guess_values.append(value.get("value"))
+            elif guess_dtype is not False or not isinstance(value, str):
+                positions.append(i)
+                guess_values.append(value)
+        guessed = dict(zip(positions, zip(*self.guess_dtypes_from_values(guess_values))))
+        # 2) Spalten wie im Einzelwert-Pfad (update_from_dict -> set_attr) belegen
+        n = len(batch)
+        names, values, dtypes_ = [], [], []
+        units, descriptions, labels = [""] * n, [""] * n, [""] * n
+        requireds, ontologies = [False] * n, [""] * n
+        for i, (key, value) in enumerate(batch):
+            names.append(key)
+            if type(value) is dict:
+                raw = value.get("value")
+                dtype = guessed[i][1] if i in guessed else value["dtype"]
+                values.append(raw)
+                dtypes_.append(Attribute.guess_dtype(raw) if dtype is None else dtype)
+                units[i] = value.get("unit", "")
+                descriptions[i] = value.get("description", "")
+                labels[i] = value.get("label", "")
+                requireds[i] = value.get("required", False)
+                ontologies[i] = value.get("ontology", "")
+            elif i in guessed and (guessed[i][1] in ("float", "int", "bool")
+                                   or not isinstance(value, str)):
+                values.append(guessed[i][0])
+                dtypes_.append(guessed[i][1])
+                units[i] = "-"
             else:
-                v, dtype = self.guess_dtype_from_value(v)
-                # v = {"name":k, "value":v, "dtype":dtype, "unit":"", "description":"", "label":"", "required":False}
-                v = {"name":k, "value":v, "dtype":dtype}
-            self.set_attr(**v)
+                values.append(value)
+                dtypes_.append("str")
+        attrs = Attribute._bulk(names, values, dtypes_, units, descriptions, labels,
+                                requireds, ontologies, lazy=lazy)
+        self._attributes.update([(attr.name, self._adopt(attr)) for attr in attrs])
+        self._changed()
 
     @classmethod
-    def from_dict(cls, d):
-        """setup metadata from dict"""
-        metadata = cls()
-        metadata.update_from_dict(d)
+    def from_records(cls, records, guess_dtype=True, lazy=False, **kwargs):
+        """setup metadata from many records at once (bulk path)
+
+        .. code-block:: python
+
+            Metadata.from_records({"force": "1.2", "material": "steel"})
+            Metadata.from_records(other.to_dict().values())
+
+        :param records: see :meth:`update_from_records`
+        :param guess_dtype: guess dtype from string values
+        :param lazy: coerce values on first access (see :meth:`update_from_records`)
+        :param kwargs: forwarded to :class:`Metadata` (e.g. ``backend="columnar"``)
+        :return: Metadata
+        """
+        metadata = cls(**kwargs)
+        metadata.update_from_records(records, guess_dtype=guess_dtype, lazy=lazy)
+        return metadata
+
+    @classmethod
+    def from_arrays(cls, names, values, units=None, dtypes=None, descriptions=None,
+                    labels=None, required=None, ontologies=None, guess_dtype=True, lazy=False,
+                    **kwargs):
+        """setup metadata from column arrays (bulk path)
+
+        Spalten z.B. aus einem Excel-/CSV-Export (Listen, NumPy-Arrays oder pandas-Series;
+        NumPy-Skalare werden zu Python-Werten). Ohne ``dtypes`` wird der dtype wie bei
+        :meth:`update_from_dict` aus den Werten geraten, fehlende Spalten haben die
+        Defaults eines Attribut-dicts (``unit=""``, ...).
+
+        .. code-block:: python
+
+            Metadata.from_arrays(df["name"], df["value"], units=df["unit"])
+
+        :param names: attribute names
+        :param values: attribute values
+        :param units: optional units
+        :param dtypes: optional dtypes (``None``/NaN entries are guessed from the value)
+        :param descriptions: optional descriptions
+        :param labels: optional labels
+        :param required: optional required flags
+        :param ontologies: optional ontology terms
+        :param lazy: coerce values on first access (see :meth:`update_from_records`)
+        :param kwargs: forwarded to :class:`Metadata`
+        :return: Metadata
+        """
+        columns = {"name": names, "value": values, "unit": units, "dtype": dtypes,
+                   "description": descriptions, "label": labels, "required": required,
+                   "ontology": ontologies}
+        columns = {key: (column.tolist() if hasattr(column, "tolist") else list(column))
+                   for key, column in columns.items() if column is not None}
+        keys = list(columns)
+        if "dtype" in columns:               # None/NaN-Einträge: wie fehlender dtype raten
+            records = ({key: value for key, value in zip(keys, row)
+                        if key != "dtype" or (value is not None and value == value)}
+                       for row in zip(*columns.values()))
+        else:
+            records = (dict(zip(keys, row)) for row in zip(*columns.values()))
+        return cls.from_records(records, guess_dtype=guess_dtype, lazy=lazy, **kwargs)
+
+    @classmethod
+    def from_dict(cls, d, lazy=False, **kwargs):
+        """setup metadata from dict
+
+        .. code-block:: python
+
+            # viele gespeicherte Objekte laden, nur wenige Werte lesen
+            md = Metadata.from_dict(stored, lazy=True)
+            md.get("material").value        # koerziert erst hier
+
+        :param d: dict ``{name: attribute-dict | value}``
+        :param lazy: coerce values on first access to ``Attribute.value`` instead of
+            on load (the raw values stay untouched until then; default backend only)
+        :param kwargs: forwarded to :class:`Metadata` (e.g. ``backend="columnar"``)
+        """
+        metadata = cls(**kwargs)
+        metadata.update_from_dict(d, lazy=lazy)
         return metadata
 
     def _to_dict(self, attributes):
@@ -439,26 +1274,28 @@ class Metadata(object):
     def get_sdict(self):
         """get sdata attribute as dict"""
         d = {}
-        for attr in self.sdata_attributes.values():
+        for attr in self._partitions()[1].values():
             d[attr.name] = attr.value
         return d
 
     def get_udict(self):
         """get user attribute as dict"""
         d = {}
-        for attr in self.user_attributes.values():
+        for attr in self._partitions()[0].values():
             d[attr.name] = attr.value
         return d
 
     def get_dict(self):
         """get user attribute as dict"""
         d = {}
-        for attr in self.attributes.values():
+        for attr in self._attributes.values():
             d[attr.name] = attr.value
         return d
 
     def _to_dataframe(self, attributes):
         """create dataframe from attributes"""
+        if hasattr(attributes, "to_frame"):          # columnar backend
+            return attributes.to_frame()
         d = self._to_dict(attributes)
         if len(d) == 0:
             df = pd.DataFrame(columns=self.ATTRIBUTEKEYS)
@@ -469,17 +1306,25 @@ class Metadata(object):
 
     def to_dataframe(self):
         """create dataframe"""
-        return self._to_dataframe(self.attributes)
+        return self.df
 
     @property
     def df(self):
-        """create dataframe"""
-        return self._to_dataframe(self.attributes)
+        """create dataframe (cached until the metadata changes)"""
+        return self._frame("df", lambda: self._to_dataframe(self._attributes))
+
+    def _partition_frame(self, part):
+        """DataFrame der ``"user"``- bzw. ``"sdata"``-Attribute."""
+        if hasattr(self._attributes, "to_frame"):    # columnar: ohne Zeilen-Schleife
+            return self._attributes.to_frame(part)
+        if part == "sdata":
+            return self._to_dataframe(self._partitions()[1])
+        return self._to_dataframe(self._partitions()[0])
 
     @property
     def udf(self):
         """create dataframe for user attributes"""
-        return self._to_dataframe(self.user_attributes)
+        return self._frame("udf", lambda: self._partition_frame("user"))
 
     @property
     def dft(self):
@@ -500,7 +1345,7 @@ class Metadata(object):
     @property
     def sdf(self):
         """create dataframe for sdata attributes"""
-        return self._to_dataframe(self.sdata_attributes)
+        return self._frame("sdf", lambda: self._partition_frame("sdata"))
 
     @property
     def sdft(self):
@@ -537,7 +1382,7 @@ class Metadata(object):
         """serialize to csv"""
         try:
             lines = []
-            for attr in self.attributes.values():
+            for attr in self._attributes.values():
                 lines.append(attr.to_csv(prefix=prefix, sep=sep)+"\n")
 
             alines = "".join(lines)
@@ -591,6 +1436,71 @@ class Metadata(object):
             metadata = cls.from_dict(j)
         return metadata
 
+    def to_bytes(self, fmt="msgpack"):
+        """compact binary (or compact json) encoding
+
+        Spaltenweise: Namen und Werte als Listen, ``unit``/``dtype``/``description``/
+        ``label``/``required``/``ontology`` wörterbuchkodiert (Tabelle der
+        verschiedenen Werte + Index je Attribut). ``msgpack`` nutzt das Paket
+        ``msgpack``, falls installiert, sonst :mod:`sdata.binpack` (pure Python).
+
+        :param fmt: ``"msgpack"`` (default) oder ``"json"`` (kompaktes JSON)
+        :return: bytes
+        """
+        return _dump_document(self._to_document(binary=fmt == "msgpack"), fmt)
+
+    @classmethod
+    def from_bytes(cls, data, lazy=False, **kwargs):
+        """create metadata from :meth:`to_bytes` (msgpack or json)
+
+        :param data: bytes
+        :param lazy: coerce values on first access (see :meth:`from_dict`)
+        :param kwargs: forwarded to :class:`Metadata` (e.g. ``backend="columnar"``)
+        :return: Metadata
+        """
+        return cls._from_document(_load_document(data, "metadata"), lazy=lazy, **kwargs)
+
+    def _to_document(self, binary=True):
+        columns = self._columns()
+        doc = {"sdata": "metadata", "version": 1,
+               "name": columns["name"], "value": columns["value"]}
+        for field in _DICT_FIELDS:
+            doc[field] = _dict_encode(columns[field], binary)
+        return doc
+
+    @classmethod
+    def _from_document(cls, doc, lazy=False, **kwargs):
+        names = doc["name"]
+        columns = {field: _dict_decode(doc[field], len(names)) for field in _DICT_FIELDS}
+        metadata = cls(**kwargs)
+        if (not metadata._attributes and all(type(name) is str for name in names)
+                and len({name.strip()[:256] for name in names} - {""}) == len(names)
+                and all(columns["dtype"])):
+            # eindeutige Namen mit dtype (Normalfall): direkt, ohne Record-dicts
+            attrs = Attribute._bulk(names, doc["value"], columns["dtype"], columns["unit"],
+                                    columns["description"], columns["label"],
+                                    columns["required"], columns["ontology"], lazy=lazy)
+            metadata._attributes.update([(attr.name, metadata._adopt(attr)) for attr in attrs])
+            metadata._changed()
+            return metadata
+        return cls.from_arrays(names, doc["value"], units=columns["unit"],
+                               dtypes=columns["dtype"], descriptions=columns["description"],
+                               labels=columns["label"], required=columns["required"],
+                               ontologies=columns["ontology"], lazy=lazy, **kwargs)
+
+    def _columns(self):
+        """Attributfelder (``ATTRIBUTEKEYS``) spaltenweise in Schlüsselreihenfolge."""
+        attributes = self._attributes
+        if type(attributes) is SortedDict:
+            attrs = list(attributes.values())
+            columns = {field: list(map(operator.attrgetter("_" + field), attrs))
+                       for field in self.ATTRIBUTEKEYS}
+            # verzögerte Werte (lazy) roh weitergeben: der Leser koerziert sie ohnehin
+            columns["value"] = [value.raw if type(value) is _Lazy else value
+                                for value in columns["value"]]
+            return columns
+        return attributes.columns(self.ATTRIBUTEKEYS)
+
     def to_list(self):
         """create a nested list of Attribute values
 
@@ -629,11 +1539,16 @@ class Metadata(object):
         return semantic.from_jsonld(doc)
 
     def get_prefixed(self, prefix):
-        """Neue Metadata nur mit Attributen, deren Schlüssel mit ``prefix`` beginnt."""
+        """Neue Metadata nur mit Attributen, deren Schlüssel mit ``prefix`` beginnt.
+
+        Die Schlüssel mit gemeinsamem Präfix liegen in der sortierten Ordnung
+        zusammenhängend ab ``prefix``: Bereichsabfrage statt Scan aller Schlüssel.
+        """
         sub = Metadata()
-        for key, attr in self._attributes.items():
-            if key.startswith(prefix):
-                sub._attributes[key] = attr
+        for key in self._attributes.irange(minimum=prefix):
+            if not key.startswith(prefix):
+                break
+            sub._attributes[key] = sub._adopt(self._owned(key))
         return sub
 
     @property
@@ -689,10 +1604,10 @@ class Metadata(object):
         return semantic.read_sidecar(path)
 
     def __repr__(self):
-        return "(Metadata'%s':%d)" % (self.name, len(self.attributes))
+        return "(Metadata'%s':%d)" % (self.name, len(self._attributes))
 
     def __str__(self):
-        return "(Metadata'%s':%d %s)" % (self.name, len(self.attributes), [x for x in self.attributes])
+        return "(Metadata'%s':%d %s)" % (self.name, len(self._attributes), [x for x in self._attributes])
 
     def add(self, name, value=None, **kwargs):
         """add Attribute
@@ -711,7 +1626,7 @@ class Metadata(object):
         :param newname: new attribute name
         :return: None
         """
-        attr = self._attributes.get(name)
+        attr = self._owned(name)
         if attr is None:
             logger.warning("{0}: no Attribute {1} to relabel.".format(self.__class__, name))
             return
@@ -719,11 +1634,13 @@ class Metadata(object):
         self._attributes.pop(name)
         attr.name = newname
         self._attributes[newname] = attr
+        self._changed()
 
     def get(self, name, default=None):
         #default = default or Attribute(name=name, value=None)
-        if self._attributes.get(name) is not None:
-            return self._attributes.get(name)
+        attr = self._owned(name)
+        if attr is not None:
+            return attr
         else:
             return default
 
@@ -739,6 +1656,7 @@ class Metadata(object):
 
         :return: list of Attribute values
         """
+        self._cow_materialize()
         return list(self._attributes.values())
 
     def items(self):
@@ -746,17 +1664,54 @@ class Metadata(object):
 
         :return: list of Attribute items (keys, values)
         """
+        self._cow_materialize()
         return list(self._attributes.items())
 
 
     def copy(self):
-        """returns a deep copy"""
-        return copy.deepcopy(self)
+        """returns an independent copy (copy-on-write)
+
+        Die Kopie teilt die Attribute zunächst mit dem Original (nur der sortierte
+        Container wird kopiert): Attribute mit veränderlichen Werten (Listen, dicts)
+        werden sofort geklont, alle anderen erst, wenn eine Seite sie ändert bzw. die
+        Kopie sie herausgibt (``get``, ``values``, ``attributes``, ...). Beide Seiten
+        verhalten sich wie nach einer tiefen Kopie. Das columnar backend ist davon
+        ausgenommen und wird tief kopiert.
+
+        :return: Metadata
+        """
+        if type(self._attributes) is not SortedDict:        # columnar: kein copy-on-write
+            return copy.deepcopy(self)
+        state = self.__getstate__()
+        attributes = state.pop("_attributes")
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(copy.deepcopy(state))
+        _REV[0] += 1
+        epoch = _REV[0]
+        shared = SortedDict()                               # flache Kopie (bereits sortiert)
+        dict.update(shared, dict.items(attributes))
+        shared._list_update(attributes._list)
+        new._attributes = shared
+        if not _SHARED_VALUE_TYPES.issuperset(map(type, map(_VALUE, dict.values(shared)))):
+            mutable = [(key, attr) for key, attr in dict.items(shared)
+                       if type(attr._value) not in _SHARED_VALUE_TYPES]
+            for key, attr in mutable:
+                dict.__setitem__(shared, key, new._adopt(attr._clone()))
+        new._cow_epoch = epoch
+        # geteilte Attribute melden Änderungen an ihre Besitzer; diese lösen sie aus
+        # den hier registrierten Kopien (auch Kopien von Kopien) heraus
+        sources = new._cow_sources = [self] + (self._cow_sources or [])
+        with _COW_LOCK:
+            for source in sources:
+                if source._cow_sharers is None:
+                    source._cow_sharers = weakref.WeakSet()
+                source._cow_sharers.add(new)
+        return new
 
     @property
     def size(self):
         """return number uf Attribute"""
-        return len(self.attributes)
+        return len(self._attributes)
 
     def __getitem__(self, name):
         return self.get(name)
@@ -767,20 +1722,29 @@ class Metadata(object):
 
         if attr is None:
             attr = Attribute(name=name, value=value, dtype=type(value).__name__)
-            self._attributes[attr.name] = attr
+            self._attributes[attr.name] = self._adopt(attr)
+            self._changed()
         else:
             dtype = attr.guess_dtype(value)
             attr.dtype = dtype
             attr.value = dtype(value)
 
     def __contains__(self, item):
-        return item in self.attributes.keys()
+        return item in self._attributes
+
+    def __delitem__(self, name):
+        self._disown(self._attributes.pop(name))
+        self._changed()
 
     def pop(self, item):
+        self._owned(item)
         try:
-            return self._attributes.pop(item)
+            attr = self._attributes.pop(item)
         except KeyError as exp:
             return None
+        self._disown(attr)
+        self._changed()
+        return attr
 
     def __iter__(self):
         for x in self.attributes.items():
@@ -788,14 +1752,36 @@ class Metadata(object):
 
     @property
     def sha3_256(self):
-        """Return a new SHA3 hash object with a hashbit length of 32 bytes.
+        """SHA3-256 (hex) über alle Attribute als Merkle-Wurzel.
+
+        Je Attribut wird ein Digest gehalten und nur für geänderte Attribute neu
+        berechnet (siehe :class:`_DigestTree`); ein unverändertes Objekt kostet einen
+        Vergleich der Revisionen statt einer JSON-Serialisierung. Deterministisch über
+        Prozesse hinweg; für den Hash des JSON-Strings siehe :meth:`update_hash`.
 
         :return: hashlib.sha3_256.hexdigest()
         """
-        s = hashlib.sha3_256()
-        metadatastr = self.to_json().encode(errors="replace")
-        s.update(metadatastr)
-        return s.hexdigest()
+        tree = self._digest
+        if tree is None:
+            tree = self._digest = _DigestTree()
+        stamp = (self._version, len(self._attributes))
+        dirty = self._dirty
+        self._dirty = {}                # ab jetzt: geänderte Attribute vormerken
+        if stamp != tree.stamp or dirty is None or (
+                dirty and not tree.refresh_dirty(dirty.values(), self._attributes)):
+            tree.refresh(*self._digest_columns(), self._attributes)
+            tree.stamp = stamp
+        elif tree.volatile and not dirty:
+            tree.refresh_volatile(self._attributes)
+        return tree.root
+
+    def _digest_columns(self):
+        """(Schlüssel, Attribute, Revisionen) für :class:`_DigestTree` (ohne COW-Klon)."""
+        attributes = self._attributes
+        if type(attributes) is SortedDict:
+            refs = list(dict.values(attributes))
+            return list(dict.keys(attributes)), refs, list(map(_REV_OF, refs))
+        return attributes.revisions()
 
     def update_hash(self, hashobject):
         """A hash represents the object used to calculate a checksum of a
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Inhaltsadressierter Ablageort für binäre Nutzdaten (Payloads).
+
+Große Binärdaten (z. B. die Parquet-Kodierung einer
+:class:`~sdata.sclass.dataframe.DataFrame`) müssen nicht base64-kodiert im JSON
+stehen. Stattdessen werden sie unter ihrem ``sha256`` abgelegt, und das JSON
+enthält nur eine Referenz ``{"sha256": ..., "size": ..., "format": ...}``.
+Gleiche Inhalte werden dabei nur einmal gespeichert.
+
+:class:`PayloadStore` legt die Payloads in einem Verzeichnis ab
+(``<root>/<sha256[:2]>/<sha256>``). Als Store taugt jedes Objekt mit
+``put(data) -> sha256`` und ``get(sha256) -> bytes`` (z. B. ein Wrapper um
+einen Objektspeicher).
+
+.. code-block:: python
+
+    store = PayloadStore("/data/payloads")
+    d = sdf.to_dict(store=store)        # JSON ohne Tabellendaten
+    sdf2 = DataFrame.from_dict(d, store=store)   # Daten erst beim Zugriff
+"""
+import hashlib
+import os
+import tempfile
+
+__all__ = ["PayloadStore", "as_store", "make_ref", "fetch"]
+
+
+class PayloadStore(object):
+    """Verzeichnis mit inhaltsadressierten Payloads.
+
+    :param root: Wurzelverzeichnis (wird bei Bedarf angelegt)
+    """
+
+    def __init__(self, root):
+        self.root = os.fspath(root)
+
+    def __repr__(self):
+        return "PayloadStore({!r})".format(self.root)
+
+    def path(self, sha256):
+        """Dateipfad der Payload ``sha256``."""
+        return os.path.join(self.root, sha256[:2], sha256)
+
+    def __contains__(self, sha256):
+        return os.path.exists(self.path(sha256))
+
+    def put(self, data):
+        """Payload ablegen (atomar; vorhandene Inhalte werden nicht neu geschrieben).
+
+        :param data: bytes
+        :return: sha256 (hex)
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        target = self.path(sha256)
+        if os.path.exists(target):
+            return sha256
+        folder = os.path.dirname(target)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return sha256
+
+    def get(self, sha256):
+        """Payload lesen.
+
+        :raises KeyError: wenn ``sha256`` nicht vorhanden ist
+        """
+        try:
+            with open(self.path(sha256), "rb") as fh:
+                return fh.read()
+        except FileNotFoundError:
+            raise KeyError(sha256) from None
+
+
+def as_store(store):
+    """Verzeichnispfad -> :class:`PayloadStore`; Store-Objekte bleiben unverändert."""
+    if isinstance(store, (str, os.PathLike)):
+        return PayloadStore(store)
+    return store
+
+
+def make_ref(store, data, fmt):
+    """``data`` in ``store`` ablegen und die Referenz zurückgeben.
+
+    :param store: Store oder Verzeichnispfad
+    :param data: bytes
+    :param fmt: Format der Payload (z. B. ``"parquet"``)
+    :return: ``{"sha256": ..., "size": ..., "format": fmt}``
+    """
+    return {"sha256": as_store(store).put(data), "size": len(data), "format": fmt}
+
+
+def fetch(store, ref):
+    """Payload zu ``ref`` laden und gegen ``size``/``sha256`` prüfen.
+
+    :raises KeyError: wenn die Payload fehlt
+    :raises ValueError: wenn Größe oder Prüfsumme nicht passen
+    """
+    data = as_store(store).get(ref["sha256"])
+    if len(data) != ref.get("size", len(data)) or \
+            hashlib.sha256(data).hexdigest() != ref["sha256"]:
+        raise ValueError("payload {} is corrupt".format(ref["sha256"]))
+    return data
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Kanonischer Inhalts-Hash einer ``pyarrow.Table`` direkt über die Spaltenpuffer.
+
+:attr:`DataFrame.content_bytes <sdata.sclass.dataframe.DataFrame.content_bytes>`
+kodiert die Tabelle für jeden Hash neu als Parquet; das Ergebnis hängt zudem von
+Writer-Version und Kompression ab. :func:`arrow_digest` hasht stattdessen die
+Werte selbst:
+
+* je Spalte Name, kanonischer Typ (``large_string`` = ``string``, Dictionary =
+  Werttyp) und drei Ströme: Werte (feste Breite: die Bytes der Werte; variable
+  Breite: die Nutzdaten), Längen (variable Breite, int64) und Gültigkeit (ein Byte
+  je Wert, nur wenn die Spalte Nullwerte hat); Null-Slots werden genullt,
+* Chunk für Chunk ohne Kopie (``memoryview`` auf die Arrow-Puffer); die
+  Aufteilung in Chunks und Slice-Offsets beeinflussen den Hash nicht,
+* Spalten parallel in einem Thread-Pool (``hashlib`` gibt den GIL frei).
+
+Schema-Metadaten (sdata-Blob, pandas-Metadaten) gehen nicht ein. Das Format ist
+über :data:`HASH_VERSION` versioniert und unabhängig von der pyarrow-Version.
+"""
+import hashlib
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+__all__ = ["arrow_digest", "HASH_VERSION"]
+
+#: Kennung des Hash-Formats (geht in jeden Digest ein)
+HASH_VERSION = b"sdata-arrow-v1"
+
+_Q = struct.Struct("<q").pack
+
+
+def _canonical_type(t):
+    """Typname, der nicht von der physischen Darstellung abhängt."""
+    if pa.types.is_dictionary(t):
+        return _canonical_type(t.value_type)
+    if pa.types.is_string(t) or pa.types.is_large_string(t):
+        return "string"
+    if pa.types.is_binary(t) or pa.types.is_large_binary(t):
+        return "binary"
+    return str(t)
+
+
+def _fixed_width(t):
+    return (pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_temporal(t)
+            or pa.types.is_decimal(t) or pa.types.is_fixed_size_binary(t)) \
+        and t.bit_width % 8 == 0
+
+
+def _variable_width(t):
+    return (pa.types.is_string(t) or pa.types.is_large_string(t)
+            or pa.types.is_binary(t) or pa.types.is_large_binary(t))
+
+
+def _feed_fixed(chunk, values, valid):
+    width = chunk.type.bit_width // 8
+    start = chunk.offset * width
+    data = memoryview(chunk.buffers()[1])[start:start + len(chunk) * width]
+    if valid is None:
+        values.update(data)
+    else:                               # Null-Slots haben undefinierten Inhalt
+        rows = np.frombuffer(data, np.uint8).reshape(-1, width).copy()
+        rows[~valid] = 0
+        values.update(rows)
+
+
+def _feed_variable(chunk, values, lengths):
+    offset_type = np.int64 if chunk.type in (pa.large_string(), pa.large_binary()) else np.int32
+    buffers = chunk.buffers()
+    offsets = np.frombuffer(buffers[1], offset_type)[chunk.offset:chunk.offset + len(chunk) + 1]
+    if buffers[2] is not None and len(offsets):
+        values.update(memoryview(buffers[2])[offsets[0]:offsets[-1]])
+    lengths.update(np.diff(offsets).astype("<i8"))
+
+
+def _column_digest(column, algo):
+    """Digest einer ``ChunkedArray`` (Werte, Längen, Gültigkeit)."""
+    values, lengths, validity = algo(), algo(), algo()
+    has_nulls = column.null_count > 0
+    for chunk in column.chunks:
+        if pa.types.is_dictionary(chunk.type):
+            chunk = chunk.dictionary_decode()
+        valid = None
+        if has_nulls:
+            valid = chunk.is_valid().to_numpy(zero_copy_only=False)
+            validity.update(valid.view(np.uint8))
+        t = chunk.type
+        if _fixed_width(t):
+            _feed_fixed(chunk, values, valid if chunk.null_count else None)
+        elif _variable_width(t):
+            if chunk.null_count:
+                chunk = pc.fill_null(chunk, pa.scalar(b"" if pa.types.is_binary(t) or
+                                                      pa.types.is_large_binary(t) else "", t))
+            _feed_variable(chunk, values, lengths)
+        elif pa.types.is_boolean(t):
+            if chunk.null_count:
+                chunk = pc.fill_null(chunk, False)
+            values.update(chunk.to_numpy(zero_copy_only=False).view(np.uint8))
+        else:                           # verschachtelte u. a. Typen: je Wert als JSON
+            for item in chunk.to_pylist():
+                values.update(json.dumps(item, sort_keys=True, default=str).encode("utf-8"))
+                values.update(b"\x00")
+    return values.digest() + lengths.digest() + validity.digest()
+
+
+def arrow_digest(table, algo="sha256", workers=None):
+    """Kanonischer Hex-Digest des Inhalts von ``table``.
+
+    :param table: ``pyarrow.Table``
+    :param algo: Name eines ``hashlib``-Algorithmus (Default ``"sha256"``)
+    :param workers: Threads für die Spalten (Default: min(Spalten, CPUs); 0 = seriell)
+    :return: Hex-Digest
+    """
+    def new():
+        return hashlib.new(algo)
+
+    columns = table.columns
+    if workers is None:
+        workers = min(len(columns), os.cpu_count() or 1)
+    if workers > 1 and len(columns) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(lambda column: _column_digest(column, new), columns))
+    else:
+        digests = [_column_digest(column, new) for column in columns]
+    total = new()
+    total.update(HASH_VERSION)
+    total.update(_Q(table.num_rows))
+    for field, digest in zip(table.schema, digests):
+        for text in (field.name, _canonical_type(field.type)):
+            raw = text.encode("utf-8")
+            total.update(_Q(len(raw)))
+            total.update(raw)
+        total.update(digest)
+    return total.hexdigest()
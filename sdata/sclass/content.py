@@ -18,9 +18,15 @@ class ContentIntegrityMixin:
     """Hash/``verify``/``size`` über ``self.content_bytes`` + ``self.metadata``.
 
     Subklassen liefern eine ``content_bytes``-Property (``bytes``) und besitzen
-    (über :class:`~sdata.base.Base`) ein ``metadata``-Objekt.
+    (über :class:`~sdata.base.Base`) ein ``metadata``-Objekt. Weitere
+    Prüfsummen-Methoden stellen sie über :meth:`_checksum` bereit; die verwendete
+    Methode steht (außer für ``"bytes"``) im Attribut ``checksum_method``.
     """
 
+    #: Default-Methode für :meth:`update_checksum` (``"bytes"`` = sha256 der
+    #: ``content_bytes``)
+    CHECKSUM_METHOD = "bytes"
+
     def _update_hash(self, hash_obj: Any, buffer_size: int = 65536) -> None:
         """Speise den Hash-Objekt-Stream aus ``content_bytes`` (chunked)."""
         bytes_io = io.BytesIO(self.content_bytes)
@@ -64,13 +70,25 @@ class ContentIntegrityMixin:
             logger.error(f"Failed to determine size: {exp}")
             return None
 
-    def update_checksum(self) -> Optional[str]:
+    def _checksum(self, method: str) -> Optional[str]:
+        """SHA-256-Digest nach ``method``; Subklassen ergänzen eigene Methoden."""
+        if method == "bytes":
+            return self.sha256
+        raise ValueError(f"unknown checksum method {method!r}")
+
+    def update_checksum(self, method: Optional[str] = None) -> Optional[str]:
         """Store the SHA-256 of the content in the ``checksum`` metadata (``schema:sha256``).
 
+        :param method: checksum method (default :attr:`CHECKSUM_METHOD`); anything
+          other than ``"bytes"`` is recorded in the ``checksum_method`` attribute,
+          so that :meth:`verify` uses the same method later.
         :return: the stored SHA-256 hex digest (``None`` if the content is unavailable).
         """
-        digest = self.sha256
+        method = method or self.CHECKSUM_METHOD
+        digest = self._checksum(method)
         self.metadata.set_attr("checksum", digest)
+        if method != "bytes" or self.metadata.get("checksum_method") is not None:
+            self.metadata.set_attr("checksum_method", method)
         return digest
 
     def verify(self) -> bool:
@@ -84,4 +102,5 @@ class ContentIntegrityMixin:
         if not stored:
             logger.warning("verify: no checksum stored (call update_checksum first)")
             return False
-        return stored == self.sha256
+        method = self.metadata.get("checksum_method")
+        return stored == self._checksum(method.value if method is not None else "bytes")
@@ -1,15 +1,18 @@
+import numpy as np
 import pandas as pd
 import io
 import os
 import base64
 import json
+import sys
 from typing import Any, Dict, Optional, Union
 import logging
 
-from sdata.metadata import Metadata, Attribute
+from sdata.metadata import Metadata, Attribute, _copy_on_write
 from sdata.base import Base
 from sdata.interactive import ColumnAccessor
 from sdata.sclass.content import ContentIntegrityMixin
+from sdata.payload import as_store, fetch, make_ref
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,13 @@ logger = logging.getLogger(__name__)
 #: (tool-agnostisch lesbar, z. B. von DuckDB/Polars), neben dem ``_sdata``-Blob.
 _COL_FIELD_KEYS = ("unit", "label", "description", "ontology")
 
+#: Speichermodi: ``"pandas"`` (pandas.DataFrame ist der Puffer) oder ``"arrow"``
+#: (``pyarrow.Table`` ist der Puffer, die pandas-Sicht entsteht erst bei Bedarf).
+STORAGE_MODES = ("pandas", "arrow")
+
+#: Schema-Metadaten-Schlüssel, unter dem pandas ``df.attrs`` in Parquet ablegt
+_PANDAS_ATTRS = b"PANDAS_ATTRS"
+
 
 def _require_parquet(engine: str = "pyarrow") -> None:
     """Stelle sicher, dass die Parquet-Engine importierbar ist.
@@ -36,12 +46,273 @@ def _require_parquet(engine: str = "pyarrow") -> None:
         ) from exp
 
 
+def _arrow():
+    """pyarrow-Modul (mit klarer Meldung, falls nicht installiert)."""
+    _require_parquet("pyarrow")
+    import pyarrow
+    return pyarrow
+
+
+def _is_arrow_table(obj) -> bool:
+    """``True`` für eine ``pyarrow.Table``; importiert pyarrow nicht selbst."""
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(obj, pa.Table)
+
+
+def _rescale(series, factor, offset, divisor):
+    """``(series * factor + offset) / divisor`` in der Reihenfolge von :func:`sdata.units.convert`.
+
+    Gleitkomma-Spalten (numpy) mit genau einem neuen Puffer: multiplizieren, dann
+    addieren und dividieren in denselben Puffer.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf":
+        values = np.multiply(series.to_numpy(), factor)
+        if values.dtype.kind == "f":
+            if offset:
+                np.add(values, offset, out=values)
+            return np.true_divide(values, divisor, out=values)
+        return (values + offset) / divisor
+    return (series * factor + offset) / divisor
+
+
+def _split_sdata_metadata(table):
+    """``(table ohne sdata-Schema-Metadaten, _sdata-dict oder None)``.
+
+    Liest ``b"_sdata"`` (:meth:`DataFrame.to_arrow`) bzw. ``_sdata`` aus den
+    pandas-attrs (``b"PANDAS_ATTRS"``, :meth:`DataFrame.to_parquet`); die Spaltendaten
+    werden dabei nicht kopiert.
+    """
+    meta = dict(table.schema.metadata or {})
+    attrs = None
+    raw = meta.pop(b"_sdata", None)
+    if raw is not None:
+        attrs = json.loads(raw.decode("utf-8"))
+    raw = meta.pop(_PANDAS_ATTRS, None)
+    if raw is not None:
+        pandas_attrs = json.loads(raw.decode("utf-8"))
+        attrs = pandas_attrs.pop("_sdata", attrs)
+        if pandas_attrs:
+            meta[_PANDAS_ATTRS] = json.dumps(pandas_attrs).encode("utf-8")
+    return table.replace_schema_metadata(meta), attrs
+
+
+def _frame_buffers(df):
+    """Billiger Fingerabdruck der Spaltenpuffer eines ``pandas.DataFrame``.
+
+    Je Spalte die Adresse des numpy-Puffers bzw. die ``id`` des Extension-Arrays.
+    Unter Copy-on-Write ersetzt pandas einen Puffer, den eine (flache) Kopie noch
+    teilt, beim Schreiben; O(Spalten) statt O(Zeilen).
+    """
+    buffers = []
+    for _, series in df.items():
+        array = series.array
+        if isinstance(array, pd.arrays.NumpyExtensionArray):
+            buffers.append(series.to_numpy().__array_interface__["data"][0])
+        else:
+            buffers.append(id(array))
+    return tuple(buffers)
+
+
+class _FrameStamp(object):
+    """Stand der pandas-Sicht, aus dem das Serialisierungs-Memo kodiert wurde.
+
+    Hält eine flache Kopie (``snapshot``), damit jeder spätere Schreibzugriff auf die
+    Sicht deren Puffer ersetzt (Copy-on-Write) und :meth:`matches` ihn bemerkt; die
+    ``df.attrs`` (Teil von ``content_bytes``) werden als Text verglichen.
+    """
+
+    __slots__ = ("frame", "axes", "snapshot", "buffers", "attrs")
+
+    def __init__(self, df):
+        self.frame = df
+        self.axes = (df.index, df.columns)
+        self.snapshot = df.copy(deep=False)
+        self.buffers = _frame_buffers(df)
+        self.attrs = self._attrs(df)
+
+    @staticmethod
+    def _attrs(df):
+        try:
+            return json.dumps(df.attrs)
+        except TypeError:
+            return repr(df.attrs)
+
+    def matches(self, df):
+        return (df is self.frame and df.index is self.axes[0] and df.columns is self.axes[1]
+                and _frame_buffers(df) == self.buffers and self._attrs(df) == self.attrs)
+
+
+def _footer_sdata(source):
+    """``_sdata`` aus den Key-Value-Metadaten im Parquet-Footer (oder None).
+
+    :class:`ParquetBatchWriter` schreibt die Metadaten erst beim Schließen in den
+    Footer; pyarrow übernimmt sie dann nicht in das Arrow-Schema der Datei.
+
+    :param source: Pfad oder binärer Stream
+    """
+    import pyarrow.parquet as pq
+    raw = (pq.read_metadata(source).metadata or {}).get(_PANDAS_ATTRS)
+    if raw is None:
+        return None
+    return json.loads(raw.decode("utf-8")).get("_sdata")
+
+
+class ParquetBatchWriter(object):
+    """Schreibt einen :class:`DataFrame` stückweise als Parquet (ein Row-Group je Batch).
+
+    Über :meth:`DataFrame.open_parquet_writer` erzeugen. Jeder Batch wird sofort
+    geschrieben, der Speicherbedarf hängt also nur von der Batch-Größe ab. Die
+    Spalten sind die des DataFrame bzw. seiner ``column_metadata`` (sonst die des
+    ersten Batches); der erste Batch legt die Arrow-Typen fest, spätere Batches werden
+    darauf gecastet. Ein ``TableSchema`` wird gegen jeden Batch geprüft. Beim
+    Schließen kommen die sdata-Metadaten (Stand zu diesem Zeitpunkt) in den
+    Parquet-Footer; :meth:`DataFrame.from_parquet` liest sie von dort.
+
+    .. code-block:: python
+
+        with sdf.open_parquet_writer(path="/data") as writer:
+            for chunk in rig.chunks():
+                writer.write_batch(chunk)
+        sdf2 = DataFrame.from_parquet(writer.filepath)
+
+    :param sdf: der deklarierende :class:`DataFrame` (Metadaten, column_metadata)
+    :param filepath: Zieldatei
+    :param compression: Parquet-Kompression (Default ``"zstd"``)
+    :param schema: optionales :class:`~sdata.schema.TableSchema` (Default
+        ``sdf.TABLE_SCHEMA``)
+    :param kwargs: weiter an ``pyarrow.parquet.ParquetWriter``
+    """
+
+    def __init__(self, sdf, filepath, compression="zstd", schema=None, **kwargs):
+        _arrow()
+        self.sdf = sdf
+        self.filepath = filepath
+        self.compression = compression
+        self.schema = schema if schema is not None else sdf.TABLE_SCHEMA
+        self.rows = 0
+        self.batches = 0
+        self.closed = False
+        self._columns = sdf._column_names() or list(sdf.column_metadata.keys()) or None
+        self._writer = None
+        self._kwargs = kwargs
+
+    def _to_table(self, batch):
+        pa = _arrow()
+        if isinstance(batch, pd.DataFrame):
+            return pa.Table.from_pandas(batch, preserve_index=False)
+        if isinstance(batch, pa.RecordBatch):
+            return pa.Table.from_batches([batch])
+        if isinstance(batch, pa.Table):
+            return batch
+        raise TypeError(f"unsupported batch type {type(batch).__name__}")
+
+    def _check(self, table):
+        """Batch auf die deklarierten Spalten/Typen bringen oder ValueError werfen."""
+        if self._columns is None:
+            self._columns = list(table.column_names)
+        names = set(table.column_names)
+        missing = [c for c in self._columns if c not in names]
+        extra = sorted(names.difference(self._columns))
+        if missing or extra:
+            raise ValueError(f"batch {self.batches}: missing columns {missing}, "
+                             f"unexpected columns {extra}")
+        table = table.select(self._columns)
+        if self._writer is not None and not table.schema.equals(self._writer.schema):
+            try:
+                table = table.cast(self._writer.schema)
+            except (TypeError, ValueError, NotImplementedError) as exp:
+                raise ValueError(f"batch {self.batches}: types do not match "
+                                 f"the first batch: {exp}") from exp
+        if self.schema is not None:
+            view = DataFrame(df=table, storage="arrow")
+            view._column_metadata = self.sdf.column_metadata
+            report = self.schema.validate(view)
+            if not report:
+                raise ValueError(f"batch {self.batches}: schema {self.schema.name!r}: "
+                                 f"missing={report.missing} type_errors={report.type_errors} "
+                                 f"unit_errors={report.unit_errors}")
+        return table
+
+    def _open(self, table):
+        import pyarrow.parquet as pq
+        fields = []
+        for field in table.schema:
+            fmd = self.sdf._field_metadata_for(field.name)
+            fields.append(field.with_metadata({**(field.metadata or {}), **fmd}) if fmd else field)
+        pa = _arrow()
+        schema = pa.schema(fields, metadata=table.schema.metadata)
+        kwargs = dict(self._kwargs)
+        # Messkanäle (float) profitieren kaum vom Dictionary; der Versuch kostet je
+        # Row-Group aber mehr als die eigentliche Kodierung
+        kwargs.setdefault("use_dictionary", [f.name for f in schema
+                                             if not pa.types.is_floating(f.type)])
+        self._writer = pq.ParquetWriter(self.filepath, schema,
+                                        compression=self.compression, **kwargs)
+        return table.cast(schema)
+
+    def write_batch(self, batch) -> int:
+        """Einen Batch (``pandas.DataFrame``, ``pyarrow.Table``/``RecordBatch``) anhängen.
+
+        :return: Anzahl geschriebener Zeilen
+        :raises ValueError: bei abweichenden Spalten, nicht castbaren Typen oder
+            Verletzung des ``TableSchema``
+        """
+        if self.closed:
+            raise ValueError("writer is closed")
+        table = self._check(self._to_table(batch))
+        if self._writer is None:
+            table = self._open(table)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+        self.batches += 1
+        return table.num_rows
+
+    def close(self):
+        """sdata-Metadaten in den Footer schreiben und die Datei schließen.
+
+        :return: der Dateipfad
+        """
+        if self.closed:
+            return self.filepath
+        if self._writer is None:            # ohne Batches: leere Tabelle der Deklaration
+            self._open(self.sdf._arrow_table().schema.empty_table())
+        attrs = json.dumps({"_sdata": self.sdf._sdata_attrs()}).encode("utf-8")
+        self._writer.add_key_value_metadata({_PANDAS_ATTRS: attrs})
+        self._writer.close()
+        self.closed = True
+        logger.info(f"DataFrame Parquet saved to {self.filepath} "
+                    f"({self.rows} rows, {self.batches} row groups)")
+        return self.filepath
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class DataFrame(ContentIntegrityMixin, Base):
     SDATA_CLS = "sdata.sclass.dataframe.DataFrame"
 
     #: optionales :class:`~sdata.schema.TableSchema`; beim Init angewandt (Default None)
     TABLE_SCHEMA = None
 
+    #: Default-Store (:class:`~sdata.payload.PayloadStore` oder Verzeichnis) für
+    #: :meth:`to_dict`/:meth:`from_dict`; None = Parquet base64 im dict einbetten
+    PAYLOAD_STORE = None
+
+    #: Default für :meth:`update_checksum`: ``"bytes"`` (sha256 der Parquet-
+    #: ``content_bytes``) oder ``"arrow"`` (:attr:`arrow_sha256`)
+    CHECKSUM_METHOD = "bytes"
+
+    #: Kodierte Exporte (``content_bytes``, Parquet-/Feather-Bytes) je Datenversion
+    #: wiederverwenden (siehe :meth:`touch`)
+    MEMO_SERIALIZATION = True
+
+    #: Kompression der kanonischen Parquet-Kodierung der Daten (``content_bytes``, wie
+    #: ``pandas.DataFrame.to_parquet``); :meth:`to_parquet` mit derselben Kompression
+    #: übernimmt deren Spaltenblöcke, nur der Footer mit den Metadaten differiert
+    PARQUET_COMPRESSION = "snappy"
 
     def __init__(
             self,
@@ -50,6 +321,7 @@ class DataFrame(ContentIntegrityMixin, Base):
                 Union[Dict[str, Dict[str, str]], Metadata]
             ] = None,
             unit_system=None,
+            storage: str = "pandas",
             **kwargs: Any
     ) -> None:
         """
@@ -66,6 +338,9 @@ class DataFrame(ContentIntegrityMixin, Base):
         :param unit_system: optional target :class:`~sdata.units.UnitSystem` (or a
           unit list like ``["kN", "mm", "ms"]``) recorded on the table; see
           :attr:`unit_system` and :meth:`convert`.
+        :param storage: ``"pandas"`` (default) or ``"arrow"``: keep a ``pyarrow.Table``
+          as the primary buffer (``df`` may then also be a ``pyarrow.Table``); see
+          :attr:`storage`.
         :param kwargs: forwarded to :class:`~sdata.base.Base` (e.g. ``name``,
           ``description``, ``project``).
         """
@@ -81,7 +356,16 @@ class DataFrame(ContentIntegrityMixin, Base):
                                type(column_metadata).__name__)
             self._column_metadata = Metadata(name="column_metadata")
 
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"storage must be one of {STORAGE_MODES}, got {storage!r}")
+        self._storage = storage
+        self._data_version = 0
+        self._memo = {}
+        self._memo_version = 0
+        self._memo_frame = None                 # _FrameStamp der pandas-Sicht (Copy-on-Write)
+        self._payload = None
         self._df = pd.DataFrame()
+        self._table = None
         self._unit_system = None
         if unit_system is not None:
             self.unit_system = unit_system
@@ -97,7 +381,7 @@ class DataFrame(ContentIntegrityMixin, Base):
 
     def _warn_orphan_columns(self):
         """Warne, wenn column_metadata-Schlüssel keiner df-Spalte entsprechen."""
-        cols = {str(c) for c in self._df.columns}
+        cols = set(self._column_names())
         orphans = [k for k in self._column_metadata.keys() if k not in cols]
         if orphans:
             logger.warning("column_metadata keys not in df columns: %s", orphans)
@@ -110,21 +394,217 @@ class DataFrame(ContentIntegrityMixin, Base):
     def cmdf(self):
         return self._column_metadata.to_dataframe()
 
-    def _get_df(self):
+    @property
+    def _table(self):
+        # Arrow-Puffer oder None; eine ausstehende Payload-Referenz wird hier geladen,
+        # so dass alle Zugriffe auf die Daten sie auflösen
+        if self._payload is not None:
+            self._load_payload()
+        return self._buffer
+
+    @_table.setter
+    def _table(self, value):
+        self._buffer = value
+
+    def _load_payload(self):
+        ref, store = self._payload
+        data = fetch(store, ref)                # bei Fehlern bleibt die Referenz stehen
+        self._payload = None
+        self._assign_df(self._decode_parquet(data), prune=True)
+
+    def _decode_parquet(self, parquet_bytes, engine="pyarrow"):
+        """Parquet-Bytes als Arrow-Tabelle (arrow-Modus) oder pandas.DataFrame."""
+        if self._storage == "arrow":
+            import pyarrow.parquet as pq
+            return _split_sdata_metadata(pq.read_table(io.BytesIO(parquet_bytes)))[0]
+        return pd.read_parquet(io.BytesIO(parquet_bytes), engine=engine)
+
+    @property
+    def payload_ref(self) -> Optional[Dict[str, Any]]:
+        """Reference ``{"sha256", "size", "format"}`` of a payload not loaded yet.
+
+        Set by :meth:`from_dict` for a dict written with a store. ``None`` once the
+        data has been accessed (or if the data was embedded).
+        """
+        return self._payload[0] if self._payload is not None else None
+
+    def _view(self):
+        """pandas-Sicht für interne, nur lesende Zugriffe (ohne :meth:`touch`).
+
+        Im arrow-Modus einmal aus der Tabelle gebaut und behalten; die Tabelle bleibt
+        der maßgebliche Puffer, bis die Sicht über :attr:`df` herausgegeben wird.
+        """
+        table = self._table                     # lädt eine ausstehende Payload
+        if self._df is None:
+            self._df = self._table_to_pandas(table)
         return self._df
 
+    def _get_df(self):
+        df = self._view()
+        if self._buffer is not None:
+            # Die herausgegebene Sicht kann verändert werden: ab jetzt ist sie maßgeblich,
+            # Exporte konvertieren wieder aus dem df.
+            self._table = None
+            if self._memo:                      # Memo stammt aus der Tabelle (gleiche Daten)
+                self._memo_frame = _FrameStamp(df) if _copy_on_write() else None
+        if not _copy_on_write():
+            # ohne Copy-on-Write sind In-place-Änderungen nicht erkennbar: jeder
+            # Zugriff gilt als neue Datenversion
+            self.touch()
+        return df
+
+    @property
+    def data_version(self) -> int:
+        """Version of the data; bumped by :meth:`touch`.
+
+        Encoded exports are memoised per version. Assigning ``df`` and mutating
+        helpers such as :meth:`convert` bump it. Reading ``df`` does not: under
+        pandas copy-on-write an in-place edit of the df replaces the edited column
+        buffer, which the memo detects (and bumps the version) on the next export.
+        Without copy-on-write every access to the ``df`` property bumps it.
+        """
+        self._check_frame()
+        return self._data_version
+
+    def touch(self):
+        """Mark the data as changed and drop the memoised encodings.
+
+        Only needed without pandas copy-on-write, after modifying a df reference
+        obtained earlier, e.g. ``df = sdf.df; ...; df.loc[0, "x"] = 1.0; sdf.touch()``.
+        """
+        self._data_version += 1
+        self._memo = {}
+        self._memo_frame = None
+
+    def _check_frame(self):
+        """Neue Datenversion, wenn die pandas-Sicht seit dem Kodieren verändert wurde."""
+        stamp = self._memo_frame
+        if stamp is not None and self._buffer is None and not stamp.matches(self._df):
+            self.touch()
+
+    def _memoized(self, key, build):
+        """Kodierung ``key`` der aktuellen Datenversion aus dem Memo, sonst ``build()``."""
+        if not self.MEMO_SERIALIZATION:
+            return build()
+        self._check_frame()
+        if self._memo_version != self._data_version:
+            self._memo = {}
+            self._memo_version = self._data_version
+            if self._buffer is None and self._payload is None and _copy_on_write():
+                self._memo_frame = _FrameStamp(self._df)
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+    def _memo_get(self, key):
+        """Bereits memoisierte Kodierung ``key`` der aktuellen Datenversion, sonst ``None``."""
+        if not self.MEMO_SERIALIZATION:
+            return None
+        self._check_frame()
+        return self._memo.get(key) if self._memo_version == self._data_version else None
+
+    def _metadata_stamp(self):
+        """Schlüsselteil für Exporte, die die Metadaten einbetten."""
+        return (self.metadata.sha3_256, self._column_metadata.sha3_256, self.description)
+
     def _set_df(self, df):
         # Zuweisung über die ``df``-Property synchronisiert die column_metadata und
         # entfernt dabei Attribute zu nicht mehr vorhandenen Spalten (prune).
         self._assign_df(df, prune=True)
 
     def _assign_df(self, df, prune=False):
-        if isinstance(df, pd.DataFrame):
+        self.touch()
+        if _is_arrow_table(df) or (self._storage == "arrow" and isinstance(df, pd.DataFrame)):
+            if isinstance(df, pd.DataFrame):
+                if df.index.name is None:
+                    df = df.rename_axis("index")
+                df = _arrow().Table.from_pandas(df)
+            self._table = df
+            self._df = None
+            self._sync_column_metadata(prune=prune)
+        elif isinstance(df, pd.DataFrame):
             self._df = df
+            self._table = None
             if self._df.index.name is None:
                 self._df.index.name = "index"
             self._sync_column_metadata(prune=prune)
 
+    @staticmethod
+    def _table_to_pandas(table):
+        """pandas-Sicht einer Tabelle; Spalten ohne Nullwerte werden nicht kopiert."""
+        df = table.to_pandas(split_blocks=True)
+        df.attrs.pop("_sdata", None)
+        if df.index.name is None:
+            df.index.name = "index"
+        return df
+
+    def _column_names(self):
+        """Spaltennamen (str) in Tabellenreihenfolge, ohne die pandas-Sicht zu erzeugen.
+
+        Solange eine Payload-Referenz aussteht, kommen sie aus ``column_metadata``
+        (ohne zu laden).
+        """
+        if self._payload is not None:
+            return list(self._column_metadata.keys())
+        if self._table is None:
+            return [str(c) for c in self._df.columns]
+        index_columns = (self._table.schema.pandas_metadata or {}).get("index_columns", [])
+        skip = {c for c in index_columns if isinstance(c, str)}
+        return [name for name in self._table.column_names if name not in skip]
+
+    def _dtype_names(self):
+        """``{Spalte: pandas-dtype-Name}``; bei Arrow-Puffer über eine leere Tabelle."""
+        if self._table is None:
+            return {str(col): dtype.name for col, dtype in self._df.dtypes.items()}
+        dtypes = self._table.schema.empty_table().to_pandas().dtypes
+        return {str(col): dtype.name for col, dtype in dtypes.items()}
+
+    def _arrow_table(self):
+        """Der Arrow-Puffer, sonst eine frische Konvertierung des df (nicht gecacht).
+
+        Eigene ``df.attrs`` landen wie bei ``pandas.DataFrame.to_parquet`` unter
+        ``PANDAS_ATTRS`` im Schema (``content_bytes`` bleibt so bytegleich).
+        """
+        if self._table is not None:
+            return self._table
+        table = _arrow().Table.from_pandas(self._df)
+        if self._df.attrs:
+            try:
+                raw = json.dumps(self._df.attrs).encode("utf-8")
+            except TypeError:
+                logger.warning("df.attrs are not JSON serializable; not exported")
+                return table
+            table = table.replace_schema_metadata({**table.schema.metadata, _PANDAS_ATTRS: raw})
+        return table
+
+    @property
+    def storage(self) -> str:
+        """Storage mode: ``"pandas"`` or ``"arrow"``.
+
+        In ``"arrow"`` mode a ``pyarrow.Table`` is the primary buffer. Exports
+        (:meth:`to_arrow`, :meth:`to_feather`, :meth:`to_parquet`, :meth:`to_dict`)
+        and ``len``/``shape``/``columns``/``dtypes``/``head`` work on it directly. The
+        pandas view is built when first needed, without copying columns that have no
+        nulls. Read-only uses (``describe``, :meth:`to_csv`, :meth:`to_dataframe`, ...)
+        keep the table as the buffer. Once the view is handed out through :attr:`df`
+        it is authoritative (it may be modified) and exports convert from it again.
+        Assigning ``storage`` converts the buffer.
+        """
+        return self._storage
+
+    @storage.setter
+    def storage(self, value):
+        if value not in STORAGE_MODES:
+            raise ValueError(f"storage must be one of {STORAGE_MODES}, got {value!r}")
+        if value == "arrow" and self._table is None:
+            self._table = self._arrow_table()
+            self._df = None
+        elif value == "pandas":
+            self._get_df()
+        self._storage = value
+
     def _sync_column_metadata(self, prune=False):
         """Halte column_metadata mit den df-Spalten konsistent.
 
@@ -135,9 +615,10 @@ class DataFrame(ContentIntegrityMixin, Base):
         :param prune: wenn ``True``, werden Attribute zu Spalten entfernt, die nicht
           (mehr) im df vorhanden sind (z. B. nach einer df-Neuzuweisung).
         """
-        colnames = [str(c) for c in self._df.columns]
-        for col in self._df.columns:
-            self._column_metadata.add(name=str(col), value=self._df[col].dtype.name)
+        dtype_names = self._dtype_names()
+        colnames = list(dtype_names)
+        for col, dtype_name in dtype_names.items():
+            self._column_metadata.add(name=col, value=dtype_name)
         if prune:
             for key in list(self._column_metadata.keys()):
                 if key not in colnames:
@@ -148,15 +629,75 @@ class DataFrame(ContentIntegrityMixin, Base):
     @property
     def content_bytes(self) -> bytes:
         """Binary serialization of the **data** (plain Parquet of the df, *without* the
-        embedded sdata metadata).
+        embedded sdata metadata, compressed with :attr:`PARQUET_COMPRESSION`).
 
         The hook the inherited :class:`~sdata.sclass.content.ContentIntegrityMixin`
         hashes over — enables ``sha256``/``md5``/``sha1``, ``size`` and
         ``verify()``/``update_checksum()`` directly on a :class:`DataFrame`. Hashing
         the data only keeps the checksum stable when *metadata* changes (otherwise
-        storing the checksum in the metadata would alter the hash).
+        storing the checksum in the metadata would alter the hash). These are the
+        same column chunks that :meth:`to_parquet` writes with
+        ``compression=PARQUET_COMPRESSION``; such a save encodes the data once.
         """
-        return self.df.to_parquet()
+        return self._memoized(("content",), self._encode_content)
+
+    def _encode_content(self):
+        if self._payload is not None:           # gespeicherte Bytes, ohne Dekodieren
+            return fetch(self._payload[1], self._payload[0])
+        return self._parquet_data(self.PARQUET_COMPRESSION)
+
+    def _parquet_data(self, compression):
+        """Kanonische Parquet-Kodierung der Daten ohne sdata-Metadaten (memoisiert)."""
+        def encode():
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                return self._view().to_parquet(compression=compression)
+            sink = io.BytesIO()
+            pq.write_table(_split_sdata_metadata(self._arrow_table())[0], sink,
+                           compression=compression)
+            return sink.getvalue()
+        return self._memoized(("parquet-data", compression), encode)
+
+    def _parquet_footer(self, compression):
+        """``(data, start, footer)``: :meth:`to_parquet` ist ``data[:start] + footer``.
+
+        ``data`` ist :meth:`_parquet_data`; seine Spaltenblöcke werden unverändert
+        übernommen, neu geschrieben wird nur der Footer (Schema mit Feld-Metadaten und
+        ``PANDAS_ATTRS``, Row-Group-Statistiken). Memoisiert je Metadatenstand.
+        """
+        import pyarrow.parquet as pq
+        data = self._parquet_data(compression)
+
+        def encode():
+            schema = self._annotated_schema(pq.read_schema(io.BytesIO(data)), _PANDAS_ATTRS)
+            sink = io.BytesIO()
+            pq.write_metadata(schema, sink,
+                              metadata_collector=[pq.read_metadata(io.BytesIO(data))])
+            return sink.getvalue()[4:]              # ohne das führende b"PAR1"
+        footer = self._memoized(("parquet-footer", compression, self._metadata_stamp()), encode)
+        return data, len(data) - 8 - int.from_bytes(data[-8:-4], "little"), footer
+
+    @property
+    def arrow_sha256(self) -> str:
+        """Canonical SHA-256 of the data computed from the Arrow column buffers.
+
+        Unlike :attr:`sha256` it does not re-encode Parquet and does not depend on
+        the Parquet writer version or compression settings. Columns are hashed
+        chunk by chunk in parallel. See :mod:`sdata.sclass.arrowhash`. To use it
+        for :meth:`update_checksum`/:meth:`verify`, call
+        ``update_checksum(method="arrow")`` or set :attr:`CHECKSUM_METHOD`.
+
+        :raises ImportError: if pyarrow is not installed.
+        """
+        _arrow()
+        from sdata.sclass.arrowhash import arrow_digest
+        return arrow_digest(self._arrow_table())
+
+    def _checksum(self, method):
+        if method == "arrow":
+            return self.arrow_sha256
+        return super()._checksum(method)
 
     @property
     def column_metadata(self) -> Metadata:
@@ -198,7 +739,7 @@ class DataFrame(ContentIntegrityMixin, Base):
                   "ontology": ontology, "required": required, "dtype": dtype}
         self._column_metadata.set_attr(
             name, **{k: v for k, v in fields.items() if v is not None})
-        if name not in {str(c) for c in self._df.columns}:
+        if name not in set(self._column_names()):
             logger.warning("set_column: %r is not a df column", name)
         return self._column_metadata.get(name)
 
@@ -215,10 +756,10 @@ class DataFrame(ContentIntegrityMixin, Base):
     def column_units(self) -> Dict[str, str]:
         """Mapping ``{column: unit}`` (in df-column order) from column_metadata."""
         units = {}
-        for col in self._df.columns:
-            attr = self._column_metadata.get(str(col))
+        for col in self._column_names():
+            attr = self._column_metadata.get(col)
             if attr is not None:
-                units[str(col)] = attr.unit
+                units[col] = attr.unit
         return units
 
     @property
@@ -246,7 +787,10 @@ class DataFrame(ContentIntegrityMixin, Base):
 
     def _converted_copy(self):
         """Tiefe Kopie dieses DataFrame (Daten + Metadaten) für nicht-mutierende Ops."""
-        new = self.__class__(df=self._df.copy(deep=True))
+        # Arrow-Tabellen sind unveränderlich und dürfen geteilt werden
+        data = self._table if self._table is not None \
+            else self._view().copy(deep=not _copy_on_write())
+        new = self.__class__(df=data, storage=self._storage)
         new.metadata = self.metadata.copy()
         new._column_metadata = self._column_metadata.copy()
         new.description = self.description
@@ -274,6 +818,10 @@ class DataFrame(ContentIntegrityMixin, Base):
         pass ``inplace=True`` to mutate this DataFrame. When a full unit system (not
         a per-column dict) is applied, the result's :attr:`unit_system` is set to it.
 
+        Scale factors and offsets are resolved once per unit pair (cached per system);
+        each converted column is then rewritten in one vectorised pass into one new
+        buffer. Unconverted columns are shared with the original, not copied.
+
         :param units: target unit system, unit list, or ``{column: unit}`` mapping;
           ``None`` uses :attr:`unit_system`.
         :param inplace: mutate this DataFrame instead of returning a converted copy.
@@ -288,45 +836,91 @@ class DataFrame(ContentIntegrityMixin, Base):
         if units is None:
             raise ValueError(
                 "no unit system: pass units to convert() or set .unit_system")
+        if not isinstance(units, dict) and not isinstance(units, U.UnitSystem):
+            units = U.UnitSystem(units)
+        plan = self._conversion_plan(units, U)
         sdf = self if inplace else self._converted_copy()
-        if isinstance(units, dict):
-            sdf._convert_by_mapping(units, U)
-        else:
-            system = units if isinstance(units, U.UnitSystem) else U.UnitSystem(units)
-            sdf._convert_by_system(system)
-            sdf._unit_system = system
+        sdf._apply_conversion(plan)
+        if isinstance(units, U.UnitSystem):
+            sdf._unit_system = units
         return sdf
 
-    def _convert_by_system(self, system):
-        """Rechne jede abgedeckte Spalte in die (hergeleitete) System-Einheit um."""
-        for col in self._df.columns:
-            attr = self._column_metadata.get(str(col))
+    def _conversion_plan(self, units, U):
+        """``[(Spalte, factor, offset, divisor, von, nach)]`` für :meth:`convert`.
+
+        Fasst die Daten nicht an; eine zugeordnete Spalte, die nicht im df steht,
+        ergibt wie bisher einen ``KeyError``.
+
+        Die Koeffizienten kommen gecacht je Einheitenpaar bzw. System
+        (:func:`~sdata.units.conversion_coefficients`,
+        :meth:`~sdata.units.UnitSystem.coefficients_for`).
+        """
+        plan = []
+        if isinstance(units, dict):
+            names = set(self._column_names())
+            for col, target in units.items():
+                col = str(col)
+                attr = self._column_metadata.get(col)
+                current = attr.unit if attr is not None else None
+                if not current or current in ("-", ""):
+                    logger.warning("convert: column %r has no unit; skipped", col)
+                    continue
+                if str(target) == str(current):
+                    continue
+                factor, offset, divisor = U.conversion_coefficients(current, target)
+                if col not in names:
+                    raise KeyError(col)
+                plan.append((col, factor, offset, divisor, current, str(target)))
+            return plan
+        for col in self._column_names():
+            attr = self._column_metadata.get(col)
             current = attr.unit if attr is not None else None
             if not current or current in ("-", ""):
                 continue
-            result = system.convert_value(self._df[col], current)
-            if result is None:                       # Dimension nicht aufgespannt
+            coefficients = units.coefficients_for(current)
+            if coefficients is None:                 # Dimension nicht aufgespannt
                 continue
-            converted, label = result
+            factor, offset, divisor, label = coefficients
             if str(label) == str(current):           # bereits in System-Einheit
                 continue
-            self._df[col] = converted
-            self.set_column(str(col), unit=str(label))
-            logger.info("convert: %s %s -> %s", col, current, label)
+            plan.append((col, factor, offset, divisor, current, str(label)))
+        return plan
 
-    def _convert_by_mapping(self, mapping, U):
-        """Rechne genau die genannten Spalten in die jeweils angegebene Einheit um."""
-        for col, target in mapping.items():
-            col = str(col)
-            attr = self._column_metadata.get(col)
-            current = attr.unit if attr is not None else None
-            if not current or current in ("-", ""):
-                logger.warning("convert: column %r has no unit; skipped", col)
-                continue
-            if str(target) == str(current):
-                continue
-            self._df[col] = U.convert(self._df[col], current, target)
-            self.set_column(col, unit=str(target))
+    def _apply_conversion(self, plan):
+        """Rechne alle Spalten des Plans um: ein Durchlauf und ein neuer Puffer je Spalte.
+
+        Nicht umgerechnete Spalten werden nicht kopiert (pandas: Copy-on-Write, Arrow:
+        unveränderliche Puffer).
+        """
+        if not plan:
+            return
+        if self._table is not None:
+            import pyarrow.compute as pc
+            table = self._table
+            for col, factor, offset, divisor, _, _ in plan:
+                i = table.schema.get_field_index(col)
+                values = pc.multiply(table.column(i), factor)
+                if offset:
+                    values = pc.add(values, offset)
+                values = pc.divide(values, divisor)
+                table = table.set_column(i, table.schema.field(i).with_type(values.type), values)
+            new = table
+        else:
+            df = self._view()
+            if df.columns.has_duplicates:
+                new = df.copy(deep=False)
+                for col, factor, offset, divisor, _, _ in plan:
+                    new[col] = _rescale(new[col], factor, offset, divisor)
+            else:
+                data = {c: df[c] for c in df.columns}
+                keys = {str(c): c for c in df.columns}
+                for col, factor, offset, divisor, _, _ in plan:
+                    data[keys[col]] = _rescale(df[keys[col]], factor, offset, divisor)
+                new = pd.DataFrame(data, index=df.index, columns=df.columns, copy=False)
+                new.attrs = df.attrs
+        self._assign_df(new)
+        for col, _, _, _, current, target in plan:
+            self._column_metadata.set_attr(col, unit=target)
             logger.info("convert: %s %s -> %s", col, current, target)
 
     def relabel_units(self, mapping, *, force=False):
@@ -388,54 +982,80 @@ class DataFrame(ContentIntegrityMixin, Base):
 
     def __len__(self) -> int:
         """Number of rows of the underlying df."""
-        return len(self.df)
+        if self._table is not None:
+            return self._table.num_rows
+        return len(self._view())
 
     @property
     def shape(self):
         """``(nrows, ncols)`` of the underlying df."""
-        return self.df.shape
+        if self._table is not None:
+            return (self._table.num_rows, len(self._column_names()))
+        return self._view().shape
 
     @property
     def columns(self):
         """Column index of the underlying df."""
-        return self.df.columns
+        if self._table is not None:
+            return pd.Index(self._column_names())
+        return self._view().columns
 
     @property
     def dtypes(self):
         """Per-column dtypes of the underlying df."""
-        return self.df.dtypes
+        if self._table is not None:
+            return self._table.schema.empty_table().to_pandas().dtypes
+        return self._view().dtypes
 
     def head(self, n: int = 5) -> pd.DataFrame:
         """First ``n`` rows of the underlying df (delegates to ``pandas.DataFrame.head``)."""
-        return self.df.head(n)
+        if self._table is not None:
+            return self._table_to_pandas(self._table.slice(0, n))
+        return self._view().head(n)
 
     def describe(self, *args, **kwargs) -> pd.DataFrame:
         """Descriptive statistics of the df (delegates to ``pandas.DataFrame.describe``)."""
-        return self.df.describe(*args, **kwargs)
+        return self._view().describe(*args, **kwargs)
 
     def __repr__(self) -> str:
-        return f"({self.__class__.__name__} <{self.sname}> shape={self.df.shape})"
+        return f"({self.__class__.__name__} <{self.sname}> shape={self.shape})"
 
-    def to_dict(self, engine: str = "pyarrow") -> Dict[str, Any]:
+    def to_dict(self, engine: str = "pyarrow", store=None) -> Dict[str, Any]:
         """
         Serialize to a dict, embedding the df as base64 Parquet plus column_metadata.
 
+        With a ``store`` (or :attr:`PAYLOAD_STORE`) the Parquet bytes are written to
+        that content-addressed :class:`~sdata.payload.PayloadStore` instead, and the
+        dict holds only ``data['parquet_ref'] = {"sha256", "size", "format"}``. The
+        stored bytes are exactly :attr:`content_bytes`, so ``parquet_ref["sha256"]``
+        equals :attr:`sha256`.
+
         :param engine: Parquet engine for pandas (default ``"pyarrow"``).
+        :param store: payload store or directory path (default :attr:`PAYLOAD_STORE`).
         :return: dict with the :class:`~sdata.base.Base` payload plus
-          ``data['parquet_bytes']`` and ``data['column_metadata']``.
+          ``data['parquet_bytes']`` (or ``data['parquet_ref']``) and
+          ``data['column_metadata']``.
         """
         _require_parquet(engine)
         result = super().to_dict()
-        bytes_io = io.BytesIO()
-        self.df.to_parquet(bytes_io, engine=engine)
-        parquet_bytes = bytes_io.getvalue()
-        result['data']['parquet_bytes'] = base64.b64encode(parquet_bytes).decode("ascii")
+        result['data'] = dict(result['data'])      # nicht self._data mitverändern
+        store = store if store is not None else self.PAYLOAD_STORE
+        if store is not None:
+            result['data']['parquet_ref'] = make_ref(store, self.content_bytes, "parquet")
+        else:
+            if engine == "pyarrow" or self._table is not None or self._payload is not None:
+                parquet_bytes = self.content_bytes      # dieselben Bytes, ggf. aus dem Memo
+            else:
+                bytes_io = io.BytesIO()
+                self._view().to_parquet(bytes_io, engine=engine)
+                parquet_bytes = bytes_io.getvalue()
+            result['data']['parquet_bytes'] = base64.b64encode(parquet_bytes).decode("ascii")
         result['data']['column_metadata'] = self.column_metadata.to_dict()
         return result
 
     def _ordered_columns(self):
         """Spalten-Attribute in echter df-Spaltenreihenfolge (nicht alphabetisch)."""
-        cols = [self.column_metadata.get(str(c)) for c in self.df.columns]
+        cols = [self.column_metadata.get(str(c)) for c in self._view().columns]
         return [c for c in cols if c is not None]
 
     def to_jsonld(self, context_mode="inline"):
@@ -455,30 +1075,44 @@ class DataFrame(ContentIntegrityMixin, Base):
         return semantic.write_sidecar_doc(self.to_jsonld(), path, self.sname, indent=indent)
 
     @classmethod
-    def from_dict(cls, d: Dict[str, Any], engine: str = "pyarrow") -> 'DataFrame':
+    def from_dict(cls, d: Dict[str, Any], engine: str = "pyarrow",
+                  storage: str = "pandas", store=None) -> 'DataFrame':
         """
         Reconstruct a DataFrame from a dict produced by :meth:`to_dict`.
 
         Restores metadata and column_metadata and decodes the df from the
-        embedded base64 Parquet payload.
+        embedded base64 Parquet payload. A ``parquet_ref`` is resolved lazily: the
+        payload is fetched from the store (and checked against its sha256) on the
+        first access to the data, so metadata-only scans never read it.
 
-        :param d: dict with ``metadata`` and ``data.{parquet_bytes,column_metadata}``.
+        :param d: dict with ``metadata`` and ``data.{parquet_bytes|parquet_ref,column_metadata}``.
         :param engine: Parquet engine for pandas (default ``"pyarrow"``).
+        :param storage: ``"pandas"`` or ``"arrow"`` (see :attr:`storage`).
+        :param store: payload store or directory path for ``parquet_ref``
+          (default :attr:`PAYLOAD_STORE`).
         :return: a :class:`DataFrame` instance.
+        :raises ValueError: if the dict holds a ``parquet_ref`` but no store is known.
         """
         _require_parquet(engine)
         metadata = Metadata.from_dict(d.get("metadata", {}))
         column_metadata_dict = d['data'].get('column_metadata', {})
         column_metadata = Metadata.from_dict(column_metadata_dict)
 
-        instance = cls()
+        instance = cls(storage=storage)
         instance.metadata = metadata
         instance._column_metadata = column_metadata
         instance.description = d.get("description", "")
 
+        ref = d['data'].get('parquet_ref')
+        if ref is not None:
+            store = store if store is not None else cls.PAYLOAD_STORE
+            if store is None:
+                raise ValueError(f"payload {ref.get('sha256')} needs a store")
+            instance._payload = (ref, as_store(store))
+            return instance
         parquet_str = d['data'].get('parquet_bytes', '')
         parquet_bytes = base64.b64decode(parquet_str.encode("ascii"))
-        instance.df = pd.read_parquet(io.BytesIO(parquet_bytes), engine=engine)
+        instance.df = instance._decode_parquet(parquet_bytes, engine)
         return instance
 
     def to_dataframe(self):
@@ -488,25 +1122,36 @@ class DataFrame(ContentIntegrityMixin, Base):
         ``"_sdata"`` key (same layout as :meth:`to_parquet`), so that a round-trip
         through pandas keeps the annotations discoverable.
 
+        The copy is free (shallow, buffers are copied on first write) only when
+        pandas copy-on-write is enabled, i.e. pandas >= 3 or
+        ``pd.options.mode.copy_on_write = True``; otherwise a deep copy is made.
+
         Returns:
             pandas.DataFrame: A copy of the DataFrame with ``attrs['_sdata']`` set.
         """
-        df = self.df.copy()
-        df.attrs["_sdata"] = {
-            "metadata": self.metadata.to_dict(),
-            "column_metadata": self.column_metadata.to_dict(),
-            "description": self.description,
-        }
+        # Unter Copy-on-Write ist die flache Kopie sicher: Schreibzugriffe auf die
+        # Rückgabe kopieren erst dann, self.df bleibt unverändert.
+        df = self._view().copy(deep=not _copy_on_write())
+        df.attrs["_sdata"] = self._sdata_attrs()
         return df
 
+    def _sdata_attrs(self):
+        """Das ``_sdata``-Dict (metadata, column_metadata, description) für Exporte."""
+        return {"metadata": self.metadata.to_dict(),
+                "column_metadata": self.column_metadata.to_dict(),
+                "description": self.description}
+
     def to_parquet(self, path=None, filename=None, **kwargs):
         """
         Serialize this sdata.DataFrame to Parquet format, embedding metadata.
 
-        This method will copy the internal pandas DataFrame, attach SData metadata
-        (dataset‐level metadata, per‐column metadata, and description) to `df.attrs`,
-        and then write the result as a Parquet file. If no output path is given,
-        it will return the Parquet bytes buffer.
+        With the pyarrow engine the table is converted to Arrow without copying the
+        data; SData metadata (dataset‐level metadata, per‐column metadata, and
+        description) goes into the schema under ``PANDAS_ATTRS`` (read back by
+        ``pandas.read_parquet`` as ``df.attrs['_sdata']``), and the column annotations
+        into the Arrow field metadata. Other engines write a copy of the df with
+        ``df.attrs`` set. If no output path is given, it will return the Parquet
+        bytes buffer.
 
         Args:
             path (str, optional): Directory where the Parquet file will be saved.
@@ -517,7 +1162,9 @@ class DataFrame(ContentIntegrityMixin, Base):
             **kwargs: Additional keyword arguments passed to `pandas.DataFrame.to_parquet`,
                 e.g.:
                 - engine (str): Parquet engine, defaults to "pyarrow".
-                - compression (str): Compression codec, defaults to "zstd".
+                - compression (str): Compression codec, defaults to "zstd". With
+                  :attr:`PARQUET_COMPRESSION` ("snappy") the column chunks of
+                  :attr:`content_bytes` are reused.
 
         Returns:
             str or bytes:
@@ -538,21 +1185,52 @@ class DataFrame(ContentIntegrityMixin, Base):
         sidecar = kwargs.get("sidecar", False)
         _require_parquet(engine)
 
-        df = self.df.copy()
-        df.attrs["_sdata"] = {"metadata": self.metadata.to_dict(),
-                              "column_metadata": self.column_metadata.to_dict(),
-                              "description": self.description}
-
+        # pyarrow: _sdata wie bei pandas unter PANDAS_ATTRS; mit der Kompression von
+        # content_bytes dessen Spaltenblöcke plus neuer Footer (siehe _parquet_footer)
+        arrow = engine == "pyarrow" or self._table is not None
+        shared = arrow and compression == self.PARQUET_COMPRESSION
+
+        def write(target):
+            if arrow:
+                # ohne df.copy(): _sdata wie bei pandas unter PANDAS_ATTRS ins Schema
+                import pyarrow.parquet as pq
+                pq.write_table(self._annotated_table(_PANDAS_ATTRS), target,
+                               compression=compression)
+            else:
+                df = self._view().copy()
+                df.attrs["_sdata"] = self._sdata_attrs()
+                df.to_parquet(target, engine=engine, compression=compression)
+
+        def encode():
+            if shared:
+                data, start, footer = self._parquet_footer(compression)
+                return data[:start] + footer
+            sink = io.BytesIO()
+            write(sink)
+            return sink.getvalue()
+
+        key = ("parquet", engine, compression, self._metadata_stamp())
         if filename is None and path is not None:
             filename = self.sname + ".spq"
             filepath = os.path.join(path, filename)
-            df.to_parquet(filepath, engine=engine, compression=compression)
+            if shared:                          # ohne die Datei am Stück zu bilden
+                data, start, footer = self._parquet_footer(compression)
+                with open(filepath, "wb") as fh:
+                    fh.write(memoryview(data)[:start])
+                    fh.write(footer)
+            else:
+                encoded = self._memo_get(key)
+                if encoded is None:
+                    write(filepath)             # direkt in die Datei, ohne Memo
+                else:
+                    with open(filepath, "wb") as fh:
+                        fh.write(encoded)
             logger.info(f"DataFrame Parquet saved to {filepath}")
             if sidecar:
                 self.write_sidecar(path)
             return filepath
         else:
-            return df.to_parquet(engine=engine, compression=compression)
+            return self._memoized(key, encode)
 
     def _restore_from_attrs(self, attrs):
         """Restore metadata/column_metadata/description from a ``_sdata`` attrs dict.
@@ -570,41 +1248,171 @@ class DataFrame(ContentIntegrityMixin, Base):
             self.description = attrs.get("description")
 
     @classmethod
-    def from_parquet_bytes(cls, parquet_bytes, engine: str = "pyarrow"):
+    def from_parquet_bytes(cls, parquet_bytes, engine: str = "pyarrow",
+                           storage: str = "pandas"):
         """Load a DataFrame from in-memory Parquet bytes.
 
         :param parquet_bytes: Parquet file content as bytes.
         :param engine: Parquet engine for pandas (default ``"pyarrow"``).
+        :param storage: ``"pandas"`` or ``"arrow"`` (see :attr:`storage`).
         :return: a :class:`DataFrame` instance.
         """
         _require_parquet(engine)
+        if storage == "arrow":
+            import pyarrow.parquet as pq
+            return cls._from_table(pq.read_table(io.BytesIO(parquet_bytes)),
+                                   fallback=lambda: _footer_sdata(io.BytesIO(parquet_bytes)))
         buffer = io.BytesIO(parquet_bytes)
         df = pd.read_parquet(buffer, engine=engine)
         tt = cls()
         tt.df = df
-        tt._restore_from_attrs(df.attrs.get("_sdata"))
+        attrs = df.attrs.get("_sdata")
+        if attrs is None and engine == "pyarrow":
+            attrs = _footer_sdata(io.BytesIO(parquet_bytes))
+        tt._restore_from_attrs(attrs)
         return tt
 
     @classmethod
-    def from_parquet(cls, filepath, engine: str = "pyarrow"):
+    def from_parquet(cls, filepath, engine: str = "pyarrow", storage: str = "pandas",
+                     columns=None, filters=None):
         """Load a DataFrame from a Parquet file on disk.
 
+        With ``columns`` and/or ``filters`` only the selected column chunks are read,
+        and row groups whose min/max statistics cannot match the filters are skipped
+        without decoding. ``column_metadata`` then keeps only the entries of the
+        loaded columns.
+
         :param filepath: path to the ``.spq``/Parquet file.
         :param engine: Parquet engine for pandas (default ``"pyarrow"``).
+        :param storage: ``"pandas"`` or ``"arrow"`` (see :attr:`storage`); in arrow
+          mode the file is read with ``pyarrow.parquet.read_table`` only.
+        :param columns: list of column names to load (default: all).
+        :param filters: row filter in the pyarrow DNF form, e.g.
+          ``[("time", ">=", 10.0), ("time", "<", 20.0)]``, or a
+          ``pyarrow.compute.Expression``.
         :return: a :class:`DataFrame` instance.
         :raises FileNotFoundError: if ``filepath`` does not exist.
         """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"no DataFrame parquet file {filepath}")
         _require_parquet(engine)
-        df = pd.read_parquet(filepath, engine=engine)
-        tt = cls(name=filepath)
-        tt.df = df
-        logger.info(f"{tt}")
-        attrs = df.attrs.get("_sdata")
-        tt._restore_from_attrs(attrs)
-        if attrs is not None:
-            tt.df.attrs.pop("_sdata")
+        if storage == "arrow":
+            import pyarrow.parquet as pq
+            table = pq.read_table(filepath, columns=columns, filters=filters,
+                                  use_pandas_metadata=True)
+            tt = cls._from_table(table, name=filepath,
+                                 fallback=lambda: _footer_sdata(filepath))
+        else:
+            df = pd.read_parquet(filepath, engine=engine, columns=columns, filters=filters)
+            tt = cls(name=filepath)
+            tt.df = df
+            logger.info(f"{tt}")
+            attrs = df.attrs.get("_sdata")
+            if attrs is None and engine == "pyarrow":
+                attrs = _footer_sdata(filepath)
+            tt._restore_from_attrs(attrs)
+            if "_sdata" in tt.df.attrs:
+                tt.df.attrs.pop("_sdata")
+        if columns is not None:
+            tt._sync_column_metadata(prune=True)
+        return tt
+
+    def open_parquet_writer(self, path=None, filename=None, compression="zstd",
+                            schema=None, **kwargs) -> ParquetBatchWriter:
+        """Open a streaming Parquet writer that appends one row group per batch.
+
+        For data produced in chunks (e.g. by a test rig): nothing is concatenated in
+        memory. Batches are checked against this DataFrame's ``column_metadata``
+        columns and the :class:`~sdata.schema.TableSchema`. On close, the sdata
+        metadata is written into the Parquet footer. See :class:`ParquetBatchWriter`.
+
+        :param path: directory for ``<sname>.spq`` (if ``filename`` is not given).
+        :param filename: output filename (joined with ``path`` if given).
+        :param compression: Parquet compression codec (default ``"zstd"``).
+        :param schema: ``TableSchema`` to validate against (default :attr:`TABLE_SCHEMA`).
+        :param kwargs: forwarded to ``pyarrow.parquet.ParquetWriter``.
+        :return: a :class:`ParquetBatchWriter` (context manager).
+        :raises ValueError: if neither ``path`` nor ``filename`` is given.
+        """
+        if filename is None:
+            if path is None:
+                raise ValueError("open_parquet_writer needs path or filename")
+            filename = self.sname + ".spq"
+        filepath = os.path.join(path, filename) if path else filename
+        return ParquetBatchWriter(self, filepath, compression=compression,
+                                  schema=schema, **kwargs)
+
+    def to_dataset(self, path, partition_cols, compression="zstd", **kwargs):
+        """Write a hive-partitioned Parquet dataset (one directory per partition value).
+
+        Rows go to ``<path>/<col>=<value>/.../<uuid>-<i>.parquet``, so a query for one
+        specimen or one day only opens the matching files (see :meth:`from_dataset`).
+        The sdata metadata and the full schema, including partition column types and
+        field metadata, are written to ``<path>/_common_metadata``. Writing again
+        into the same ``path`` adds files (pyarrow's default
+        ``existing_data_behavior="overwrite_or_ignore"``); ``_common_metadata`` then
+        holds the metadata of the last writer.
+
+        :param path: dataset root directory (created if missing).
+        :param partition_cols: list of column names to partition by (in path order).
+        :param compression: Parquet compression codec (default ``"zstd"``).
+        :param kwargs: forwarded to ``pyarrow.parquet.write_to_dataset``, e.g.
+          ``existing_data_behavior="delete_matching"`` to replace touched partitions.
+        :return: ``path``.
+        :raises ValueError: if ``partition_cols`` is empty or names unknown columns.
+        """
+        _require_parquet("pyarrow")
+        import pyarrow.parquet as pq
+        partition_cols = list(partition_cols or [])
+        missing = [c for c in partition_cols if c not in set(self._column_names())]
+        if not partition_cols or missing:
+            raise ValueError(f"to_dataset needs existing partition columns, "
+                             f"got {partition_cols!r} (missing: {missing!r})")
+        table = self._annotated_table(_PANDAS_ATTRS)
+        # sonst ein Row-Group je Eingabe-Batch und Partition (viele winzige Row-Groups)
+        kwargs.setdefault("min_rows_per_group", 1 << 20)
+        pq.write_to_dataset(table, path, partition_cols=partition_cols,
+                            compression=compression, **kwargs)
+        pq.write_metadata(table.schema, os.path.join(path, "_common_metadata"))
+        logger.info(f"DataFrame dataset saved to {path} (partitioned by {partition_cols})")
+        return path
+
+    @classmethod
+    def from_dataset(cls, path, storage: str = "pandas", columns=None, filters=None):
+        """Load a hive-partitioned Parquet dataset written by :meth:`to_dataset`.
+
+        Filters on partition columns prune whole directories: files of other
+        partitions are not opened. Filters on other columns are pushed down to the
+        row-group statistics as in :meth:`from_parquet`. The schema and sdata metadata
+        come from ``_common_metadata`` (partition columns keep their original types);
+        without it, the partition types are inferred from the paths. Rows come back
+        grouped by partition, with a fresh index.
+
+        :param path: dataset root directory.
+        :param storage: ``"pandas"`` or ``"arrow"`` (see :attr:`storage`).
+        :param columns: list of column names to load (default: all).
+        :param filters: row filter in the pyarrow DNF form, e.g.
+          ``[("specimen", "=", "S1"), ("day", ">=", 3)]``, or a
+          ``pyarrow.compute.Expression``.
+        :return: a :class:`DataFrame` instance.
+        :raises FileNotFoundError: if ``path`` is not a directory.
+        """
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"no DataFrame dataset directory {path}")
+        _require_parquet("pyarrow")
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        common = os.path.join(path, "_common_metadata")
+        schema = pq.read_schema(common) if os.path.exists(common) else None
+        dataset = ds.dataset(path, schema=schema, format="parquet", partitioning="hive")
+        if filters is not None and not isinstance(filters, ds.Expression):
+            filters = pq.filters_to_expression(filters)
+        table = dataset.to_table(columns=columns, filter=filters)
+        if schema is not None:
+            table = table.replace_schema_metadata(schema.metadata)
+        tt = cls._from_table(table, storage=storage, name=path)
+        if columns is not None:
+            tt._sync_column_metadata(prune=True)
         return tt
 
     # ------------------------------------------------------------------ CSV
@@ -626,12 +1434,12 @@ class DataFrame(ContentIntegrityMixin, Base):
             filename = self.sname + ".csv"
         if filename is not None:
             filepath = os.path.join(path, filename) if path else filename
-            self.df.to_csv(filepath, **kwargs)
+            self._view().to_csv(filepath, **kwargs)
             logger.info(f"DataFrame CSV saved to {filepath}")
             if sidecar:
                 self.write_sidecar(path)
             return filepath
-        return self.df.to_csv(**kwargs)
+        return self._view().to_csv(**kwargs)
 
     @classmethod
     def from_csv(cls, filepath, **kwargs):
@@ -679,28 +1487,62 @@ class DataFrame(ContentIntegrityMixin, Base):
         :return: a ``pyarrow.Table``.
         :raises ImportError: if pyarrow is not installed (``pip install sdata[parquet]``).
         """
-        _require_parquet("pyarrow")
-        import pyarrow as pa
-        table = pa.Table.from_pandas(self.df)
+        return self._annotated_table(b"_sdata")
+
+    def _annotated_table(self, key):
+        """Arrow-Tabelle mit Feld-Metadaten und sdata-Blob unter ``key``.
+
+        Nur das Schema wird neu gebaut; die Spaltenpuffer werden weitergereicht
+        (numerische Spalten ohne Nullwerte teilen sich den Speicher mit dem df).
+
+        :param key: ``b"_sdata"`` (:meth:`to_arrow`) oder ``b"PANDAS_ATTRS"``
+          (:meth:`to_parquet`; ``pd.read_parquet`` stellt es als ``df.attrs`` wieder her).
+        """
+        pa = _arrow()
+        table, _ = _split_sdata_metadata(self._arrow_table())
+        return pa.Table.from_arrays(list(table.columns),
+                                    schema=self._annotated_schema(table.schema, key))
+
+    def _annotated_schema(self, schema, key):
+        """``schema`` (ohne sdata-Metadaten) mit Feld-Metadaten und sdata-Blob unter ``key``."""
+        pa = _arrow()
         fields = []
-        for field in table.schema:
+        for field in schema:
             fmd = self._field_metadata_for(field.name)
             if fmd:
                 merged = dict(field.metadata or {})
                 merged.update(fmd)
                 field = field.with_metadata(merged)
             fields.append(field)
-        schema_meta = dict(table.schema.metadata or {})
-        schema_meta[b"_sdata"] = json.dumps({
-            "metadata": self.metadata.to_dict(),
-            "column_metadata": self.column_metadata.to_dict(),
-            "description": self.description,
-        }).encode("utf-8")
-        new_schema = pa.schema(fields, metadata=schema_meta)
-        return pa.Table.from_arrays(list(table.columns), schema=new_schema)
+        schema_meta = dict(schema.metadata or {})
+        if key == _PANDAS_ATTRS:
+            attrs = json.loads(schema_meta.get(key, b"{}").decode("utf-8"))
+            attrs["_sdata"] = self._sdata_attrs()
+        else:
+            attrs = self._sdata_attrs()
+        schema_meta[key] = json.dumps(attrs).encode("utf-8")
+        return pa.schema(fields, metadata=schema_meta)
+
+    @classmethod
+    def _from_table(cls, table, storage="arrow", fallback=None, **kwargs):
+        """Instanz aus einer ``pyarrow.Table`` inkl. sdata-Schema-/Feld-Metadaten.
+
+        ``fallback()`` liefert ``_sdata``, wenn das Schema keine sdata-Metadaten trägt.
+        """
+        table, attrs = _split_sdata_metadata(table)
+        if attrs is None and fallback is not None:
+            attrs = fallback()
+        tt = cls(storage=storage, **kwargs)
+        if storage == "arrow":
+            tt.df = table
+        else:
+            tt.df = table.to_pandas()
+        tt._restore_from_attrs(attrs)
+        tt._merge_field_metadata(table.schema)
+        return tt
 
     @classmethod
-    def from_arrow(cls, table):
+    def from_arrow(cls, table, storage: str = "pandas"):
         """Build a DataFrame from a :class:`pyarrow.Table` written by :meth:`to_arrow`.
 
         The ``b"_sdata"`` schema blob is restored if present; per-column Arrow field
@@ -708,17 +1550,13 @@ class DataFrame(ContentIntegrityMixin, Base):
         tables produced by other Arrow-native tools keep their column annotations.
 
         :param table: a ``pyarrow.Table`` (sdata metadata restored if present).
+        :param storage: ``"pandas"`` or ``"arrow"``; in arrow mode the table is kept
+          as the buffer without conversion (see :attr:`storage`).
         :return: a :class:`DataFrame` instance.
         :raises ImportError: if pyarrow is not installed.
         """
         _require_parquet("pyarrow")
-        tt = cls()
-        tt.df = table.to_pandas()
-        raw = (table.schema.metadata or {}).get(b"_sdata")
-        if raw is not None:
-            tt._restore_from_attrs(json.loads(raw.decode("utf-8")))
-        tt._merge_field_metadata(table.schema)
-        return tt
+        return cls._from_table(table, storage=storage)
 
     def _merge_field_metadata(self, schema):
         """Merge per-column Arrow field metadata into ``column_metadata`` (in-place).
@@ -726,7 +1564,7 @@ class DataFrame(ContentIntegrityMixin, Base):
         :param schema: a ``pyarrow.Schema``; fields carrying ``unit``/``label``/...
           metadata update the matching column's annotation.
         """
-        cols = {str(c) for c in self._df.columns}
+        cols = set(self._column_names())
         for field in schema:
             if not field.metadata or field.name not in cols:
                 continue
@@ -737,37 +1575,53 @@ class DataFrame(ContentIntegrityMixin, Base):
                 self.set_column(field.name, **kwargs)
 
     # -------------------------------------------------------------- Feather
-    def to_feather(self, path=None, filename=None, sidecar=False, **kwargs):
+    def to_feather(self, path=None, filename=None, sidecar=False, memory_map=False,
+                   **kwargs):
         """Serialize to the Feather (Arrow IPC) format, embedding sdata metadata.
 
         :param path: directory to write ``<sname>.feather`` into (if given).
         :param filename: exact output filename (defaults to ``<sname>.feather``).
         :param sidecar: also write a JSON-LD metadata sidecar next to the file.
+        :param memory_map: write uncompressed, so that ``from_feather(...,
+          memory_map=True)`` can map the columns without copying (larger files).
         :param kwargs: forwarded to :func:`pyarrow.feather.write_feather`.
         :return: the file path (if written to disk) or the Feather bytes.
         :raises ImportError: if pyarrow is not installed.
         """
         _require_parquet("pyarrow")
         import pyarrow.feather as feather
-        table = self.to_arrow()
+        if memory_map:
+            kwargs["compression"] = "uncompressed"
         if filename is None and path is not None:
             filename = self.sname + ".feather"
         if filename is not None:
             filepath = os.path.join(path, filename) if path else filename
-            feather.write_feather(table, filepath, **kwargs)
+            feather.write_feather(self.to_arrow(), filepath, **kwargs)
             logger.info(f"DataFrame Feather saved to {filepath}")
             if sidecar:
                 self.write_sidecar(path)
             return filepath
-        sink = io.BytesIO()
-        feather.write_feather(table, sink, **kwargs)
-        return sink.getvalue()
+
+        def encode():
+            sink = io.BytesIO()
+            feather.write_feather(self.to_arrow(), sink, **kwargs)
+            return sink.getvalue()
+        key = ("feather", repr(sorted(kwargs.items())), self._metadata_stamp())
+        return self._memoized(key, encode)
 
     @classmethod
-    def from_feather(cls, filepath):
+    def from_feather(cls, filepath, storage: str = "pandas", memory_map: bool = False):
         """Load a DataFrame from a Feather file written by :meth:`to_feather`.
 
+        With ``memory_map=True`` and ``storage="arrow"`` the file is memory-mapped:
+        only the schema (including the sdata metadata) is read on open, and column
+        pages are loaded by the OS when accessed and shared between processes. This
+        is zero-copy only for uncompressed files (``to_feather(memory_map=True)``);
+        compressed files are decompressed into memory as usual.
+
         :param filepath: path to the ``.feather`` file.
+        :param storage: ``"pandas"`` or ``"arrow"`` (see :attr:`storage`).
+        :param memory_map: memory-map the file instead of reading it.
         :return: a :class:`DataFrame` instance.
         :raises FileNotFoundError: if ``filepath`` does not exist.
         :raises ImportError: if pyarrow is not installed.
@@ -776,7 +1630,8 @@ class DataFrame(ContentIntegrityMixin, Base):
             raise FileNotFoundError(f"no Feather file {filepath}")
         _require_parquet("pyarrow")
         import pyarrow.feather as feather
-        return cls.from_arrow(feather.read_table(filepath))
+        table = feather.read_table(filepath, memory_map=memory_map)
+        return cls.from_arrow(table, storage=storage)
 
     # ------------------------------------------- Blob composition (RFC 0004 C)
     #: Serialisierer je ``as_blob``-Format: ``fmt -> (builder, filetype, mime_type)``.
@@ -840,8 +1695,9 @@ class DataFrame(ContentIntegrityMixin, Base):
         round-trip.
         """
         fields = []
-        for col in self.df.columns:
-            field = {"name": str(col), "type": self._frictionless_type(self.df[col])}
+        df = self._view()
+        for col in df.columns:
+            field = {"name": str(col), "type": self._frictionless_type(df[col])}
             attr = self.column_metadata.get(str(col))
             if attr is not None:
                 if attr.label:
@@ -880,7 +1736,7 @@ class DataFrame(ContentIntegrityMixin, Base):
         import zipfile
         if fmt == "csv":
             data_path = f"data/{self.sname}.csv"
-            data_bytes = self.df.to_csv(index=False).encode("utf-8")
+            data_bytes = self._view().to_csv(index=False).encode("utf-8")
         elif fmt == "parquet":
             data_path = f"data/{self.sname}.spq"
             data_bytes = self.to_parquet()
@@ -975,7 +1831,7 @@ class DataFrame(ContentIntegrityMixin, Base):
         key = key or self.sname
         fmt = kwargs.pop("format", "fixed")
         with pd.HDFStore(filepath, mode="a") as store:
-            store.put(key, self.df, format=fmt, **kwargs)
+            store.put(key, self._view(), format=fmt, **kwargs)
             store.get_storer(key).attrs._sdata = json.dumps({
                 "metadata": self.metadata.to_dict(),
                 "column_metadata": self.column_metadata.to_dict(),
@@ -1,4 +1,4 @@
-from sdata.base import sdata_factory, Base
+from sdata.base import sdata_factory, generated_class, Base
 from sdata import generate_safe_name
 from typing import List, Dict, Any, Type, Optional, Set, Tuple
 
@@ -305,13 +305,7 @@ def processdata_class_factory(
     :return: generated ProcessData class.
     """
     class_name = generate_safe_name(class_name)
-    sdata_attrs = sdata_attrs or {}
-    cls = type(class_name, (sdata_class,), sdata_attrs)
-
-    def __init__(self, **init_kwargs: Any) -> None:
-        super(cls, self).__init__(**init_kwargs)  # type: ignore
-
-    setattr(cls, '__init__', __init__)
+    cls = generated_class(class_name, sdata_class, sdata_attrs)
     cls.SDATA_CLS = f"{sdata_class.__module__}.{sdata_class.__name__}"
     return cls
 
@@ -15,14 +15,23 @@ Mapping (sdata → suuid):
 
 Damit gilt durchgängig die in ``suuid`` eingefrorene, 100% S3-sichere
 Normalisierung (kein führendes ``_``, kein ``@``, ``sname`` ∈ ``[A-Za-z0-9_]``).
+
+Da SUUIDs unveränderlich sind, werden ``from_name`` und ``from_suuid_sname`` über
+LRU-Caches memoisiert (gleiche Argumente → dasselbe Objekt); abgeleitete Werte
+(``sname``, ``suuid_str``, ``uuid``) cached jedes Objekt beim ersten Zugriff.
+:meth:`SUUID.from_names` leitet ganze Namenslisten in einem Durchgang ab.
 """
 from __future__ import annotations
 
+import functools
 import uuid as _uuid
-from typing import Optional
+from typing import Iterable, List, Optional
+
+from suuid import SUUID as _SUUID, OID_NAMESPACE, namespace_from_name, safe_name  # noqa: F401
+from suuid.core import SEP, clean_class_name
 
-from suuid import SUUID as _SUUID, OID_NAMESPACE, safe_name  # noqa: F401
-from suuid.core import clean_class_name
+#: Größe der LRU-Caches für ``from_name``/``from_suuid_sname`` (je Cache)
+CACHE_SIZE = 65536
 
 __all__ = ["SUUID"]
 
@@ -37,6 +46,19 @@ class SUUID(_SUUID):
     #: Separator (Kompat-Konstante; identisch zu ``suuid`` ``SEP``).
     SEP = "__"
 
+    # --- gecachte Komponenten -------------------------------------------
+    # Die Felder sind eingefroren, also sind alle abgeleiteten Strings konstant;
+    # ``cached_property`` schreibt direkt in ``__dict__`` (am frozen-Check vorbei).
+    @functools.cached_property
+    def sname(self) -> str:
+        """Der kanonische String ``class_name__name__huuid`` (gecacht)."""
+        return SEP.join([self.class_name, self.name, self.huuid])
+
+    @functools.cached_property
+    def compact_token(self) -> str:
+        """Base64-Token aus ``huuid + class_name + SEP + name`` (gecacht)."""
+        return super().compact_token
+
     # --- Property-Aliasse ------------------------------------------------
     @property
     def suuid_str(self) -> str:
@@ -48,14 +70,14 @@ class SUUID(_SUUID):
         """:attr:`suuid_str` als UTF-8-Bytes."""
         return self.compact_token.encode()
 
-    @property
+    @functools.cached_property
     def uuid(self) -> _uuid.UUID:
-        """Das :class:`uuid.UUID`-Objekt hinter ``huuid``."""
+        """Das :class:`uuid.UUID`-Objekt hinter ``huuid`` (gecacht)."""
         return self.as_uuid()
 
     def get_uuid(self) -> _uuid.UUID:
         """Wie :attr:`uuid`."""
-        return self.as_uuid()
+        return self.uuid
 
     def to_list(self) -> list:
         """``[sname, suuid_str, class_name, name, huuid]`` (sdata-Kompat)."""
@@ -71,13 +93,64 @@ class SUUID(_SUUID):
     @classmethod
     def from_name(cls, class_name: str, name: str = "",
                   ns_name: Optional[str] = None) -> "SUUID":
-        """Deterministische SUUID; ``ns_name`` (String) scoped die ID."""
+        """Deterministische SUUID; ``ns_name`` (String) scoped die ID.
+
+        Memoisiert über ``(cls, class_name, name, ns_name)``; wiederholte Aufrufe
+        liefern dasselbe (unveränderliche) Objekt.
+        """
+        try:
+            return _from_name_cached(cls, class_name, name, ns_name or None)
+        except TypeError:  # nicht hashbare Argumente -> ungecacht
+            return cls._from_name(class_name, name, ns_name)
+
+    @classmethod
+    def _from_name(cls, class_name, name="", ns_name=None) -> "SUUID":
         ns = OID_NAMESPACE if not ns_name else ns_name
         return super().from_name(class_name, name, ns=ns)
 
+    @classmethod
+    def from_names(cls, class_name: str, names: Iterable[str],
+                   ns_name: Optional[str] = None) -> List["SUUID"]:
+        """Deterministische SUUIDs für viele Namen auf einmal.
+
+        Gleichwertig zu ``[SUUID.from_name(class_name, n, ns_name) for n in names]``
+        (``uuid5(ns, upper(clean_class + safe_name))`` wie
+        :func:`suuid.name_deterministic_huuid`), aber Namespace und Klassenname
+        werden nur einmal aufgelöst und doppelte Namen nur einmal abgeleitet.
+
+        :param class_name: Klassenname (für alle Namen gleich)
+        :param names: Iterable von Namen
+        :param ns_name: optionaler Namespace (wie bei :meth:`from_name`)
+        :return: Liste von SUUIDs in der Reihenfolge von ``names``
+        """
+        ns = OID_NAMESPACE if not ns_name else ns_name
+        if not isinstance(ns, _uuid.UUID):
+            ns = namespace_from_name(ns)
+        namespace = str(ns)
+        cn = clean_class_name(class_name)
+        seen = {}
+        result = []
+        append = result.append
+        for name in names:
+            sid = seen.get(name)
+            if sid is None:
+                sn = safe_name(name)
+                sid = seen[name] = cls(class_name=cn, name=sn,
+                                       huuid=_uuid.uuid5(ns, (cn + sn).upper()).hex,
+                                       mode="name", namespace=namespace)
+            append(sid)
+        return result
+
     @classmethod
     def from_suuid_sname(cls, s, strict: bool = False):
-        """Parse einen ``sname``; ``strict=False`` (Default) → ``None`` bei Fehler."""
+        """Parse einen ``sname``; ``strict=False`` (Default) → ``None`` bei Fehler.
+
+        Gültige ``sname``-Strings werden memoisiert geparst.
+        """
+        if type(s) is str:
+            sid = _from_sname_cached(cls, s)
+            if sid is not None or not strict:
+                return sid
         return super().from_sname(s, strict=strict)
 
     @classmethod
@@ -134,3 +207,13 @@ class SUUID(_SUUID):
             return True
         except Exception:
             return False
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _from_name_cached(cls, class_name, name, ns_name):
+    return cls._from_name(class_name, name, ns_name)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _from_sname_cached(cls, sname):
+    return _SUUID.from_sname.__func__(cls, sname, strict=False)
@@ -9,7 +9,7 @@ __all__ = [
     "UNIT_MAP", "normalize_symbol", "qudt_iri", "ucum_code", "unit_node",
     "validate_unit", "has_pint",
     "UnitConversionError", "quantity_of", "dimension_of", "convert",
-    "convert_factor", "UnitSystem",
+    "convert_factor", "conversion_coefficients", "UnitSystem",
 ]
 
 try:  # optionales Backend
@@ -110,7 +110,9 @@ def validate_unit(symbol):
 # Energie, Geschwindigkeit, …) hergeleitet werden kann. Reine Standardbibliothek
 # (``fractions`` für exakte Exponenten); das optionale ``pint`` bleibt der Validierung.
 
+import functools
 import math
+from collections import OrderedDict
 from fractions import Fraction
 
 
@@ -206,13 +208,24 @@ def _norm_convert(symbol):
     return _CONVERT_ALIASES.get(text, _CONVERT_ALIASES.get(text.lower(), text))
 
 
+@functools.lru_cache(maxsize=1024)
+def _lookup(symbol):
+    """Tabellen-Eintrag ``(dim, faktor, offset)`` für ein Symbol (gecacht), sonst ``None``."""
+    return _UNITS.get(_norm_convert(symbol))
+
+
+def _unit_entry(symbol):
+    """:func:`_lookup` für beliebige Symbole (``None`` und Nicht-Strings über ``str``)."""
+    return _lookup(None if symbol is None else str(symbol))
+
+
 def dimension_of(symbol):
     """Dimensionsvektor ``(L, M, T, Θ)`` einer Einheit als Tupel, oder ``None``.
 
     :param symbol: Einheiten-Symbol (z. B. ``"MPa"``).
     :return: das Dimvektor-Tupel, oder ``None`` bei unbekannter Einheit.
     """
-    entry = _UNITS.get(_norm_convert(symbol))
+    entry = _unit_entry(symbol)
     return entry[0] if entry else None
 
 
@@ -231,7 +244,7 @@ def quantity_of(symbol):
 
 def _entry(symbol, role):
     """Tabellen-Eintrag für ``symbol`` holen oder mit klarer Meldung scheitern."""
-    entry = _UNITS.get(_norm_convert(symbol))
+    entry = _unit_entry(symbol)
     if entry is None:
         raise UnitConversionError(f"unknown {role} unit {symbol!r}")
     return entry
@@ -250,15 +263,11 @@ def convert(value, from_unit, to_unit):
       Tupel werden als Liste zurückgegeben).
     :raises UnitConversionError: bei unbekannter Einheit oder inkompatibler Dimension.
     """
-    df, ff, fo = _entry(from_unit, "source")
-    dt, tf, to = _entry(to_unit, "target")
-    if df != dt:
-        raise UnitConversionError(
-            f"incompatible units: {from_unit!r} -> {to_unit!r} (different dimension)")
+    ff, offset, tf = _pair(from_unit, to_unit)
     # si = wert*ff + fo ; ziel = (si - to) / tf
     if isinstance(value, (list, tuple)):
-        return [(v * ff + fo - to) / tf for v in value]
-    return (value * ff + fo - to) / tf
+        return [(v * ff + offset) / tf for v in value]
+    return (value * ff + offset) / tf
 
 
 def convert_factor(from_unit, to_unit):
@@ -280,6 +289,35 @@ def convert_factor(from_unit, to_unit):
     return ff / tf
 
 
+def conversion_coefficients(from_unit, to_unit):
+    """Koeffizienten der Umrechnung ``ziel = (wert * factor + offset) / divisor``.
+
+    Dieselbe Rechnung (und Reihenfolge) wie :func:`convert`, damit eine ganze Spalte
+    bitgleich zur skalaren Umrechnung in einem Durchlauf umgerechnet werden kann (auch
+    Offset-Einheiten wie ``degC``). Je Einheitenpaar einmal bestimmt und
+    zwischengespeichert.
+
+    :return: Tupel ``(factor, offset, divisor)``.
+    :raises UnitConversionError: bei unbekannten/inkompatiblen Einheiten.
+    """
+    return _pair(from_unit, to_unit)
+
+
+@functools.lru_cache(maxsize=1024)
+def _pair(from_unit, to_unit):
+    """``(ff, fo - to, tf)`` für ein Einheitenpaar: ``ziel = (wert * ff + fo - to) / tf``.
+
+    LRU-gecacht wie :func:`_lookup`, also auch bei wechselnden Schreibweisen
+    (``"s"``/``"sec"``) beschränkt; fehlerhafte Paare werden nicht gespeichert.
+    """
+    df, ff, fo = _entry(from_unit, "source")
+    dt, tf, to = _entry(to_unit, "target")
+    if df != dt:
+        raise UnitConversionError(
+            f"incompatible units: {from_unit!r} -> {to_unit!r} (different dimension)")
+    return ff, fo - to, tf
+
+
 def _solve_linear(rows, rhs):
     """Löse ``rows @ c = rhs`` exakt über ``Fraction`` (Gauß-Elimination).
 
@@ -368,17 +406,35 @@ class UnitSystem:
     System-Einheit derselben Dimension – ideal, um einen ganzen
     :class:`~sdata.sclass.dataframe.DataFrame` in ein gemeinsames System umzurechnen.
 
+    Gelöste Dimensionen und Einheiten werden je System in LRU-Caches gehalten
+    (:attr:`CACHE_SIZE`); eine Zuweisung an :attr:`units` leert sie.
+
     :param units: iterierbare Basis-Einheiten-Symbole. Redundante, *konsistente*
       Angaben sind erlaubt (z. B. zusätzlich ``"GPa"``); widersprüchliche nicht.
     :raises UnitConversionError: bei unbekannter Einheit, Offset-Einheit als Basis
       oder widersprüchlicher (inkonsistenter) Über­bestimmung.
     """
 
+    #: Höchstzahl der Einträge je LRU-Cache eines Systems (gelöste Dimensionen,
+    #: Einheiten); ``0`` schaltet das Cachen ab.
+    CACHE_SIZE = 256
+
     def __init__(self, units):
-        self.units = []
-        self._basis = []   # Liste von (dimvec, log(factor), symbol) für die Basis
+        self._resolved = OrderedDict()   # dimvec -> (factor, label) | None
+        self._targets = OrderedDict()    # Einheit -> (factor, offset, sys_factor, label) | None
+        self.units = units
+
+    @property
+    def units(self):
+        """Basis-Einheiten (Liste). Eine Zuweisung löst das System neu und leert die Caches."""
+        return list(self._units)
+
+    @units.setter
+    def units(self, units):
+        symbols = []
+        basis = []   # Liste von (dimvec, factor, symbol) für die Basis
         for symbol in units:
-            entry = _UNITS.get(_norm_convert(symbol))
+            entry = _unit_entry(symbol)
             if entry is None:
                 raise UnitConversionError(f"unknown unit in system: {symbol!r}")
             dim, factor, offset = entry
@@ -386,18 +442,38 @@ class UnitSystem:
                 raise UnitConversionError(
                     f"offset unit not allowed as system base: {symbol!r}")
             sym = str(symbol).strip()
-            self.units.append(sym)
-            coeffs = _solve_over_basis([b[0] for b in self._basis], dim)
+            symbols.append(sym)
+            coeffs = _solve_over_basis([b[0] for b in basis], dim)
             if coeffs is None:
-                self._basis.append((dim, factor, sym))
+                basis.append((dim, factor, sym))
             else:
-                derived = _factor_from(self._basis, coeffs)
+                derived = _factor_from(basis, coeffs)
                 if not math.isclose(derived, factor, rel_tol=1e-9, abs_tol=1e-12):
                     raise UnitConversionError(
                         f"inconsistent unit in system: {symbol!r}")
+        self._units, self._basis = symbols, basis
+        self._resolved.clear()
+        self._targets.clear()
+
+    def _memo(self, cache, key, build):
+        """``build(key)`` über den LRU-Cache ``cache`` (höchstens :attr:`CACHE_SIZE`)."""
+        try:
+            value = cache[key]
+        except KeyError:
+            value = build(key)
+            if self.CACHE_SIZE > 0:
+                cache[key] = value
+                if len(cache) > self.CACHE_SIZE:
+                    cache.popitem(last=False)
+            return value
+        cache.move_to_end(key)
+        return value
 
     def _resolve(self, dim):
         """``(factor, label)`` für einen Dimensionsvektor, oder ``None`` (nicht abgedeckt)."""
+        return self._memo(self._resolved, tuple(dim), self._solve)
+
+    def _solve(self, dim):
         if not any(dim):
             return None                       # dimensionslos: nicht anfassen
         coeffs = _solve_over_basis([b[0] for b in self._basis], dim)
@@ -407,6 +483,19 @@ class UnitSystem:
         label = _canonical(dim, factor) or _compose([b[2] for b in self._basis], coeffs)
         return factor, label
 
+    def _target(self, from_unit):
+        """``(factor, offset, sys_factor, label)`` für ``from_unit``, oder ``None``."""
+        return self._memo(self._targets, None if from_unit is None else str(from_unit),
+                          self._build_target)
+
+    def _build_target(self, symbol):
+        entry = _lookup(symbol)
+        if entry is None:
+            return None
+        dim, factor_cur, offset_cur = entry
+        res = self._resolve(dim)
+        return None if res is None else (factor_cur, offset_cur) + res
+
     def factor_for(self, dim):
         """Numerischer Faktor der System-Einheit für einen Dimensionsvektor (oder ``None``)."""
         res = self._resolve(tuple(dim))
@@ -426,11 +515,20 @@ class UnitSystem:
         ``None`` heißt: die Einheit ist unbekannt/dimensionslos, oder ihre Dimension
         wird vom System nicht aufgespannt (die Spalte bleibt dann unverändert).
         """
-        dim = dimension_of(symbol)
-        if dim is None:
-            return None
-        res = self._resolve(dim)
-        return res[1] if res else None
+        target = self._target(symbol)
+        return target[3] if target else None
+
+    def coefficients_for(self, from_unit):
+        """``(factor, offset, divisor, label)`` für ``from_unit`` → System-Einheit.
+
+        ``system_wert = (wert * factor + offset) / divisor`` wie in
+        :meth:`convert_value`; je Einheit einmal bestimmt und im System
+        zwischengespeichert.
+
+        :return: Tupel ``(factor, offset, divisor, label)``, oder ``None`` wenn
+          ``from_unit`` unbekannt ist oder ihre Dimension nicht vom System abgedeckt wird.
+        """
+        return self._target(from_unit)
 
     def convert_value(self, value, from_unit):
         """``(umgerechneter Wert, Ziel-Label)`` für ``value`` in ``from_unit``.
@@ -441,14 +539,10 @@ class UnitSystem:
         :return: Tupel ``(wert, label)``, oder ``None`` wenn ``from_unit`` unbekannt
           ist oder ihre Dimension nicht vom System abgedeckt wird.
         """
-        entry = _UNITS.get(_norm_convert(from_unit))
-        if entry is None:
-            return None
-        dim, factor_cur, offset_cur = entry
-        res = self._resolve(dim)
-        if res is None:
+        target = self._target(from_unit)
+        if target is None:
             return None
-        sys_factor, label = res
+        factor_cur, offset_cur, sys_factor, label = target
         if isinstance(value, (list, tuple)):
             return [(v * factor_cur + offset_cur) / sys_factor for v in value], label
         return (value * factor_cur + offset_cur) / sys_factor, label
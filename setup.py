@@ -21,6 +21,7 @@ REQUIRES = ['numpy', 'pandas', 'suuid>=0.2.0']
 #   pip install "sdata[excel]"   Excel-I/O (openpyxl/xlsxwriter via pandas)
 #   pip install "sdata[hdf]"     HDF5-I/O (PyTables-Backend)
 #   pip install "sdata[sql]"     to_sqlite / pandas.to_sql (SQLAlchemy)
+#   pip install "sdata[msgpack]" C-Backend für to_bytes (sonst sdata.binpack, pure Python)
 EXTRAS = {
     # sdata.did ist abhängigkeitsfrei (Ed25519 + base58btc als pure Python).
     # Extra bleibt als no-op erhalten, damit 'pip install sdata[did]' weiter funktioniert.
@@ -32,6 +33,9 @@ EXTRAS = {
     'excel': ['openpyxl', 'xlsxwriter', 'tabulate'],
     'hdf': ['tables'],
     'sql': ['sqlalchemy'],
+    'msgpack': ['msgpack'],   # Metadata/Base.to_bytes (sonst pure-Python-Packer)
+    'zstd': ['zstandard'],    # sdata.compression-Codec "zstd" (gzip/bz2/lzma: stdlib)
+    'lz4': ['lz4'],           # sdata.compression-Codec "lz4"
     'parquet': ['pyarrow'],   # sdata.sclass.DataFrame (Parquet-Serialisierung)
     'blob': ['fsspec'],       # sdata.sclass.Blob (URI-Content: file/S3/Zip)
     # Semantische Metadaten-Schicht (alles mit pure-Python-Fallback):
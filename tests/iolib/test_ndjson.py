@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Streaming-NDJSON für Sammlungen von sdata-Objekten (``sdata.iolib.ndjson``)."""
+import gzip
+import io
+import types
+
+import pytest
+
+from sdata.base import Base
+from sdata.iolib.ndjson import HAVE_ZSTD, NDJSONWriter, read_ndjson, write_ndjson
+
+
+def _objects(n=50):
+    objs = [Base(name="obj_{}".format(i)) for i in range(n)]
+    objs[0].metadata.add("force", 1.5, unit="N")
+    objs[1].description = "Grüße"
+    return objs
+
+
+def _same(back, objs):
+    assert [b.sname for b in back] == [o.sname for o in objs]
+    assert all(b.metadata.to_dict() == o.metadata.to_dict() for b, o in zip(back, objs))
+    assert back[1].description == "Grüße"
+
+
+@pytest.mark.parametrize("filename", ["objs.ndjson", "objs.ndjson.gz"])
+@pytest.mark.parametrize("workers", [0, 3])
+def test_roundtrip_file(tmp_path, filename, workers):
+    objs = _objects()
+    path = tmp_path / filename
+    assert write_ndjson(objs, path) == len(objs)
+    if filename.endswith(".gz"):
+        assert gzip.decompress(path.read_bytes()).count(b"\n") == len(objs)
+    else:
+        assert path.read_bytes().count(b"\n") == len(objs)
+    _same(list(read_ndjson(path, workers=workers, chunksize=7)), objs)
+
+
+def test_reader_is_lazy_generator(tmp_path):
+    path = tmp_path / "objs.ndjson"
+    write_ndjson(_objects(), path)
+    reader = read_ndjson(path, chunksize=4)
+    assert isinstance(reader, types.GeneratorType)
+    assert next(reader).name == "obj_0"
+    reader.close()
+
+
+def test_streams_stay_open_and_blank_lines_are_skipped():
+    objs = _objects(5)
+    buf = io.BytesIO()
+    with NDJSONWriter(buf, compression=None) as writer:
+        writer.write(objs[0])
+        writer.write_many(objs[1:])
+        buf.write(b"\n")
+    assert writer.count == 5 and not buf.closed
+    buf.seek(0)
+    _same(list(read_ndjson(buf, lazy=True)), objs)
+    assert not buf.closed
+
+
+def test_gzip_stream_and_errors():
+    buf = io.BytesIO()
+    write_ndjson(_objects(3), buf, compression="gzip")
+    buf.seek(0)
+    assert [o.name for o in read_ndjson(buf, compression="gzip")] == ["obj_0", "obj_1", "obj_2"]
+    with pytest.raises(ValueError):
+        write_ndjson([], io.BytesIO(), compression="snappy")
+
+
+@pytest.mark.skipif(HAVE_ZSTD, reason="zstandard installed")
+def test_zstd_requires_zstandard(tmp_path):
+    with pytest.raises(ImportError):
+        write_ndjson([], tmp_path / "objs.ndjson.zst")
+
+
+@pytest.mark.skipif(not HAVE_ZSTD, reason="zstandard not installed")
+def test_zstd_roundtrip(tmp_path):
+    objs = _objects()
+    path = tmp_path / "objs.ndjson.zst"
+    write_ndjson(objs, path)
+    _same(list(read_ndjson(path, workers=2)), objs)
+
+
+def test_from_json_skips_file_probe(monkeypatch):
+    b = Base(name="x")
+    s = b.to_json()
+
+    def probe(path):
+        raise AssertionError("isfile called")
+
+    monkeypatch.setattr("sdata.base.os.path.isfile", probe)
+    assert Base.from_json(s).sname == b.sname
@@ -5,6 +5,8 @@ modulepath = os.path.dirname(__file__)
 
 sys.path.insert(0, os.path.join(modulepath, "..", "..", "src"))
 
+import pytest
+
 import sdata.metadata
 import numpy as np
 
@@ -80,3 +82,29 @@ def test_to_dict():
     a = sdata.metadata.Attribute(name="nanstr", value="", dtype="str", required=1)
     d = a.to_dict()
     assert d["required"] is True
+
+def test_attribute_slots_no_dict():
+    a = sdata.metadata.Attribute(name="force", value=1.2, unit="kN")
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.foo = 1
+
+def test_attribute_interned_strings():
+    unit = "".join(["k", "N"])
+    description = "force in " + "x"
+    a = sdata.metadata.Attribute(name="fx", value=1.0, unit=unit, description=description)
+    b = sdata.metadata.Attribute(name="fx", value=2.0, unit="kN", description="force in x")
+    assert a.unit is b.unit
+    assert a.description is b.description
+    assert a.name is b.name
+    assert a.dtype is b.dtype
+
+def test_attribute_pickle_and_deepcopy():
+    import copy
+    import pickle
+    a = sdata.metadata.Attribute(name="a", value="1.5", dtype="float", unit="mm",
+                                 description="a float", label="A", required=True,
+                                 ontology="qudt:Length")
+    for b in (pickle.loads(pickle.dumps(a)), copy.deepcopy(a), copy.copy(a)):
+        assert b is not a
+        assert b.to_dict() == a.to_dict()
@@ -140,3 +140,25 @@ def test_get_sdata_did_method_no_colon():
 def test_factory_specs_without_colon():
     assert issubclass(cls_from_spec("NoColon", on_error="ignore"), Base)
     assert isinstance(sclass_factory("NoColon", on_error="ignore", name="z"), Base)
+
+
+def test_generated_classes_are_cached():
+    from sdata.base import generated_class, _GENERATED_CLASSES
+    M1 = sdata_factory("Material", name="a")
+    M2 = sdata_factory("Material", name="b")
+    assert type(M1) is type(M2) is generated_class("Material")
+    assert type(M1) is not type(sdata_factory("Other", name="c"))
+    assert cls_from_spec("sdata.base:Base") is cls_from_spec("sdata.base:Base")
+    assert type(sclass_factory("sdata.base:Base", name="w")) is cls_from_spec("sdata.base:Base")
+    # abweichende Attribute -> eigene Klasse; nicht hashbare Attribute -> ungecacht
+    assert generated_class("Material", sdata_attrs={"X": 1}) is generated_class("Material", sdata_attrs={"X": 1})
+    assert generated_class("Material", sdata_attrs={"X": 1}) is not generated_class("Material", sdata_attrs={"X": True})
+    assert generated_class("Material", sdata_attrs={"X": []}) is not generated_class("Material", sdata_attrs={"X": []})
+    assert all(isinstance(key, tuple) for key in _GENERATED_CLASSES)
+
+
+def test_from_dict_reuses_generated_class():
+    a, b = Base(name="a"), Base(name="b")
+    la, lb = Base.from_dict(a.to_dict()), Base.from_dict(b.to_dict())
+    assert type(la) is type(lb)
+    assert la.sname == a.sname and lb.sname == b.sname
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Reservierte Attribute aus der Klassen-Vorlage und ``Base.create_many``."""
+from sdata import __version__
+from sdata.base import Base, sdata_factory, _RESERVED_TEMPLATES
+from sdata.metadata import Attribute, Metadata
+
+
+def _legacy(b):
+    """Reservierte Attribute wie früher einzeln per ``Metadata.add`` aufgebaut."""
+    m = Metadata(name=b.name)
+    md = b.metadata
+    for key, description, required in [
+        (b.SDATA_CTIME, "UTC creation date", True),
+        (b.SDATA_PROJECT_SNAME, "sname of the project", False),
+        (b.SDATA_VERSION, "sdata package version", True),
+        (b.SDATA_TOPOLOGY_CLASS, "sdata topology class name", False),
+        (b.SDATA_NAME, "name of the data object", True),
+        (b.SDATA_SNAME, "sname of the data object", True),
+        (b.SDATA_SUUID, "Super Universally Unique Identifier", True),
+        (b.SDATA_CLASS, "sdata class", True),
+        (b.SDATA_PARENT_SNAME, "sname of the parent", False),
+    ]:
+        m.add(key, md.get(key).value, dtype="str", description=description, required=required)
+    return m
+
+
+def test_reserved_attributes_match_legacy_construction():
+    parent = Base(name="parent")
+    b = Base(name="child", parent=parent)
+    assert b.metadata.to_dict() == _legacy(b).to_dict()
+    assert b.metadata.get(b.SDATA_VERSION).value == __version__
+    assert b.metadata.get(b.SDATA_PARENT_SNAME).value == parent.sname
+    assert b.metadata.get(b.SDATA_PROJECT_SNAME).value == ""
+
+
+def test_template_is_built_once_per_class_and_never_shared():
+    a, b = Base(name="a"), Base(name="b")
+    template = _RESERVED_TEMPLATES[Base]
+    assert Base._reserved_template() is template
+    assert all(a.metadata.get(attr.name) is not attr for attr in template)
+    a.metadata.get(a.SDATA_CLASS).value = "changed"
+    assert b.metadata.get(b.SDATA_CLASS).value == "sdata.base:Base"
+    assert Base(name="c").metadata.get(Base.SDATA_CLASS).value == "sdata.base:Base"
+
+
+class Sub(Base):
+    pass
+
+
+def test_subclass_template():
+    s = Sub(name="s")
+    assert sdata_factory("Dyn", name="d").metadata.get(Base.SDATA_CLASS).value.endswith(":Dyn")
+    assert s.metadata.get(s.SDATA_CLASS).value == Sub.get_sdata_spec()
+    assert _RESERVED_TEMPLATES[Sub] is not _RESERVED_TEMPLATES[Base]
+
+
+def test_clone_copies_all_slots():
+    attr = Attribute("a", "1.5", dtype="float", unit="mm", description="d", label="l",
+                     required=True, ontology="o", strict=True)
+    clone = attr._clone()
+    assert clone is not attr
+    for key in Attribute.__slots__:
+        if key != "_rev":
+            assert getattr(clone, key) == getattr(attr, key)
+
+
+def test_create_many_shares_one_timestamp():
+    parent = Base(name="parent")
+    objs = Base.create_many(["c1", "c2", {"name": "c3", "description": "third"}],
+                            parent=parent)
+    assert [o.name for o in objs] == ["c1", "c2", "c3"]
+    assert len({o.metadata.get(Base.SDATA_CTIME).value for o in objs}) == 1
+    assert all(o.metadata.get(Base.SDATA_PARENT_SNAME).value == parent.sname for o in objs)
+    assert objs[2].description == "third"
+    single = Base(name="c1", parent=parent)
+    assert single.sname == objs[0].sname
+    assert single.metadata.get(Base.SDATA_CTIME).value != ""
+
+
+def test_create_many_explicit_ctime_and_subclass():
+    objs = Sub.create_many(["x", "y"], ctime="2024-01-01T00:00:00+00:00")
+    assert {o.metadata.get(Base.SDATA_CTIME).value for o in objs} == {"2024-01-01T00:00:00+00:00"}
+    assert all(o.metadata.get(o.SDATA_CLASS).value == Sub.get_sdata_spec() for o in objs)
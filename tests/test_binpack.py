@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""MessagePack-Kodierung ``sdata.binpack`` (pure-Python-Fallback)."""
+import pytest
+
+from sdata import binpack
+
+
+@pytest.fixture
+def pure(monkeypatch):
+    """Erzwinge den pure-Python-Pfad, auch wenn ``msgpack`` installiert ist."""
+    monkeypatch.setattr(binpack, "_msgpack", None)
+
+
+@pytest.mark.parametrize("obj", [
+    None, True, False, 0, 127, 128, 255, 256, 65535, 65536, 2 ** 32, 2 ** 64 - 1,
+    -1, -32, -33, -128, -129, -2 ** 15 - 1, -2 ** 31 - 1, -2 ** 63, 1.5, -0.0,
+    "", "a" * 31, "a" * 32, "ä" * 200, "x" * 70000, b"", b"\x00" * 300,
+    list(range(20)), {"a": [1, {"b": None}], 1: "x"}, {str(i): i for i in range(20)},
+])
+def test_roundtrip(pure, obj):
+    assert binpack.unpackb(binpack.packb(obj)) == obj
+
+
+def test_shortest_encoding(pure):
+    assert binpack.packb({"a": 1}) == b"\x81\xa1a\x01"
+    assert binpack.packb(-1) == b"\xff"
+    assert binpack.packb([None, True, 1.0]) == b"\x93\xc0\xc3\xcb?\xf0\x00\x00\x00\x00\x00\x00"
+    assert binpack.packb((1, 2)) == binpack.packb([1, 2])
+
+
+def test_default_and_errors(pure):
+    assert binpack.unpackb(binpack.packb({1j}, default=lambda obj: sorted(map(str, obj)))) == ["1j"]
+    with pytest.raises(TypeError):
+        binpack.packb(object())
+    with pytest.raises(OverflowError):
+        binpack.packb(2 ** 64)
+    with pytest.raises(ValueError, match="truncated"):
+        binpack.unpackb(binpack.packb("abc")[:-1])
+    with pytest.raises(ValueError, match="trailing"):
+        binpack.unpackb(binpack.packb(1) + b"\x00")
+    with pytest.raises(ValueError, match="unsupported"):
+        binpack.unpackb(b"\xc1")
+
+
+def test_backend_agnostic_bytes():
+    obj = {"name": ["a", "b"], "value": [1.5, None, b"\x01"], "n": -200}
+    assert binpack.unpackb(binpack.packb(obj)) == obj
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Codec-Registry (``sdata.compression``) und die komprimierenden Base-Helfer."""
+import gzip
+import io
+import zipfile
+import zlib
+
+import pytest
+
+from sdata.base import Base
+from sdata.compression import CODECS, PRESETS, Codec, detect_codec, get_codec, register_codec
+
+DATA = b"sdata " * 5000
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_codec_roundtrip_and_detection(name):
+    codec = CODECS[name]
+    for preset in PRESETS:
+        blob = codec.compress(DATA, preset)
+        assert codec.decompress(blob) == DATA
+        assert detect_codec(blob) is codec
+    buf = io.BytesIO()
+    with codec.writer(buf, "fast") as stream:
+        stream.write(DATA[:100])
+        stream.write(DATA[100:])
+    assert not buf.closed
+    buf.seek(0)
+    with codec.reader(buf) as stream:
+        assert stream.read() == DATA
+    assert not buf.closed
+
+
+def test_get_codec_errors_and_registration():
+    assert get_codec(None) is CODECS["none"] and get_codec("GZIP") is CODECS["gzip"]
+    with pytest.raises(ValueError):
+        get_codec("snappy")
+    with pytest.raises(ValueError):
+        CODECS["gzip"].level("turbo")
+    for name in ("zstd", "lz4"):
+        if name not in CODECS:
+            with pytest.raises(ImportError):
+                get_codec(name)
+    rot = Codec("rot", lambda d, level: bytes(reversed(d)), lambda d: bytes(reversed(d)),
+                CODECS["none"]._writer, CODECS["none"]._reader, {"default": 0})
+    try:
+        assert register_codec(rot) is get_codec("rot")
+        assert get_codec("rot").decompress(get_codec("rot").compress(b"abc")) == b"abc"
+    finally:
+        CODECS.pop("rot")
+
+
+def _obj():
+    b = Base(name="packed")
+    b.metadata.add("force", 1.5, unit="N")
+    b.data = {"values": list(range(100))}
+    return b
+
+
+@pytest.mark.parametrize("codec", sorted(set(CODECS) - {"none"}))
+def test_base_compressed_roundtrip(tmp_path, codec):
+    b = _obj()
+    blob = b.to_compressed(codec, level="archive")
+    for r in (Base.from_compressed(blob), Base.from_compressed(blob, codec=codec, lazy=True)):
+        assert r.sname == b.sname and r.data == b.data
+        assert r.metadata.get("force").value == 1.5
+    path = tmp_path / "obj.bin"
+    b.write_compressed(path, codec=codec)
+    assert path.read_bytes() == b.to_compressed(codec)
+    assert Base.read_compressed(path).metadata.to_dict() == b.metadata.to_dict()
+    buf = io.BytesIO(blob)
+    assert Base.read_compressed(buf, lazy=True).sname == b.sname and not buf.closed
+
+
+def test_gzip_helpers_are_deterministic():
+    b = _obj()
+    assert b.to_bytes_gzip() == b.to_bytes_gzip()
+    assert Base.from_bytes_gzip(b.to_bytes_gzip("fast")).data == b.data
+
+
+def test_gzip_and_zip_keep_the_to_json_layout():
+    b = _obj()
+    assert gzip.decompress(b.to_bytes_gzip()) == b.to_json().encode("utf-8")
+    # bytegleich zum bisherigen writestr(ZipInfo, to_json()) mit festem Zeitstempel
+    expected = io.BytesIO()
+    with zipfile.ZipFile(expected, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        member = zipfile.ZipInfo(f"{b.sname}.sjson", date_time=(1980, 1, 1, 0, 0, 0))
+        member.compress_type = zipfile.ZIP_DEFLATED
+        zf.writestr(member, b.to_json())
+    assert b.to_zip().getvalue() == expected.getvalue()
+    with zipfile.ZipFile(b.to_zip(deterministic=False)) as zf:
+        assert zf.read(f"{b.sname}.sjson") == b.to_json().encode("utf-8")
+
+
+def test_deterministic_zip_streams_the_entry(monkeypatch):
+    b = _obj()
+    monkeypatch.setattr(zipfile.ZipFile, "writestr",
+                        lambda *args, **kwargs: pytest.fail("JSON built in one piece"))
+    for compression, level in (("deflate", 6), ("bzip2", 9), ("lzma", 6), ("stored", 6)):
+        buf = b.to_zip(compression=compression, compresslevel=level)
+        assert Base.from_zip(buf).data == b.data
+
+
+@pytest.mark.parametrize("compression", ["deflate", "bzip2", "lzma", "stored"])
+def test_to_zip_compression(compression):
+    b = _obj()
+    buf = b.to_zip(compression=compression, compresslevel="archive")
+    with zipfile.ZipFile(buf) as zf:
+        assert zf.infolist()[0].date_time == (1980, 1, 1, 0, 0, 0)
+    assert Base.from_zip(buf).data == b.data
+    assert b.to_zip(compression=compression).getvalue() == b.to_zip(compression=compression).getvalue()
+    with pytest.raises(ValueError):
+        b.to_zip(compression="brotli")
+
+
+@pytest.mark.parametrize("deterministic", [True, False])
+def test_to_zip_applies_compresslevel(deterministic):
+    b = _obj()
+    sizes = []
+    for level in (1, 9):
+        with zipfile.ZipFile(b.to_zip(compresslevel=level, deterministic=deterministic)) as zf:
+            info = zf.infolist()[0]
+            sizes.append(info.compress_size)
+            raw = zf.read(info)
+        deflate = zlib.compressobj(level, zlib.DEFLATED, -15)
+        assert info.compress_size == len(deflate.compress(raw) + deflate.flush())
+    assert sizes[0] != sizes[1]
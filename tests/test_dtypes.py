@@ -472,3 +472,26 @@ def test_timestamp_json_roundtrip():
     m.add("create", "2017-04-27", dtype="timestamp")
     restored = Metadata.from_json(m.to_json())
     assert restored.get("create").value.utc == "2017-04-27T00:00:00+00:00"
+
+
+@pytest.mark.parametrize("text", ["1", "-1", " 12 ", "1_000", "1__0", "_1", "0x10", "1.5",
+                                  ".5", "5.", "1e5", "1.e5", "1e1_0", "inf", "-Infinity",
+                                  "nan", "nanx", "", " ", "abc", "1,5", "e5", "\t3\n",
+                                  "\x1c4", "١٢"])
+def test_parse_numbers_matches_int_float(text):
+    try:
+        expected = int(text)
+    except ValueError:
+        try:
+            expected = float(text)
+        except ValueError:
+            expected = None
+    got = dtypes.parse_numbers([text])[0]
+    assert type(got) is type(expected)
+    assert got == expected or (expected != expected and got != got)     # nan
+
+
+def test_lookup_cached_spec():
+    assert dtypes.lookup("float64") is dtypes.get("float")
+    assert dtypes.lookup(int) is dtypes.get("int")
+    assert dtypes.lookup(None) is dtypes.get("str")
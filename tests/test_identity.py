@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Identity-Map (``sdata.identity``) und ``Base.ancestors``."""
+import gc
+
+from sdata.base import Base
+from sdata.identity import IDENTITY_MAP, IdentityMap
+
+
+def _chain(depth):
+    """Kette root <- p1 <- ... als gespeicherte Dicts; gibt (store, leaf) zurück."""
+    store = {}
+    parent = None
+    for i in range(depth):
+        obj = Base(name="level_{}".format(i), parent=parent)
+        store[obj.sname] = obj.to_dict()
+        parent = obj
+    return store, parent
+
+
+def _loader(store, calls):
+    def load(sname):
+        calls.append(sname)
+        d = store.get(sname)
+        return Base.from_dict(d) if d is not None else None
+    return load
+
+
+def test_ancestors_load_each_parent_once():
+    store, leaf = _chain(6)
+    calls = []
+    imap = IdentityMap()
+    leaf = Base.from_dict(store[leaf.sname])
+    first = leaf.ancestors(_loader(store, calls), identity_map=imap)
+    assert [a.name for a in first] == ["level_4", "level_3", "level_2", "level_1", "level_0"]
+    second = leaf.ancestors(_loader(store, calls), identity_map=imap)
+    assert all(a is b for a, b in zip(first, second))
+    assert len(calls) == 5 and imap.misses == 5 and imap.hits == 5
+
+
+def test_weak_entries_outlive_lru_only_while_referenced():
+    imap = IdentityMap(maxsize=0)
+    obj = Base(name="x")
+    imap.register(obj)
+    assert imap.get(obj.sname) is obj and obj.sname in imap and len(imap) == 1
+    sname = obj.sname
+    del obj
+    gc.collect()
+    assert imap.get(sname) is None and len(imap) == 0
+
+
+def test_lru_is_bounded():
+    imap = IdentityMap(maxsize=2)
+    snames = []
+    for i in range(4):
+        obj = Base(name="o{}".format(i))
+        snames.append(obj.sname)
+        imap.register(obj)
+    del obj
+    gc.collect()
+    assert [imap.get(s) is not None for s in snames] == [False, False, True, True]
+
+
+def test_checksum_mismatch_reloads():
+    store, leaf = _chain(2)
+    calls = []
+    imap = IdentityMap()
+    load = _loader(store, calls)
+    root_sname = leaf.metadata.get(leaf.SDATA_PARENT_SNAME).value
+    a = imap.resolve(root_sname, load, checksum="v1")
+    assert imap.resolve(root_sname, load, checksum="v1") is a
+    b = imap.resolve(root_sname, load, checksum="v2")
+    assert b is not a and len(calls) == 2
+    assert leaf.ancestors(load, identity_map=imap, checksum=lambda s: "v2") == [b]
+
+
+def test_cycles_and_missing_parents_end_the_chain():
+    a = Base(name="a")
+    b = Base(name="b", parent=a)
+    a.metadata.set_attr(a.SDATA_PARENT_SNAME, b.sname)
+    objs = {a.sname: a, b.sname: b}
+    imap = IdentityMap()
+    assert b.ancestors(objs.get, identity_map=imap) == [a]
+    orphan = Base(name="c", parent_sname="Base__gone__" + "0" * 32)
+    assert orphan.ancestors(objs.get, identity_map=imap) == []
+
+
+def test_default_identity_map_is_process_wide():
+    store, leaf = _chain(2)
+    IDENTITY_MAP.clear()
+    parents = leaf.ancestors(_loader(store, []))
+    assert IDENTITY_MAP.get(parents[0].sname) is parents[0]
+    IDENTITY_MAP.clear()
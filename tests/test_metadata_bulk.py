@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Bulk-Aufbau von Metadata (``from_records``/``from_arrays``) == Einzelwert-Pfad."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdata.metadata import Metadata
+
+VALUES = ["1", "-1", " 12 ", "1_000", "1.5", "nan", "inf", "abc", "", "True", "false",
+          "0", 0, 1, 2.5, True, False, None, [1, 2], np.float64(1.5), np.int64(3), "١٢",
+          {"value": "3", "unit": "mm"},
+          {"value": "3", "dtype": "float", "unit": "mm", "description": "d", "required": "true"},
+          {"value": None, "dtype": None},
+          {"value": "x", "dtype": ""},
+          {"value": "2020-01-01", "dtype": "timestamp"},
+          {"value": "a,b", "dtype": "list"},
+          {"value": "bad", "dtype": "int"},
+          {"value": "1.5", "dtype": "float64", "label": None, "description": None},
+          {}]
+
+
+def _single(d, guess_dtype=True, metadata=None):
+    metadata = Metadata() if metadata is None else metadata
+    for key, value in d.items():
+        metadata._update_item(key, value, guess_dtype)
+    return metadata
+
+
+def _state(metadata):
+    return {key: {k: repr(v) for k, v in attr.to_dict().items()}
+            for key, attr in metadata.items()}
+
+
+@pytest.mark.parametrize("guess_dtype", [True, False])
+def test_from_records_equals_single_path(guess_dtype):
+    d = {"k{}".format(i): value for i, value in enumerate(VALUES)}
+    d[" spaced "] = "5"
+    d["spaced"] = "6"                      # gleicher Name -> Update wie bisher
+    expected = _state(_single(d, guess_dtype))
+    assert _state(Metadata.from_records(d, guess_dtype=guess_dtype)) == expected
+    assert _state(Metadata.from_dict(d)) == _state(_single(d))
+
+
+def test_update_existing_attributes_like_set_attr():
+    d = {"k{}".format(i): value for i, value in enumerate(VALUES)}
+    m1, m2 = Metadata(), Metadata()
+    for m in (m1, m2):
+        m.add("k0", 7.0, unit="kN")
+        m.add("k22", "x", unit="m")
+    _single(d, metadata=m1)
+    m2.update_from_dict(d)
+    assert _state(m2) == _state(m1)
+
+
+def test_from_records_iterable_with_duplicates():
+    records = [{"name": "a", "value": "1"}, {"name": "b", "value": "x"},
+               {"name": "a", "value": "2", "unit": "m"}]
+    single = Metadata()
+    for record in records:
+        single._update_item(record["name"], record)
+    assert _state(Metadata.from_records(records)) == _state(single)
+    m = Metadata.from_records(single.to_dict().values())
+    assert m.to_dict() == single.to_dict()
+
+
+def test_from_arrays():
+    frame = pd.DataFrame({"name": ["fx", "fy", "mat"], "value": ["1.2", "3", "steel"],
+                          "unit": ["kN", "kN", ""], "dtype": [None, "float", None]})
+    m = Metadata.from_arrays(frame["name"], frame["value"], units=frame["unit"],
+                             dtypes=frame["dtype"], descriptions=["x", "y", "z"])
+    assert m.get("fx").value == 1.2 and m.get("fx").unit == "kN" and m.get("fx").dtype == "float"
+    assert m.get("fy").value == 3.0 and m.get("fy").dtype == "float"
+    assert m.get("mat").value == "steel" and m.get("mat").description == "z"
+    n = Metadata.from_arrays(np.array(["a", "b"]), np.array([1.5, 2.0]), backend="columnar")
+    assert n.get("a").value == 1.5 and type(n.get("a").value) is float
+    assert n.df.shape == (2, 8)
+
+
+def test_guess_dtypes_from_values_matches_scalar():
+    values = [v for v in VALUES if not isinstance(v, dict)]
+    got = Metadata.guess_dtypes_from_values(values)
+    expected = [Metadata.guess_dtype_from_value(v) for v in values]
+    assert [repr(x) for x in zip(*got)] == [repr(x) for x in expected]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Kompakte Kodierung ``to_bytes``/``from_bytes`` für Metadata und Base."""
+import json
+
+import pytest
+
+from sdata import binpack
+from sdata.base import Base
+from sdata.metadata import Metadata, Attribute
+
+
+def _md(backend="sorteddict"):
+    m = Metadata(backend=backend)
+    m.add("force", 1.5, unit="kN", description="max force", ontology="qudt:Force")
+    m.add("material", "steel", required=True, label="Werkstoff")
+    m.add("points", "1,2", dtype="list")
+    m.add("measured", "2024-01-02T03:04:05", dtype="timestamp")
+    m.add("raw", b"\x00\xff", dtype="bytes")
+    m.add("count", 3)
+    m.add("_sdata_name", "probe")
+    return m
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def md(request):
+    return _md(request.param)
+
+
+@pytest.mark.parametrize("fmt", ["msgpack", "json"])
+def test_metadata_roundtrip(md, fmt):
+    data = md.to_bytes(fmt)
+    expected = Metadata.from_dict(md.to_dict()).to_json()
+    assert Metadata.from_bytes(data).to_json() == expected
+    assert Metadata.from_bytes(data, backend="columnar").to_json() == expected
+
+
+def test_metadata_bytes_are_compact(md):
+    assert len(md.to_bytes()) < len(md.to_bytes("json")) < len(md.to_json())
+    doc = json.loads(md.to_bytes("json"))
+    table, index = doc["unit"]
+    assert sorted(table) == ["-", "kN"]                 # Wörterbuch der Einheiten
+    assert len(index) == md.size
+
+
+def test_metadata_pure_python_backend(md, monkeypatch):
+    data = md.to_bytes()
+    monkeypatch.setattr(binpack, "_msgpack", None)
+    assert md.to_bytes() == data
+    assert Metadata.from_bytes(data).to_json() == md.to_json()
+
+
+def test_metadata_empty_and_fallback():
+    assert Metadata.from_bytes(Metadata().to_bytes()).size == 0
+    m = Metadata()
+    m.add_attribute(Attribute("c", 1), prefix="a_")
+    m.add_attribute(Attribute("c", 2), prefix="b_")       # doppelter Name wie in to_dict
+    assert Metadata.from_bytes(m.to_bytes()).to_dict() == Metadata.from_dict(m.to_dict()).to_dict()
+
+
+def test_metadata_bytes_errors(md):
+    with pytest.raises(ValueError):
+        Metadata.from_bytes(Base(name="x").to_bytes())
+    with pytest.raises(ValueError):
+        md.to_bytes("xml")
+
+
+@pytest.mark.parametrize("fmt", ["msgpack", "json"])
+def test_base_roundtrip(fmt):
+    b = Base(name="probe", description="tensile test")
+    b.metadata.add("force", 1.5, unit="kN")
+    b.data = {"x": [1, 2], "nested": {"a": None}}
+    data = b.to_bytes(fmt)
+    c = Base.from_bytes(data)
+    assert c.class_name == b.class_name and c.sname == b.sname
+    assert c.to_json() == b.to_json()
+    assert len(data) < len(b.to_json(compact=True)) < len(b.to_json())
+
+
+def test_base_to_json_compact(tmp_path):
+    b = Base(name="probe")
+    compact = b.to_json(compact=True)
+    assert "\n" not in compact and ", " not in compact
+    assert json.loads(compact) == json.loads(b.to_json())
+    path = tmp_path / "b.json"
+    b.to_json(str(path), compact=True)
+    assert Base.from_json(str(path)).to_json() == b.to_json()
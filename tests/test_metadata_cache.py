@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Gecachte abgeleitete Sichten der Metadata (Partitionen, DataFrames, Präfixe)."""
+import copy
+import pickle
+
+import pytest
+
+from sdata.metadata import Metadata, Attribute
+
+
+def _md(backend="sorteddict"):
+    m = Metadata(backend=backend)
+    m.add("a", 1.5, unit="mm")
+    m.add("b", "x", required=True)
+    m.add("_sdata_sname", "Meta__x__abc")
+    return m
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def md(request):
+    return _md(request.param)
+
+
+def _count_builds(monkeypatch, m):
+    calls = []
+    build = m._to_dataframe
+    monkeypatch.setattr(m, "_to_dataframe", lambda attrs: calls.append(1) or build(attrs))
+    return calls
+
+
+def test_repeated_reads_are_cached(md, monkeypatch):
+    assert md.user_attributes is md.user_attributes
+    assert md.sdata_attributes is md.sdata_attributes
+    assert list(md.required_attributes) == ["b"]
+    calls = _count_builds(monkeypatch, md)
+    for _ in range(10):
+        md.df
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("write", [
+    lambda m: m.add("c", 3.0),
+    lambda m: m.set_attr("a", 2.0),
+    lambda m: m.__setitem__("c", 3.0),
+    lambda m: m.__setitem__("a", 2.0),
+    lambda m: m.__delitem__("a"),
+    lambda m: m.pop("a"),
+    lambda m: m.relabel("a", "aa"),
+    lambda m: m.add_attribute(Attribute("c", 1)),
+    lambda m: setattr(m.get("a"), "unit", "m"),        # direkte Attribut-Änderung
+    lambda m: setattr(m.get("a"), "name", "_sdata_a"),
+])
+def test_writes_invalidate(md, write):
+    df, user = md.df, md.user_attributes
+    write(md)
+    assert md.df.equals(md._to_dataframe(md._attributes))      # ungecachter Neuaufbau
+    assert not md.df.equals(df)
+    assert md.udf.equals(md._partition_frame("user"))
+    assert md.user_attributes is not user
+    assert list(md.user_attributes) == sorted(a.name for a in md.values()
+                                              if not a.name.startswith("_sdata"))
+
+
+def test_returned_frames_are_independent(md):
+    df = md.df
+    df.loc["a", "unit"] = "changed"
+    assert md.df.loc["a", "unit"] == "mm"
+
+
+def test_get_prefixed_range():
+    m = Metadata()
+    for key in ["a", "pre", "pre_x", "pre_y", "prf", "pr", "z"]:
+        m.add(key, 1.0)
+    assert m.get_prefixed("pre").keys() == ["pre", "pre_x", "pre_y"]
+    assert m.get_prefixed("q").keys() == []
+    assert m.get_prefixed("").keys() == m.keys()
+
+
+def test_cache_not_pickled(md):
+    md.df
+    for other in (pickle.loads(pickle.dumps(md)), copy.deepcopy(md)):
+        assert other._cache == {}
+        other.get("a").unit = "m"
+        assert other.df.loc["a", "unit"] == "m" and md.df.loc["a", "unit"] == "mm"
+
+
+def test_partitions_are_read_only(md):
+    with pytest.raises(TypeError):
+        md.user_attributes["x"] = Attribute("x", 1)
+    assert "x" not in md.user_attributes and "x" not in md
+
+
+def test_writes_to_other_objects_keep_the_cache(md, monkeypatch):
+    others = _md(), _md("columnar")
+    user = md.user_attributes
+    calls = _count_builds(monkeypatch, md)
+    md.df
+    for i in range(5):
+        for other in others:
+            other.set_attr("a", float(i))
+            other.get("b").unit = "m"
+        md.df
+    assert len(calls) == 1 and md.user_attributes is user
+
+
+def test_shared_attribute_notifies_every_owner():
+    a, b = Metadata(), Metadata()
+    attr = Attribute("x", 1.0)
+    a.add_attribute(attr)
+    b.add_attribute(attr)
+    dfs = a.df, b.df
+    attr.unit = "mm"
+    assert a.df.loc["x", "unit"] == "mm" and b.df.loc["x", "unit"] == "mm"
+    b.pop("x")
+    attr.unit = "m"
+    assert a.df.loc["x", "unit"] == "m"
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Spaltenorientiertes Metadata-Backend (``Metadata(backend="columnar")``)."""
+import copy
+import pickle
+
+import pandas as pd
+import pytest
+
+from sdata.columnar import AttributeTable
+from sdata.metadata import Metadata, Attribute
+
+
+def _fill(m):
+    m.add("a", 1.5, unit="mm", description="a float")
+    m.add("_sdata_sname", "Meta__x__abc")
+    m.add("b", "hello")
+    m.add("c", [1, 2], dtype="list")
+    m.add("d", 3)
+    m.add("e", True, dtype="bool", required=True)
+    m["f"] = 4.0
+    return m
+
+
+def test_columnar_backend_selected():
+    assert isinstance(Metadata(backend="columnar")._attributes, AttributeTable)
+    with pytest.raises(ValueError):
+        Metadata(backend="nope")
+
+
+@pytest.mark.parametrize("prop", ["df", "udf", "sdf", "dft"])
+def test_columnar_frames_equal_default(prop):
+    left = getattr(_fill(Metadata()), prop)
+    right = getattr(_fill(Metadata(backend="columnar")), prop)
+    pd.testing.assert_frame_equal(left, right)
+
+
+def test_columnar_empty_frames_equal_default():
+    pd.testing.assert_frame_equal(Metadata().df, Metadata(backend="columnar").df)
+    pd.testing.assert_frame_equal(Metadata().udf, Metadata(backend="columnar").udf)
+
+
+def test_columnar_serialisation_equal_default():
+    left, right = _fill(Metadata()), _fill(Metadata(backend="columnar"))
+    assert left.to_dict() == right.to_dict()
+    assert left.sha3_256 == right.sha3_256
+    m = Metadata.from_dict(left.to_dict(), backend="columnar")
+    assert isinstance(m._attributes, AttributeTable)
+    assert m.to_dict() == left.to_dict()
+
+
+def test_columnar_live_view_and_relabel():
+    m = _fill(Metadata(backend="columnar"))
+    a = m.get("a")
+    a.value = "2.5"                       # Coercion wie bei Attribute
+    a.unit = "m"
+    assert m.get("a") is a and m.get("a").value == 2.5 and m.df.loc["a", "unit"] == "m"
+    m.relabel("a", "aa")
+    assert m.get("a") is None and m.get("aa") is a and a.name == "aa"
+    assert list(m.keys()) == sorted(m.keys())
+
+
+def test_columnar_foreign_attribute_by_value():
+    m = Metadata(backend="columnar")
+    x = Attribute("x", 5, dtype="int")
+    m.add_attribute(x)
+    x.value = 6
+    assert m.get("x").value == 5
+    m.set_attr("x", 7)
+    assert m.get("x").value == 7
+
+
+def test_rows_pass_to_the_dict_backend_by_value():
+    col = _fill(Metadata(backend="columnar"))
+    m = Metadata()
+    m.add_attribute(col.get("a"))
+    m.set_attr(col.get("d"))
+    m["f"] = col.get("f")
+    sub = col.get_prefixed("_sdata")
+    for key in ("a", "d", "f"):
+        assert type(m.get(key)) is Attribute
+    assert type(sub.get("_sdata_sname")) is Attribute
+    assert m.get("a").to_dict() == col.get("a").to_dict()
+    col.get("a").value = 9.0
+    m.get("d").value = 8
+    assert m.get("a").value == 1.5 and col.get("d").value == 3
+    assert sub.get("_sdata_sname").value == "Meta__x__abc"
+    back = Metadata(backend="columnar")
+    back.add_attribute(m.get("a"))
+    assert back.get("a").value == 1.5
+
+
+def test_columnar_pop_compact_keeps_views():
+    m = Metadata(backend="columnar")
+    for i in range(300):
+        m.add("k{:03d}".format(i), i)
+    kept = m.get("k299")
+    popped = [m.pop("k{:03d}".format(i)) for i in range(200)]
+    assert m.size == 100 and len(m._attributes._cols["name"]) < 300   # kompaktiert
+    assert kept.value == 299 and m.get("k299") is kept
+    assert popped[1].name == "k001" and popped[1].value == 1
+    m.add_attribute(popped[1])
+    assert m.get("k001") is popped[1]
+
+
+def test_columnar_copy_pickle_independent():
+    m = _fill(Metadata(backend="columnar"))
+    c = m.copy()
+    c.get("c").value.append("3")
+    c.get("a").value = 9
+    assert m.get("a").value == 1.5 and m.get("c").value == ["1", "2"]
+    p = pickle.loads(pickle.dumps(m))
+    assert p.to_dict() == m.to_dict()
+    a = pickle.loads(pickle.dumps(m.get("a")))
+    assert type(a) is Attribute and a.to_dict() == m.get("a").to_dict()
+    assert type(copy.copy(m.get("a"))) is Attribute
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Copy-on-write von ``Metadata.copy``: geteilte Attribute, Verhalten wie tiefe Kopie."""
+import copy
+import pickle
+
+import pytest
+
+from sdata.metadata import Metadata, Attribute
+
+
+def _md():
+    m = Metadata(name="orig")
+    m.add("a", 1.5, unit="mm")
+    m.add("b", "x")
+    m.add("lst", "p,q", dtype="list")
+    m.add_attribute(Attribute("c", 3), prefix="pre_")
+    m.add("_sdata_name", "orig")
+    return m
+
+
+def test_copy_shares_scalar_attributes_until_access():
+    m = _md()
+    c = m.copy()
+    assert dict.__getitem__(c._attributes, "a") is dict.__getitem__(m._attributes, "a")
+    assert dict.__getitem__(c._attributes, "lst") is not dict.__getitem__(m._attributes, "lst")
+    assert c.to_dict() == m.to_dict() and c.df.equals(m.df)
+    assert c.get("a") is not m.get("a")          # Herausgabe -> eigener Klon
+
+
+@pytest.mark.parametrize("write", [
+    lambda m: setattr(m.get("a"), "value", 9.0),
+    lambda m: setattr(m.get("pre_c"), "unit", "kN"),
+    lambda m: m.get("lst").value.append("r"),
+    lambda m: m.set_attr("b", "y"),
+    lambda m: m.__setitem__("a", 7.0),
+    lambda m: m.relabel("a", "aa"),
+    lambda m: m.pop("b").__setattr__("value", "z"),
+    lambda m: setattr(m, "name", "renamed"),
+    lambda m: [setattr(a, "label", "L") for a in m.values()],
+    lambda m: [setattr(a, "label", "L") for a in m.user_attributes.values()],
+    lambda m: setattr(m.get_prefixed("pre_").get("pre_c"), "value", 5),
+])
+@pytest.mark.parametrize("side", ["original", "copy"])
+def test_writes_do_not_leak(write, side):
+    m = _md()
+    c = m.copy()
+    expected = _md().to_dict()
+    write(m if side == "original" else c)
+    untouched = c if side == "original" else m
+    assert untouched.to_dict() == expected
+    assert untouched.df.equals(_md().df)
+
+
+def test_reference_taken_before_copy_stays_with_original():
+    m = _md()
+    a = m.get("a")
+    c = m.copy()
+    a.value = 2.0
+    assert m.get("a") is a and m.get("a").value == 2.0
+    assert c.get("a").value == 1.5
+
+
+def test_copy_of_copy_and_serialisation():
+    m = _md()
+    c1 = m.copy()
+    c2 = c1.copy()
+    m.get("a").value = 2.0
+    c1.get("a").value = 3.0
+    assert (m.get("a").value, c1.get("a").value, c2.get("a").value) == (2.0, 3.0, 1.5)
+    for other in (pickle.loads(pickle.dumps(c2)), copy.deepcopy(c2)):
+        assert other.to_dict() == c2.to_dict()
+        other.get("b").value = "changed"
+        assert c2.get("b").value == "x"
+
+
+def test_columnar_copy_independent():
+    m = Metadata.from_dict(_md().to_dict(), backend="columnar")
+    c = m.copy()
+    c.get("a").value = 9.0
+    assert m.get("a").value == 1.5
+
+
+def test_sharers_are_tracked_per_source():
+    m, other = _md(), _md()
+    c = m.copy()
+    assert set(m._cow_sharers) == {c} and not other._cow_sharers
+    other.get("a").value = 2.0                   # fremde Schreibzugriffe lassen c in Ruhe
+    assert dict.__getitem__(c._attributes, "a") is dict.__getitem__(m._attributes, "a")
+    c.values()                                   # gibt alle Attribute heraus
+    assert c._cow_epoch is None and not m._cow_sharers
+    m.get("a").value = 3.0
+    assert c.get("a").value == 1.5
+
+
+def test_copy_of_copy_after_source_write():
+    m = _md()
+    c1 = m.copy()
+    c2 = c1.copy()
+    a = dict.__getitem__(m._attributes, "a")
+    assert set(m._cow_sharers) == {c1, c2}
+    a.unit = "m"
+    assert c1.get("a").unit == c2.get("a").unit == "mm"
+    del c1
+    m.get("b").value = "y"
+    assert c2.get("b").value == "x"
+
+
+@pytest.mark.parametrize("insert", [
+    lambda c, x: c.add_attribute(x),
+    lambda c, x: c.set_attr(x),
+], ids=["add_attribute", "set_attr"])
+def test_attribute_added_after_copy_keeps_identity(insert):
+    m = _md()
+    x = Attribute("n", 1, dtype="int")
+    c = m.copy()
+    insert(c, x)
+    assert c.get("n") is x
+    x.value = 2
+    assert c.get("n").value == 2 and "n" not in m
+    c2 = c.copy()
+    x.value = 3
+    assert c2.get("n").value == 2 and c.values() and c.get("n") is x
+
+
+def test_shared_attribute_added_under_new_key():
+    m = _md()
+    c = m.copy()
+    a = m.get("a")
+    c.add_attribute(a, prefix="alias_")
+    a.value = 2.0
+    assert c.get("alias_a") is a and c.get("alias_a").value == 2.0
+    assert c.get("a") is not a and c.get("a").value == 1.5
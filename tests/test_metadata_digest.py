@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Inkrementeller Merkle-Hash ``Metadata.sha3_256``."""
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from sdata.metadata import Metadata, Attribute, _DigestTree
+
+
+def _md(backend="sorteddict", order=("a", "b", "lst", "_sdata_name")):
+    m = Metadata(backend=backend)
+    values = {"a": dict(value=1.5, unit="mm"), "b": dict(value="x", required=True),
+              "lst": dict(value="p,q", dtype="list"), "_sdata_name": dict(value="orig")}
+    for key in order:
+        m.add(key, **values[key])
+    return m
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def md(request):
+    return _md(request.param)
+
+
+def _count_leaves(monkeypatch):
+    calls = []
+    leaf = _DigestTree.leaf
+    monkeypatch.setattr(_DigestTree, "leaf",
+                        staticmethod(lambda key, attr: calls.append(key) or leaf(key, attr)))
+    return calls
+
+
+def test_digest_depends_on_content_only():
+    h = _md().sha3_256
+    assert len(h) == 64
+    assert _md(order=("lst", "_sdata_name", "b", "a")).sha3_256 == h
+    assert _md("columnar").sha3_256 == h
+    assert Metadata.from_dict(_md().to_dict()).sha3_256 == h
+    assert Metadata().sha3_256 != h
+
+
+def test_digest_deterministic_across_processes():
+    code = ("from tests.test_metadata_digest import _md; "
+            "print(_md().sha3_256)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, env={"PYTHONHASHSEED": "123"}, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert out.stdout.split()[-1] == _md().sha3_256
+
+
+@pytest.mark.parametrize("write", [
+    lambda m: m.add("c", 2),
+    lambda m: m.set_attr("a", 2.5),
+    lambda m: setattr(m.get("a"), "unit", "m"),
+    lambda m: setattr(m.get("b"), "description", "changed"),
+    lambda m: m.get("lst").value.append("r"),            # In-place, ohne Revision
+    lambda m: m.pop("b"),
+    lambda m: m.relabel("b", "b2"),
+    lambda m: m.__delitem__("a"),
+    lambda m: m.add_attribute(Attribute("a", 1.5, unit="cm")),
+])
+def test_every_change_changes_digest(md, write):
+    before = md.sha3_256
+    write(md)
+    after = md.sha3_256
+    assert after != before
+    assert after == Metadata.from_dict(md.to_dict()).sha3_256
+
+
+def test_only_changed_attributes_are_rehashed(monkeypatch):
+    m = Metadata.from_records({"a{:03d}".format(i): float(i) for i in range(300)})
+    h = m.sha3_256
+    calls = _count_leaves(monkeypatch)
+    assert m.sha3_256 == h
+    assert calls == []
+    m.get("a007").value = 3.0
+    assert m.sha3_256 != h
+    assert calls == ["a007"]
+    m.get("a007").value = 7.0
+    assert m.sha3_256 == h
+    m.pop("a008")
+    m.sha3_256
+    assert calls == ["a007", "a007"]
+
+
+def test_digest_survives_copy_and_pickle(md):
+    h = md.sha3_256
+    for other in (md.copy(), copy.deepcopy(md), pickle.loads(pickle.dumps(md))):
+        assert other._digest is None or other._digest is not md._digest
+        assert other.sha3_256 == h
+    c = md.copy()
+    c.get("a").value = 9.0
+    assert md.sha3_256 == h and c.sha3_256 != h
+
+
+def test_attribute_writes_skip_the_full_comparison(md, monkeypatch):
+    h = md.sha3_256
+    other = _md()
+    full = []
+    refresh = _DigestTree.refresh
+    monkeypatch.setattr(_DigestTree, "refresh",
+                        lambda self, *args: full.append(1) or refresh(self, *args))
+    other.get("a").value = 2.0                   # anderes Objekt: hier nichts zu tun
+    assert md.sha3_256 == h
+    calls = _count_leaves(monkeypatch)
+    md.get("a").unit = "m"
+    md.get("b").description = "changed"
+    after = md.sha3_256
+    assert full == [] and sorted(set(calls) - {"lst"}) == ["a", "b"]
+    assert after == Metadata.from_dict(md.to_dict()).sha3_256
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Verzögerte Coercion beim Laden (``from_dict(..., lazy=True)``)."""
+import copy
+import json
+import pickle
+
+import pytest
+
+import sdata.dtypes
+from sdata.base import Base
+from sdata.metadata import Metadata, _Lazy
+
+
+def _stored():
+    m = Metadata()
+    m.add("material", "steel")
+    m.add("force", 1.5, unit="kN")
+    m.add("ctime", "2024-01-02T03:04:05", dtype="timestamp")
+    m.add("tolerance", "0.0125", dtype="decimal")
+    m.add("setup", '{"machine": "Z100", "clamps": [1, 2]}', dtype="json")
+    m.add("points", "1.0,2.0", dtype="floatlist")
+    return json.loads(m.to_json())
+
+
+def _count_coercions(monkeypatch):
+    calls = []
+    coerce = sdata.dtypes.DtypeSpec.coerce
+    monkeypatch.setattr(sdata.dtypes.DtypeSpec, "coerce",
+                        lambda self, value, *args, **kw: calls.append(self.name)
+                        or coerce(self, value, *args, **kw))
+    return calls
+
+
+def test_values_are_coerced_on_first_access(monkeypatch):
+    d = _stored()
+    calls = _count_coercions(monkeypatch)
+    m = Metadata.from_dict(d, lazy=True)
+    assert calls == []
+    assert all(type(attr._value) is _Lazy for attr in m._attributes.values())
+    assert str(m.get("ctime").value) == "2024-01-02T03:04:05+00:00"
+    ctime = m.get("ctime").value
+    assert m.get("ctime").value is ctime                # Ergebnis wird gespeichert
+    assert calls == ["timestamp"]
+    assert d["ctime"]["value"] == "2024-01-02T03:04:05+00:00"   # Rohwert unangetastet
+
+
+@pytest.mark.parametrize("view", [
+    lambda m: m.to_json(),
+    lambda m: m.df.to_json(),
+    lambda m: m.sha3_256,
+    lambda m: Metadata.from_bytes(m.to_bytes()).to_json(),
+    lambda m: m.copy().to_json(),
+    lambda m: copy.deepcopy(m).to_json(),
+    lambda m: pickle.loads(pickle.dumps(m)).to_json(),
+])
+def test_lazy_equals_eager(view):
+    d = _stored()
+    assert view(Metadata.from_dict(d, lazy=True)) == view(Metadata.from_dict(d))
+
+
+@pytest.mark.parametrize("backend", ["sorteddict", "columnar"])
+def test_lazy_equals_eager_after_dtype_change(backend):
+    d = _stored()
+    d["ratio"] = {"name": "ratio", "value": "1.7", "dtype": "float"}
+    loaded = [Metadata.from_dict(d, lazy=lazy, backend=backend) for lazy in (True, False)]
+    for m in loaded:
+        m.get("ctime").dtype = "str"
+        m.get("ratio").dtype = int
+        m.update_from_dict({"force": {"value": 1.5, "dtype": "str"}})
+    lazy, eager = loaded
+    assert eager.get("ctime").value == "2024-01-02T03:04:05+00:00"
+    assert eager.get("ratio").value == 1
+    assert lazy.to_json() == eager.to_json()
+
+
+def test_lazy_columnar_and_writes():
+    d = _stored()
+    assert (Metadata.from_dict(d, lazy=True, backend="columnar").to_json()
+            == Metadata.from_dict(d).to_json())
+    m = Metadata.from_dict(d, lazy=True)
+    m.get("force").dtype = "int"                         # Re-Cast des noch rohen Werts
+    assert m.get("force").value == 1
+    m.get("tolerance").value = "0.5"
+    assert str(m.get("tolerance").value) == "0.5"
+
+
+def test_lazy_coercion_error_is_lenient(caplog):
+    m = Metadata.from_dict({"n": {"name": "n", "value": "x", "dtype": "int"}}, lazy=True)
+    assert m.get("n").value is None
+    assert "error Attribute.value" in caplog.text
+
+
+def test_base_lazy():
+    b = Base(name="probe")
+    for i in range(10):
+        b.metadata.add("f{}".format(i), "1.5", dtype="float")
+    text = b.to_json()
+    c = Base.from_json(text, lazy=True)
+    assert all(type(dict.__getitem__(c.metadata._attributes, "f{}".format(i))._value) is _Lazy
+               for i in range(10))
+    assert c.sname == b.sname
+    assert Base.from_bytes(b.to_bytes(), lazy=True).to_json() == b.to_json()
+    assert c.to_json() == Base.from_json(text).to_json()
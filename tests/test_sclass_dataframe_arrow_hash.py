@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Kanonischer Arrow-Inhalts-Hash (arrow_sha256) und Prüfsummen-Methoden."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from sdata.sclass.arrowhash import arrow_digest
+from sdata.sclass.dataframe import DataFrame
+
+
+def _table():
+    return pa.table({"i": [1, None, 3, 4], "f": [0.5, 1.5, None, 2.5],
+                     "s": ["a", None, "ccc", ""], "b": [True, False, None, True],
+                     "t": pa.array([0, 1, 2, 3], pa.timestamp("ms")),
+                     "l": [[1], [], None, [2, 3]]})
+
+
+def test_digest_independent_of_chunking_and_offsets():
+    table = _table()
+    chunked = pa.concat_tables([table.slice(0, 1), table.slice(1, 2), table.slice(3)])
+    assert chunked.column("i").num_chunks == 3
+    assert arrow_digest(chunked) == arrow_digest(table)
+    assert arrow_digest(table.slice(1, 2)) == arrow_digest(
+        pa.Table.from_pylist(table.slice(1, 2).to_pylist(), schema=table.schema))
+    assert arrow_digest(table, workers=0) == arrow_digest(table, workers=4)
+
+
+def test_digest_canonical_types_and_sensitivity():
+    table = _table()
+    large = table.set_column(2, "s", table.column("s").cast(pa.large_string()))
+    assert arrow_digest(large) == arrow_digest(table)
+    encoded = table.set_column(2, "s", table.column("s").dictionary_encode())
+    assert arrow_digest(encoded) == arrow_digest(table)
+    assert arrow_digest(table.rename_columns(["j", "f", "s", "b", "t", "l"])) != arrow_digest(table)
+    changed = table.set_column(1, "f", pa.array([0.5, 1.5, None, 2.75]))
+    assert arrow_digest(changed) != arrow_digest(table)
+    nulled = table.set_column(0, "i", pa.array([1, 0, 3, 4]))
+    assert arrow_digest(nulled) != arrow_digest(table)     # 0 != null
+    assert arrow_digest(table, algo="md5") != arrow_digest(table)
+    assert len(arrow_digest(table, algo="md5")) == 32
+
+
+def test_arrow_sha256_same_in_both_storage_modes():
+    df = pd.DataFrame({"x": np.arange(100.0), "y": list("ab") * 50})
+    p = DataFrame(df=df.copy())
+    a = DataFrame(df=df.copy(), storage="arrow")
+    assert p.arrow_sha256 == a.arrow_sha256
+    p.df.loc[0, "x"] = -1.0
+    assert p.arrow_sha256 != a.arrow_sha256
+
+
+def test_checksum_method_opt_in():
+    sdf = DataFrame(df=pd.DataFrame({"x": [1.0, 2.0]}))
+    assert sdf.update_checksum() == sdf.sha256
+    assert sdf.metadata.get("checksum_method") is None
+    assert sdf.verify()
+    digest = sdf.update_checksum(method="arrow")
+    assert digest == sdf.arrow_sha256
+    assert sdf.metadata.get("checksum_method").value == "arrow"
+    assert sdf.verify()
+    sdf.df.loc[0, "x"] = 5.0
+    assert not sdf.verify()
+    sdf.update_checksum(method="bytes")              # zurück: Methode wird mitgeführt
+    assert sdf.metadata.get("checksum_method").value == "bytes"
+    assert sdf.verify()
+    with pytest.raises(ValueError):
+        sdf.update_checksum(method="crc")
+
+
+def test_class_default_checksum_method(monkeypatch):
+    monkeypatch.setattr(DataFrame, "CHECKSUM_METHOD", "arrow")
+    sdf = DataFrame(df=pd.DataFrame({"x": [1.0]}))
+    assert sdf.update_checksum() == sdf.arrow_sha256
+    assert sdf.verify()
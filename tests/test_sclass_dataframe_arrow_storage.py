@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Arrow-Speichermodus: pyarrow.Table als Puffer, pandas-Sicht erst bei Bedarf."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def _df():
+    return pd.DataFrame({"force": np.linspace(0.0, 1.0, 8), "tag": list("abcdefgh")})
+
+
+def _arrow_sdf():
+    sdf = DataFrame(df=_df(), name="x", storage="arrow")
+    sdf.set_column("force", unit="kN", label="Kraft")
+    return sdf
+
+
+def test_invalid_storage_raises():
+    with pytest.raises(ValueError):
+        DataFrame(storage="polars")
+    sdf = DataFrame(df=_df())
+    with pytest.raises(ValueError):
+        sdf.storage = "polars"
+
+
+def test_arrow_mode_keeps_table_without_pandas_view():
+    sdf = _arrow_sdf()
+    assert sdf.storage == "arrow"
+    assert sdf._table is not None and sdf._df is None
+    assert len(sdf) == 8
+    assert sdf.shape == (8, 2)
+    assert list(sdf.columns) == ["force", "tag"]
+    assert sdf.dtypes["force"] == np.float64
+    assert sdf.column_metadata.get("force").value == "float64"
+    assert len(sdf.head(3)) == 3
+    assert sdf._df is None                       # nichts davon erzeugt die Sicht
+
+
+@pytest.mark.parametrize("read", [
+    lambda sdf: sdf.describe(),
+    lambda sdf: sdf.to_csv(),
+    lambda sdf: sdf.to_dataframe(),
+    lambda sdf: sdf._ordered_columns(),
+    lambda sdf: sdf.to_datapackage(),
+], ids=["describe", "to_csv", "to_dataframe", "ordered_columns", "to_datapackage"])
+def test_internal_reads_keep_the_table(read):
+    sdf = _arrow_sdf()
+    table = sdf._table
+    read(sdf)
+    view = sdf._df
+    read(sdf)
+    assert sdf._table is table and sdf._df is view       # Sicht einmal gebaut, behalten
+    assert sdf.to_arrow().column("force").to_pylist() == _df()["force"].tolist()
+    sdf.df                                               # herausgegeben: df maßgeblich
+    assert sdf._table is None
+
+
+def test_df_materialises_once_and_becomes_authoritative():
+    sdf = _arrow_sdf()
+    view = sdf.df
+    assert sdf._table is None
+    assert sdf.df is view
+    assert view.index.name == "index"
+    assert "_sdata" not in view.attrs
+    view["force"] = view["force"] * 2            # Änderung muss in Exporte eingehen
+    assert DataFrame.from_arrow(sdf.to_arrow()).df["force"].iloc[-1] == 2.0
+
+
+def test_df_view_is_zero_copy_for_numeric_columns():
+    table = pa.table({"x": np.arange(1000, dtype="float64")})
+    sdf = DataFrame.from_arrow(table, storage="arrow")
+    buf = sdf._table.column("x").chunk(0).buffers()[1]
+    values = sdf.df["x"].to_numpy()
+    assert values.__array_interface__["data"][0] == buf.address
+
+
+def test_content_bytes_and_checksum_match_pandas_mode():
+    p = DataFrame(df=_df(), name="x")
+    a = DataFrame(df=_df(), name="x", storage="arrow")
+    assert a.content_bytes == p.content_bytes
+    assert a.sha256 == p.sha256
+
+
+def test_to_arrow_carries_field_and_schema_metadata():
+    schema = _arrow_sdf().to_arrow().schema
+    assert schema.field("force").metadata[b"unit"] == b"kN"
+    assert b"_sdata" in schema.metadata
+
+
+def test_parquet_roundtrip_between_modes(tmp_path):
+    fp = _arrow_sdf().to_parquet(path=str(tmp_path))
+    a = DataFrame.from_parquet(fp, storage="arrow")
+    assert a._table is not None
+    assert a.column_units["force"] == "kN"
+    assert a.get_column("force").label == "Kraft"
+    assert b"PANDAS_ATTRS" not in (a._table.schema.metadata or {})
+    p = DataFrame.from_parquet(fp)                # pandas-Leser versteht dieselbe Datei
+    assert p.column_units["force"] == "kN"
+    pd.testing.assert_frame_equal(p.df, a.df)
+
+
+def test_parquet_bytes_dict_and_feather_roundtrip(tmp_path):
+    src = _arrow_sdf()
+    a = DataFrame.from_parquet_bytes(src.to_parquet(), storage="arrow")
+    assert a.storage == "arrow" and a.column_units["force"] == "kN"
+    b = DataFrame.from_dict(src.to_dict(), storage="arrow")
+    assert b._table is not None and b.column_units["force"] == "kN"
+    fp = src.to_feather(path=str(tmp_path))
+    c = DataFrame.from_feather(fp, storage="arrow")
+    assert c._table is not None and c.get_column("force").label == "Kraft"
+    pd.testing.assert_frame_equal(c.df, _df().rename_axis("index"), check_dtype=False)
+
+
+def test_storage_setter_converts():
+    sdf = DataFrame(df=_df())
+    sdf.storage = "arrow"
+    assert sdf._table is not None and sdf._df is None
+    sdf.storage = "pandas"
+    assert sdf._table is None and isinstance(sdf._df, pd.DataFrame)
+
+
+def test_assign_arrow_table_in_pandas_mode():
+    sdf = DataFrame()
+    sdf.df = pa.table({"a": [1, 2]})
+    assert list(sdf.columns) == ["a"]
+    assert "a" in sdf.column_metadata.keys()
+
+
+def test_convert_in_arrow_mode():
+    sdf = DataFrame(df=pd.DataFrame({"x": [1.0, 2.0]}), storage="arrow")
+    sdf.set_column("x", unit="m")
+    out = sdf.convert({"x": "mm"})
+    assert out.df["x"].tolist() == [1000.0, 2000.0]
+    assert sdf._table is not None                # Original unverändert
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Vektorisierte Umrechnung: Koeffizienten gecacht, unveränderte Spalten geteilt."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdata import units
+from sdata.sclass.dataframe import DataFrame
+
+
+def _recording(storage="pandas"):
+    df = pd.DataFrame({"time": np.arange(4, dtype="float64"),
+                       "force": np.array([1000, 2000, 3000, 4000]),
+                       "temp": [20.0, 21.0, 22.0, 23.0],
+                       "note": list("abcd")})
+    sdf = DataFrame(name="rec", df=df, storage=storage)
+    for col, unit in (("time", "s"), ("force", "N"), ("temp", "degC")):
+        sdf.set_column(col, unit=unit)
+    return sdf
+
+
+def test_conversion_coefficients_are_cached():
+    units._pair.cache_clear()
+    assert units.conversion_coefficients("N", "kN") == (1.0, 0.0, 1000.0)
+    assert units.conversion_coefficients("degC", "K") == (1.0, 273.15, 1.0)
+    with pytest.raises(units.UnitConversionError, match="incompatible"):
+        units.conversion_coefficients("mm", "kN")
+    assert units.conversion_coefficients("N", "kN") == (1.0, 0.0, 1000.0)
+    assert units._pair.cache_info().hits == 1
+
+
+def test_system_coefficients_are_resolved_once(monkeypatch):
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    assert system.coefficients_for("MPa") == (1e6, 0.0, 1e9, "GPa")
+    assert system.coefficients_for("degC") is None
+    monkeypatch.setattr(system, "_resolve", lambda dim: pytest.fail("resolved again"))
+    assert system.coefficients_for("MPa") == (1e6, 0.0, 1e9, "GPa")
+    assert system.coefficients_for("degC") is None
+
+
+def test_copy_shares_unconverted_columns():
+    sdf = _recording()
+    conv = sdf.convert(["kN", "mm", "ms"])
+    assert conv.df["force"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert conv.df["time"].tolist() == [0.0, 1000.0, 2000.0, 3000.0]
+    assert np.shares_memory(conv.df["temp"].to_numpy(), sdf.df["temp"].to_numpy())
+    assert sdf.df["force"].tolist() == [1000, 2000, 3000, 4000]     # Original bleibt
+    assert conv.column_units["force"] == "kN" and sdf.column_units["force"] == "N"
+    assert list(conv.df.columns) == ["time", "force", "temp", "note"]
+
+
+def test_offset_units_in_mapping():
+    conv = _recording().convert({"temp": "K", "time": "ms"})
+    assert conv.df["temp"].tolist() == pytest.approx([293.15, 294.15, 295.15, 296.15])
+    assert conv.df["time"].tolist() == [0.0, 1000.0, 2000.0, 3000.0]
+    assert conv.column_units == {"time": "ms", "force": "N", "temp": "K", "note": "-"}
+
+
+def test_mapping_to_missing_column_raises():
+    sdf = _recording()
+    sdf.column_metadata.set_attr("ghost", unit="N")
+    with pytest.raises(KeyError, match="ghost"):
+        sdf.convert({"force": "kN", "ghost": "kN"}, inplace=True)
+    assert sdf.df["force"].tolist() == [1000, 2000, 3000, 4000]     # nichts umgerechnet
+    assert sdf.column_units["force"] == "N"
+
+
+@pytest.mark.parametrize("storage", ["pandas", "arrow"])
+def test_columns_match_scalar_convert_exactly(storage):
+    if storage == "arrow":
+        pytest.importorskip("pyarrow")
+    values = np.random.default_rng(7).uniform(-1e4, 1e4, 8000)
+    values[:3] = [9.0, 13.0, 18.0]
+    df = pd.DataFrame({"force": values, "temp": values, "stress": values,
+                       "count": np.arange(8000)})
+    sdf = DataFrame(name="rec", df=df, storage=storage)
+    for col, unit in (("force", "N"), ("temp", "K"), ("stress", "MPa"), ("count", "N")):
+        sdf.set_column(col, unit=unit)
+    conv = sdf.convert({"force": "kN", "temp": "degC", "count": "kN"})
+    assert conv.df["force"].tolist() == [units.convert(v, "N", "kN") for v in values]
+    assert conv.df["temp"].tolist() == [units.convert(v, "K", "degC") for v in values]
+    assert conv.df["count"].tolist() == [units.convert(v, "N", "kN") for v in range(8000)]
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    conv = sdf.convert(system)
+    assert conv.df["stress"].tolist() == [system.convert_value(v, "MPa")[0] for v in values]
+
+
+def test_arrow_storage_converts_the_table():
+    pytest.importorskip("pyarrow")
+    sdf = _recording(storage="arrow")
+    sdf.convert(["kN", "mm", "ms"], inplace=True)
+    assert sdf._df is None                          # keine pandas-Sicht erzeugt
+    table = sdf.to_arrow()
+    assert table.column("force").to_pylist() == [1.0, 2.0, 3.0, 4.0]
+    assert table.schema.field("force").metadata[b"unit"] == b"kN"
+    assert sdf.df["note"].tolist() == list("abcd")
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Hive-partitionierte Parquet-Datasets: to_dataset / from_dataset mit Pruning."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def _campaign():
+    df = pd.DataFrame({"specimen": ["S1", "S1", "S2", "S2", "S3", "S3"],
+                       "day": [1, 1, 1, 2, 2, 3],
+                       "force": np.arange(6, dtype="float64"),
+                       "disp": np.arange(6, dtype="float64") / 10})
+    sdf = DataFrame(name="campaign", df=df)
+    sdf.set_column("force", unit="kN", label="Kraft")
+    sdf.metadata.add("lab", "L1")
+    return sdf
+
+
+def _files(root):
+    return sorted(os.path.relpath(os.path.join(folder, name), root)
+                  for folder, _, names in os.walk(root) for name in names)
+
+
+def test_layout_and_roundtrip(tmp_path):
+    root = str(tmp_path / "ds")
+    assert _campaign().to_dataset(root, partition_cols=["specimen", "day"]) == root
+    files = _files(root)
+    assert "_common_metadata" in files
+    assert sum(f.startswith(os.path.join("specimen=S2", "day=2")) for f in files) == 1
+    for name in files:                         # ein Row-Group je Datei, nicht je Batch
+        if name.endswith(".parquet"):
+            assert pq.read_metadata(os.path.join(root, name)).num_row_groups == 1
+    for storage in ("pandas", "arrow"):
+        back = DataFrame.from_dataset(root, storage=storage)
+        assert back.name == "campaign" and back.metadata.get("lab").value == "L1"
+        assert back.get_column("force").unit == "kN"
+        assert list(back.columns) == ["specimen", "day", "force", "disp"]
+        df = back.df.sort_values("force").reset_index(drop=True)
+        assert df["day"].dtype == "int64"                  # Typ aus _common_metadata
+        assert df["specimen"].tolist() == ["S1", "S1", "S2", "S2", "S3", "S3"]
+        assert df["force"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_partition_filter_prunes_files(tmp_path):
+    root = str(tmp_path / "ds")
+    _campaign().to_dataset(root, partition_cols=["specimen"])
+    for name in _files(root):                  # andere Partitionen unlesbar machen
+        if name.startswith("specimen=S1") or name.startswith("specimen=S3"):
+            with open(os.path.join(root, name), "wb") as fh:
+                fh.write(b"not parquet")
+    back = DataFrame.from_dataset(root, filters=[("specimen", "=", "S2")],
+                                  columns=["specimen", "force"])
+    assert back.df["force"].tolist() == [2.0, 3.0]
+    assert set(back.column_metadata.keys()) == {"specimen", "force"}
+    with pytest.raises(Exception):
+        DataFrame.from_dataset(root)
+
+
+def test_value_filter_and_expression(tmp_path):
+    import pyarrow.dataset as ds
+    root = str(tmp_path / "ds")
+    _campaign().to_dataset(root, partition_cols=["day"])
+    back = DataFrame.from_dataset(root, filters=(ds.field("day") >= 2) & (ds.field("force") < 5))
+    assert sorted(back.df["force"].tolist()) == [3.0, 4.0]
+
+
+def test_append_and_without_common_metadata(tmp_path):
+    root = str(tmp_path / "ds")
+    _campaign().to_dataset(root, partition_cols=["specimen"])
+    _campaign().to_dataset(root, partition_cols=["specimen"])
+    assert len(DataFrame.from_dataset(root)) == 12
+    _campaign().to_dataset(root, partition_cols=["specimen"],
+                           existing_data_behavior="delete_matching")
+    assert len(DataFrame.from_dataset(root)) == 6
+    os.remove(os.path.join(root, "_common_metadata"))
+    back = DataFrame.from_dataset(root, filters=[("specimen", "=", "S3")])
+    assert back.df["force"].tolist() == [4.0, 5.0]
+    assert back.metadata.get("lab").value == "L1"        # aus den Datei-Schemata
+
+
+def test_invalid_arguments(tmp_path):
+    sdf = _campaign()
+    with pytest.raises(ValueError, match="partition columns"):
+        sdf.to_dataset(str(tmp_path), partition_cols=[])
+    with pytest.raises(ValueError, match="missing"):
+        sdf.to_dataset(str(tmp_path), partition_cols=["ghost"])
+    with pytest.raises(FileNotFoundError):
+        DataFrame.from_dataset(str(tmp_path / "nope"))
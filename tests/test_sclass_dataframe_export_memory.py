@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Kopierfreier Export: to_parquet/to_dataframe verdoppeln den df nicht."""
+import io
+import logging
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def _sdf(n=500000):
+    df = pd.DataFrame({"force": np.linspace(0.0, 1.0, n), "disp": np.zeros(n)})
+    sdf = DataFrame(df=df, name="big")
+    sdf.set_column("force", unit="kN", label="Kraft")
+    return sdf
+
+
+def _peak_ratio(sdf, func):
+    nbytes = sdf.df.memory_usage(deep=True).sum()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / nbytes
+    finally:
+        tracemalloc.stop()
+
+
+def test_to_parquet_file_does_not_copy_df(tmp_path, caplog):
+    caplog.set_level(logging.WARNING)
+    sdf = _sdf()
+    assert _peak_ratio(sdf, lambda: sdf.to_parquet(path=str(tmp_path))) < 0.25
+
+
+def test_to_dataframe_is_lazy_copy_and_isolated():
+    sdf = _sdf()
+    assert _peak_ratio(sdf, sdf.to_dataframe) < 0.25
+    out = sdf.to_dataframe()
+    out.loc[0, "force"] = 99.0
+    assert sdf.df["force"].iloc[0] == 0.0
+    assert "_sdata" not in sdf.df.attrs
+
+
+def test_to_parquet_schema_carries_sdata_and_field_metadata():
+    sdf = _sdf(10)
+    data = sdf.to_parquet()
+    schema = pq.read_schema(io.BytesIO(data))
+    assert schema.field("force").metadata[b"unit"] == b"kN"
+    assert b"_sdata" not in schema.metadata
+    df = pd.read_parquet(io.BytesIO(data))
+    assert df.attrs["_sdata"]["column_metadata"]
+    back = DataFrame.from_parquet_bytes(data)
+    assert back.get_column("force").label == "Kraft"
+    pd.testing.assert_frame_equal(back.df, sdf.df)
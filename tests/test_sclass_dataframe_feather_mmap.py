@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Memory-mapped Feather: Öffnen ohne die Spaltendaten in den Speicher zu lesen."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.feather as feather
+
+from sdata.sclass.dataframe import DataFrame
+
+
+def _sdf(n=200000):
+    sdf = DataFrame(name="signals", df=pd.DataFrame({"t": np.arange(n) * 1e-3,
+                                                     "u": np.sin(np.arange(n) * 1e-2)}))
+    sdf.set_column("u", unit="V", label="Spannung")
+    return sdf
+
+
+def test_memory_map_writer_is_uncompressed(tmp_path):
+    sdf = _sdf(1000)
+    plain = sdf.to_feather()
+    mapped = sdf.to_feather(memory_map=True)
+    assert len(mapped) > len(plain)                 # lz4 (Default) vs. unkomprimiert
+    fp = sdf.to_feather(path=str(tmp_path), memory_map=True)
+    assert feather.read_table(fp).num_rows == 1000
+
+
+def test_memory_mapped_open_is_zero_copy(tmp_path):
+    fp = _sdf().to_feather(path=str(tmp_path), memory_map=True)
+    before = pa.total_allocated_bytes()
+    sdf = DataFrame.from_feather(fp, storage="arrow", memory_map=True)
+    assert pa.total_allocated_bytes() - before < 1 << 16
+    assert sdf.name == "signals"
+    assert sdf.get_column("u").label == "Spannung"
+    assert sdf.column_units["u"] == "V"
+    assert len(sdf) == 200000
+    assert sdf.df["t"].iloc[-1] == pytest.approx(199.999)
+
+
+def test_memory_map_with_compressed_file_and_pandas_storage(tmp_path):
+    src = _sdf(1000)
+    fp = src.to_feather(path=str(tmp_path))          # komprimiert: wird dekodiert
+    sdf = DataFrame.from_feather(fp, memory_map=True)
+    assert sdf.storage == "pandas"
+    pd.testing.assert_frame_equal(sdf.df, src.df)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """DataFrame nutzt den gemeinsamen Integritäts-Mixin (RFC 0004, Option B):
 sha1/md5/sha256/size + verify/update_checksum über content_bytes (Parquet)."""
+import hashlib
+
 import pandas as pd
 import pytest
 
@@ -35,3 +37,23 @@ def test_dataframe_verify_and_update_checksum():
     assert sdf.verify() is True                     # passt (Parquet deterministisch je Objekt)
     sdf.df = pd.DataFrame({"weight": [9]})          # Daten ändern -> anderer Hash
     assert sdf.verify() is False
+
+
+@pytest.mark.parametrize("storage", ["pandas", "arrow"])
+def test_content_bytes_keep_own_df_attrs(storage):
+    df = _df()
+    df.attrs = {"foo": 1, "source": "rig 3"}
+    sdf = DataFrame(df=df, name="x", storage=storage)
+    expected = sdf.df.to_parquet()                  # wie content_bytes vor dem Memo
+    assert sdf.content_bytes == expected
+    assert sdf.sha256 == hashlib.sha256(expected).hexdigest()
+    back = DataFrame.from_parquet_bytes(sdf.to_parquet())
+    assert back.df.attrs["foo"] == 1 and back.df.attrs["source"] == "rig 3"
+
+
+def test_df_attrs_edit_reencodes():
+    sdf = DataFrame(df=_df(), name="x")
+    before = sdf.content_bytes
+    sdf.df.attrs["foo"] = 1
+    assert sdf.content_bytes != before
+    assert sdf.content_bytes == sdf.df.to_parquet()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Serialisierungs-Memo: eine Kodierung je Datenversion für alle Exporte."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from sdata.sclass.dataframe import DataFrame, _copy_on_write
+
+
+def _sdf():
+    sdf = DataFrame(name="memo", df=pd.DataFrame({"x": np.arange(50, dtype="float64"),
+                                                  "y": np.arange(50) * 2.0}))
+    sdf.set_column("x", unit="mm")
+    return sdf
+
+
+def _count_encodings(sdf, monkeypatch):
+    """Zählt die Kodierungen der Spaltendaten (``pq.write_table``)."""
+    calls = []
+    original = pq.write_table
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(pq, "write_table", counting)
+    return calls
+
+
+SHARED = DataFrame.PARQUET_COMPRESSION
+
+
+def test_save_cycle_encodes_once(monkeypatch, tmp_path):
+    sdf = _sdf()
+    calls = _count_encodings(sdf, monkeypatch)
+    first = sdf.content_bytes
+    sdf.update_checksum()
+    sdf.to_dict()
+    assert sdf.content_bytes is first
+    blob = sdf.to_parquet(compression=SHARED)
+    assert sdf.to_parquet(compression=SHARED) is blob
+    filepath = sdf.to_parquet(path=str(tmp_path), compression=SHARED)
+    assert len(calls) == 1
+    with open(filepath, "rb") as fh:
+        assert fh.read() == blob
+    start = len(first) - 8 - int.from_bytes(first[-8:-4], "little")
+    assert blob[:start] == first[:start]        # dieselben Spaltenblöcke
+    back = DataFrame.from_parquet(filepath)
+    assert back.df["x"].tolist() == sdf.df["x"].tolist()
+    assert back.get_column("x").unit == "mm" and back.verify()
+
+
+def test_file_write_fills_the_memo(monkeypatch, tmp_path):
+    sdf = _sdf()
+    calls = _count_encodings(sdf, monkeypatch)
+    sdf.to_parquet(path=str(tmp_path), compression=SHARED)
+    sdf.content_bytes
+    sdf.to_parquet(compression=SHARED)
+    assert len(calls) == 1
+
+
+def test_default_compression_is_zstd(monkeypatch, tmp_path):
+    sdf = _sdf()
+    calls = _count_encodings(sdf, monkeypatch)
+    blob = sdf.to_parquet()
+    assert pq.read_metadata(pa.BufferReader(blob)).row_group(0).column(0).compression == "ZSTD"
+    filepath = sdf.to_parquet(path=str(tmp_path))        # aus dem Memo
+    with open(filepath, "rb") as fh:
+        assert fh.read() == blob
+    sdf.content_bytes                                    # eigene (snappy) Kodierung
+    assert len(calls) == 2
+
+
+def test_reads_keep_the_memo():
+    sdf = _sdf()
+    content = sdf.content_bytes
+    version = sdf.data_version
+    for _ in range(3):
+        sdf.df["x"].sum()
+        sdf.df.head()
+    assert sdf.content_bytes is content
+    if _copy_on_write():
+        assert sdf.data_version == version
+
+
+def test_changes_invalidate(monkeypatch):
+    sdf = _sdf()
+    calls = _count_encodings(sdf, monkeypatch)
+    before = sdf.content_bytes
+    version = sdf.data_version
+    sdf.df = sdf.df.assign(y=0.0)
+    assert sdf.data_version > version
+    assert sdf.content_bytes != before and len(calls) == 2
+    df = sdf.df
+    version = sdf.data_version
+    df.loc[0, "x"] = 99.0                       # In-place-Änderung der herausgegebenen Sicht
+    assert DataFrame.from_parquet_bytes(sdf.content_bytes).df.loc[0, "x"] == 99.0
+    assert sdf.data_version > version
+    sdf.df["z"] = 1.0
+    assert "z" in DataFrame.from_parquet_bytes(sdf.to_parquet()).df
+    version = sdf.data_version
+    sdf.touch()
+    assert sdf.data_version == version + 1 and sdf._memo == {}
+
+
+def test_convert_bumps_version():
+    sdf = _sdf()
+    version = sdf.data_version
+    before = sdf.content_bytes
+    sdf.convert({"x": "m"}, inplace=True)
+    assert sdf.data_version > version
+    assert sdf.content_bytes != before
+
+
+def test_metadata_change_reencodes_file_exports_only():
+    sdf = _sdf()
+    content = sdf.content_bytes
+    parquet = sdf.to_parquet()
+    sdf.metadata.add("operator", "kd")
+    assert sdf.content_bytes is content
+    changed = sdf.to_parquet()
+    assert changed != parquet
+    assert DataFrame.from_parquet_bytes(changed).metadata.get("operator").value == "kd"
+    sdf.set_column("y", unit="N")
+    assert DataFrame.from_parquet_bytes(sdf.to_parquet()).get_column("y").unit == "N"
+
+
+def test_memo_can_be_disabled(monkeypatch):
+    sdf = _sdf()
+    calls = _count_encodings(sdf, monkeypatch)
+    monkeypatch.setattr(DataFrame, "MEMO_SERIALIZATION", False)
+    sdf.content_bytes
+    sdf.content_bytes
+    assert len(calls) == 2 and sdf._memo == {}
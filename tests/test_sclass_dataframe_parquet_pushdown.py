@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""from_parquet: Spaltenprojektion und Prädikat-Pushdown (Row-Group-Statistiken)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.compute as pc
+
+from sdata.sclass.dataframe import DataFrame
+
+
+@pytest.fixture
+def recording(tmp_path):
+    sdf = DataFrame(name="rec", df=pd.DataFrame(
+        {c: pd.Series(dtype="float64") for c in ("time", "ch1", "ch2", "ch3")}))
+    sdf.set_column("ch1", unit="kN", label="Kraft")
+    sdf.set_column("ch3", unit="mm")
+    with sdf.open_parquet_writer(path=str(tmp_path)) as writer:
+        for i in range(10):
+            t = np.arange(100) + 100.0 * i
+            writer.write_batch(pd.DataFrame({"time": t, "ch1": t * 2, "ch2": -t, "ch3": t / 2}))
+    return writer.filepath
+
+
+@pytest.mark.parametrize("storage", ["pandas", "arrow"])
+def test_columns_and_filters(recording, storage):
+    sdf = DataFrame.from_parquet(recording, storage=storage, columns=["time", "ch1"],
+                                 filters=[("time", ">=", 250.0), ("time", "<", 300.0)])
+    assert sdf.storage == storage
+    assert list(sdf.columns) == ["time", "ch1"]
+    assert sdf.df["time"].tolist() == [float(t) for t in range(250, 300)]
+    assert sorted(sdf.column_metadata.keys()) == ["ch1", "time"]
+    assert sdf.get_column("ch1").label == "Kraft"
+    assert sdf.name == "rec"
+
+
+def test_expression_filter_without_projection(recording):
+    sdf = DataFrame.from_parquet(recording, filters=pc.field("ch2") > -5.0)
+    assert len(sdf) == 5
+    assert sorted(sdf.column_metadata.keys()) == ["ch1", "ch2", "ch3", "time"]
+
+
+def test_projection_keeps_stored_index(tmp_path):
+    df = pd.DataFrame({"t": [0.5, 1.5], "a": [1.0, 2.0], "b": [3.0, 4.0]}).set_index("t")
+    fp = DataFrame(name="i", df=df).to_parquet(path=str(tmp_path))
+    for storage in ("pandas", "arrow"):
+        sdf = DataFrame.from_parquet(fp, storage=storage, columns=["b"])
+        assert list(sdf.columns) == ["b"]
+        assert sdf.df.index.tolist() == [0.5, 1.5]
+        assert list(sdf.column_metadata.keys()) == ["b"]
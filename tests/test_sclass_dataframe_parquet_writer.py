@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Streaming-Parquet-Writer: ein Row-Group je Batch, Metadaten im Footer."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from sdata.schema import AttrSpec, TableSchema
+from sdata.sclass.dataframe import DataFrame, ParquetBatchWriter
+
+
+def _declared():
+    sdf = DataFrame(name="rig", df=pd.DataFrame({"time": pd.Series(dtype="float64"),
+                                                 "force": pd.Series(dtype="float64")}))
+    sdf.set_column("force", unit="kN", label="Kraft")
+    return sdf
+
+
+def _chunk(i, n=100):
+    return pd.DataFrame({"time": np.arange(n) + i * n, "force": np.full(n, float(i))},
+                        dtype="float64")
+
+
+def test_batches_become_row_groups_with_footer_metadata(tmp_path):
+    sdf = _declared()
+    with sdf.open_parquet_writer(path=str(tmp_path)) as writer:
+        assert isinstance(writer, ParquetBatchWriter)
+        for i in range(4):
+            assert writer.write_batch(_chunk(i)) == 100
+        sdf.metadata.add("rows", 400)          # Stand beim Schließen zählt
+    assert writer.closed and writer.rows == 400 and writer.batches == 4
+    assert pq.read_metadata(writer.filepath).num_row_groups == 4
+    for storage in ("pandas", "arrow"):
+        back = DataFrame.from_parquet(writer.filepath, storage=storage)
+        assert back.name == "rig"
+        assert back.metadata.get("rows").value == 400
+        assert back.get_column("force").label == "Kraft"
+        assert list(back.columns) == ["time", "force"]
+        assert back.df["force"].tolist() == [float(i) for i in range(4) for _ in range(100)]
+    schema = pq.read_schema(writer.filepath)
+    assert schema.field("force").metadata[b"unit"] == b"kN"
+
+
+def test_accepts_arrow_batches_and_reorders_columns(tmp_path):
+    writer = _declared().open_parquet_writer(filename=str(tmp_path / "x.spq"))
+    writer.write_batch(pa.record_batch({"force": [1.0], "time": [0.0]}))
+    writer.write_batch(pa.table({"time": [1], "force": [2]}))   # int -> double gecastet
+    path = writer.close()
+    assert pq.read_table(path).column_names == ["time", "force"]
+    assert DataFrame.from_parquet(path).df["force"].tolist() == [1.0, 2.0]
+
+
+def test_rejects_mismatching_batches(tmp_path):
+    writer = _declared().open_parquet_writer(path=str(tmp_path))
+    with pytest.raises(ValueError, match="missing columns"):
+        writer.write_batch(pd.DataFrame({"time": [0.0]}))
+    with pytest.raises(ValueError, match="unexpected columns"):
+        writer.write_batch(_chunk(0).assign(extra=1))
+    writer.write_batch(_chunk(0))
+    with pytest.raises(ValueError, match="types do not match"):
+        writer.write_batch(pd.DataFrame({"time": ["a"], "force": ["b"]}))
+    writer.close()
+    with pytest.raises(ValueError, match="closed"):
+        writer.write_batch(_chunk(1))
+
+
+def test_table_schema_is_checked(tmp_path):
+    schema = TableSchema("rig", [AttrSpec("time", dtype="float"),
+                                 AttrSpec("force", dtype="float", unit="N")])
+    writer = _declared().open_parquet_writer(path=str(tmp_path), schema=schema)
+    with pytest.raises(ValueError, match="unit_errors=\\['force'\\]"):
+        writer.write_batch(_chunk(0))
+    writer.close()
+
+
+def test_without_batches_and_without_target(tmp_path):
+    sdf = _declared()
+    with pytest.raises(ValueError):
+        sdf.open_parquet_writer()
+    path = sdf.open_parquet_writer(path=str(tmp_path)).close()
+    back = DataFrame.from_parquet(path)
+    assert len(back) == 0 and back.name == "rig"
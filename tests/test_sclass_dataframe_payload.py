@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""to_dict/from_dict mit inhaltsadressierten Payload-Referenzen statt base64-Parquet."""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from sdata.payload import PayloadStore, fetch, make_ref
+from sdata.sclass.dataframe import DataFrame
+
+
+def _sdf():
+    sdf = DataFrame(name="rec", df=pd.DataFrame({"t": np.arange(1000.0), "f": np.ones(1000)}))
+    sdf.set_column("f", unit="kN")
+    return sdf
+
+
+def test_payload_store_roundtrip_and_dedup(tmp_path):
+    store = PayloadStore(tmp_path)
+    ref = make_ref(store, b"abc", "raw")
+    assert ref == {"sha256": ref["sha256"], "size": 3, "format": "raw"}
+    assert ref["sha256"] in store
+    assert make_ref(str(tmp_path), b"abc", "raw") == ref          # Pfad statt Store
+    assert len(os.listdir(tmp_path / ref["sha256"][:2])) == 1
+    assert fetch(store, ref) == b"abc"
+    with pytest.raises(KeyError):
+        store.get("0" * 64)
+    with open(store.path(ref["sha256"]), "wb") as fh:
+        fh.write(b"abd")
+    with pytest.raises(ValueError):
+        fetch(store, ref)
+
+
+def test_to_dict_with_store_emits_reference(tmp_path):
+    sdf = _sdf()
+    d = sdf.to_dict(store=tmp_path)
+    assert "parquet_bytes" not in d["data"]
+    ref = d["data"]["parquet_ref"]
+    assert ref["sha256"] == sdf.sha256 and ref["format"] == "parquet"
+    assert len(json.dumps(d)) < len(json.dumps(sdf.to_dict())) / 2
+
+
+@pytest.mark.parametrize("storage", ["pandas", "arrow"])
+def test_from_dict_resolves_lazily(tmp_path, storage):
+    src = _sdf()
+    d = src.to_dict(store=tmp_path)
+    sdf = DataFrame.from_dict(d, store=tmp_path, storage=storage)
+    assert sdf.payload_ref == d["data"]["parquet_ref"]
+    assert sdf.name == "rec" and sdf.get_column("f").unit == "kN"
+    assert sdf.sha256 == src.sha256                  # Prüfsumme ohne Dekodieren
+    assert sdf.column_units == {"f": "kN", "t": "-"}  # Metadaten-Scan ohne Laden
+    assert sdf.payload_ref is not None
+    assert sdf.shape == (1000, 2)
+    assert sdf.payload_ref is None
+    pd.testing.assert_frame_equal(sdf.df, src.df)
+    assert sdf.get_column("f").unit == "kN"
+
+
+def test_class_default_store_and_missing_store(tmp_path, monkeypatch):
+    d = _sdf().to_dict(store=tmp_path)
+    with pytest.raises(ValueError, match="needs a store"):
+        DataFrame.from_dict(d)
+    monkeypatch.setattr(DataFrame, "PAYLOAD_STORE", str(tmp_path))
+    sdf = DataFrame.from_dict(d)
+    assert DataFrame.from_dict(sdf.to_dict()).payload_ref == d["data"]["parquet_ref"]
+    assert len(sdf) == 1000
+
+
+def test_pending_payload_reembeds_without_store(tmp_path):
+    src = _sdf()
+    sdf = DataFrame.from_dict(src.to_dict(store=tmp_path), store=tmp_path)
+    d = sdf.to_dict()
+    assert "parquet_bytes" in d["data"]
+    pd.testing.assert_frame_equal(DataFrame.from_dict(d).df, src.df)
+
+
+def test_corrupt_payload_raises_on_access(tmp_path):
+    d = _sdf().to_dict(store=tmp_path)
+    store = PayloadStore(tmp_path)
+    with open(store.path(d["data"]["parquet_ref"]["sha256"]), "wb") as fh:
+        fh.write(b"garbage")
+    sdf = DataFrame.from_dict(d, store=store)
+    with pytest.raises(ValueError, match="corrupt"):
+        sdf.df
+    assert sdf.payload_ref is not None
+
+
+def test_to_dict_does_not_leak_payload_into_data(tmp_path):
+    sdf = _sdf()
+    sdf.to_dict()
+    assert "parquet_bytes" not in sdf.data
+    assert "parquet_bytes" not in sdf.to_dict(store=tmp_path)["data"]
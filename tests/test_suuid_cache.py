@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Memoisierte SUUID-Ableitung, gecachte Komponenten und ``SUUID.from_names``."""
+import pickle
+import uuid
+
+import pytest
+from suuid import OID_NAMESPACE, SUUID as CoreSUUID
+
+from sdata.base import Base
+from sdata.suuid import SUUID
+
+NAMES = ["otto", "Grüße  X.1", "1.50mm ENAW5754", "otto", "", "a" * 300]
+
+
+def test_from_name_is_memoised_and_unchanged():
+    sid = SUUID.from_name("DATA", "otto")
+    assert SUUID.from_name("DATA", "otto") is sid
+    assert sid.huuid == "96da1780e6225b33b9186e41838d2e2c"
+    assert SUUID.from_name("DATA", "otto", ns_name="project_xy").huuid == \
+        "903649d7c1f9529f9c4ba45eb79751f4"
+    assert SUUID.from_name("DATA", "otto", ns_name="") is sid
+
+
+def test_from_name_cache_keeps_subclass():
+    class Sub(SUUID):
+        pass
+
+    assert type(Sub.from_name("DATA", "otto")) is Sub
+    assert type(SUUID.from_name("DATA", "otto")) is SUUID
+
+
+@pytest.mark.parametrize("ns_name", [None, "", "project_xy", "Data__parent__" + "0" * 32,
+                                     OID_NAMESPACE, uuid.UUID(int=7)])
+def test_from_names_matches_from_name(ns_name):
+    sids = SUUID.from_names("Data", NAMES, ns_name=ns_name)
+    assert len(sids) == len(NAMES)
+    for name, sid in zip(NAMES, sids):
+        ref = CoreSUUID.from_name("Data", name, ns=ns_name or OID_NAMESPACE)
+        assert sid == SUUID._from_name("Data", name, ns_name) and sid.sname == ref.sname
+        assert sid.namespace == ref.namespace and sid.mode == "name"
+        assert isinstance(sid, SUUID)
+    assert sids[0] is sids[3]
+    assert sids == [SUUID.from_name("Data", name, ns_name) for name in NAMES]
+
+
+def test_from_suuid_sname_memoised():
+    sname = SUUID.from_name("DATA", "otto").sname
+    sid = SUUID.from_suuid_sname(sname)
+    assert SUUID.from_suuid_sname(sname) is sid
+    assert sid.sname == sname and sid == SUUID.from_name("DATA", "otto")
+    assert SUUID.from_suuid_sname("no_sname") is None
+    assert SUUID.from_suuid_sname(None) is None
+    with pytest.raises(ValueError):
+        SUUID.from_suuid_sname("no_sname", strict=True)
+
+
+def test_components_cached_on_object():
+    sid = SUUID(class_name="Data", name="x", huuid="1234567890abcdef1234567890abcdef")
+    ref = CoreSUUID(class_name="Data", name="x", huuid="1234567890abcdef1234567890abcdef")
+    assert sid.sname == ref.sname and sid.suuid_str == ref.compact_token
+    assert sid.uuid is sid.uuid and sid.get_uuid() is sid.uuid
+    assert "sname" in sid.__dict__ and "compact_token" in sid.__dict__
+    clone = pickle.loads(pickle.dumps(sid))
+    assert clone == sid and clone.sname == sid.sname and hash(clone) == hash(sid)
+
+
+def test_create_many_uses_batch_derivation():
+    project = Base(name="project")
+    objs = Base.create_many(["a", "b", {"name": "c"}], project=project)
+    for obj in objs:
+        assert obj.sname == Base(name=obj.name, project=project).sname
+    assert Base.create_many(["a"])[0].sname == Base(name="a").sname
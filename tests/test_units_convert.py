@@ -184,3 +184,57 @@ def test_solve_linear_helper():
     assert units._solve_linear([[1, 0], [0, 0]], [5, 0]) == [Fraction(5), Fraction(0)]
     # widersprüchlich -> None
     assert units._solve_linear([[1], [0]], [1, 7]) is None
+
+
+def test_unit_system_memoises_resolved_dimensions(monkeypatch):
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    calls = []
+    solve = system._solve
+    monkeypatch.setattr(system, "_solve", lambda dim: calls.append(dim) or solve(dim))
+    for _ in range(3):
+        assert system.target_for("MPa") == "GPa"
+        assert system.unit_for("pressure") == "GPa"
+        assert system.convert_value(2000.0, "MPa") == (2.0, "GPa")
+    assert calls == [(-1, 1, -2, 0)]
+
+
+def test_unit_system_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(units.UnitSystem, "CACHE_SIZE", 2)
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    for symbol in ("N", "MPa", "J", "N"):
+        system.target_for(symbol)
+    assert list(system._targets) == ["J", "N"]
+    monkeypatch.setattr(units.UnitSystem, "CACHE_SIZE", 0)
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    assert system.target_for("N") == "kN" and not system._targets
+
+
+def test_unit_system_cache_invalidated_when_units_change():
+    system = units.UnitSystem(["kN", "mm", "ms"])
+    assert system.target_for("MPa") == "GPa"
+    system.units = ["N", "mm", "s"]
+    assert system.target_for("MPa") == "MPa"
+    assert system.convert_value(1.0, "kN") == (1000.0, "N")
+    assert repr(system) == "UnitSystem(['N', 'mm', 's'])"
+    with pytest.raises(units.UnitConversionError):
+        system.units = ["N", "degC"]
+    assert system.units == ["N", "mm", "s"]          # unverändert nach Fehler
+
+
+def test_scalar_convert_uses_cached_pair(monkeypatch):
+    units._pair.cache_clear()
+    assert units.convert(5000, "N", "kN") == 5.0
+    assert units.convert(25, "degC", "K") == 298.15
+    with pytest.raises(units.UnitConversionError):
+        units.convert(1, "mm", "kN")
+    assert units._pair.cache_info().currsize == 2                # keine Fehlerpaare
+    monkeypatch.setattr(units, "_entry", lambda *a: pytest.fail("looked up again"))
+    assert units.convert([1000, 2000], "N", "kN") == [1.0, 2.0]
+
+
+def test_pair_cache_is_bounded():
+    units._pair.cache_clear()
+    for spelling in ("s", "sec"):
+        units.convert(1, spelling, "ms")
+    info = units._pair.cache_info()
+    assert info.maxsize == 1024 and info.currsize == 2